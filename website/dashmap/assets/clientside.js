@@ -0,0 +1,107 @@
+/*
+ * Clientside callbacks of the pure UI state toggles.
+ * Registered in Python with app.clientside_callback and ClientsideFunction(namespace, function_name),
+ * they run in the browser and cost no server request.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    accordions: {
+        /*
+         * Toggles the clicked group of an accordion and closes the other groups.
+         * Arguments: n_clicks of the group toggles, then is_open of the group collapses, in group order.
+         * Returns: is_open of every group collapse.
+         */
+        toggle: function () {
+            const args = Array.prototype.slice.call(arguments);
+            const groups = args.length / 2;
+            const isOpen = new Array(groups).fill(false);
+
+            const triggered = window.dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length || !triggered[0].value) {
+                return isOpen;
+            }
+
+            // Toggle ids end with -group-<n>-toggle, groups are numbered from 1
+            const match = triggered[0].prop_id.match(/-group-(\d+)-toggle\./);
+            if (match) {
+                const index = parseInt(match[1], 10) - 1;
+                isOpen[index] = !args[groups + index];
+            }
+            return isOpen;
+        },
+    },
+
+    tabs: {
+        /*
+         * Requests the content of an activated tab the first time it is shown.
+         * Arguments: active_tab of the tabs, the tabs already loaded.
+         * Returns: the tab to load, or no update when its content is in the page.
+         */
+        request: function (activeTab, loaded) {
+            if (!activeTab || (loaded || []).indexOf(activeTab) !== -1) {
+                return window.dash_clientside.no_update;
+            }
+            return activeTab;
+        },
+    },
+
+    panels: {
+        /*
+         * Requests the background panels of the clicked area whose accordion group is open.
+         * Arguments: the area summary, is_open of the accordion collapses and the last request of every panel.
+         * Returns: the request of every panel, no update for panels that are hidden or show the area.
+         */
+        request: function (area, isOpen, requests) {
+            const noUpdate = window.dash_clientside.no_update;
+            const collapses = window.dash_clientside.callback_context.inputs_list[1] || [];
+            const open = {};
+            collapses.forEach(function (collapse, i) {
+                open[collapse.id.index] = isOpen[i];
+            });
+
+            return requests.map(function (request) {
+                if (!area || !request || !open[request.collapse] || request.postal_code === area.postal_code) {
+                    return noUpdate;
+                }
+                return Object.assign({}, request, {postal_code: area.postal_code});
+            });
+        },
+    },
+
+    graphs: {
+        /*
+         * Visible range and plotted width of a graph, so that the server sends one point per pixel.
+         * A relayout without x axis keys, e.g. a y only zoom or a dragmode change, keeps the x window
+         * of the previous view, and is no update at all unless the width changed.
+         * Arguments: relayoutData of the graph, id of the graph, the previous view.
+         * Returns: the x axis relayoutData and the width in pixels, null before the graph is drawn.
+         */
+        view: function (relayoutData, graphId, previous) {
+            const element = typeof document !== 'undefined' ? document.getElementById(graphId) : null;
+            const width = element ? element.clientWidth || null : null;
+
+            const xKeys = Object.keys(relayoutData || {}).some(function (key) {
+                return key.indexOf('xaxis.range') === 0 || key === 'xaxis.autorange';
+            });
+            if (relayoutData && !xKeys) {
+                if (previous && previous.width === width) {
+                    return window.dash_clientside.no_update;
+                }
+                return {relayout: previous ? previous.relayout : null, width: width};
+            }
+            return {relayout: relayoutData || null, width: width};
+        },
+    },
+
+    modal: {
+        /*
+         * Opens or closes a modal when one of its buttons was clicked.
+         * Arguments: n_clicks of the open and close buttons, is_open of the modal.
+         */
+        toggle: function (openClicks, closeClicks, isOpen) {
+            if (openClicks || closeClicks) {
+                return !isOpen;
+            }
+            return isOpen;
+        },
+    },
+});
@@ -0,0 +1,24 @@
+import dash
+from dash.dependencies import ClientsideFunction, Input, Output, State
+
+from ...layouts.templates.templates import collapse_id
+
+
+def init_clientside_accordion(app: dash.Dash, prefix: str, groups: int) -> None:
+    """
+    Registers the toggle of an accordion as a clientside callback, see assets/clientside.js.
+    Clicking a group toggles it and closes the other groups, without a server request.
+    ---
+    Args:
+        app (dash.Dash): Dash application to which the callback is registered to.
+        prefix (str): id prefix of the accordion, f"{prefix}-group-{i}-toggle" and collapse_id(f"{prefix}-collapse-{i}")
+        groups (int): number of groups, numbered from 1
+
+    Returns: None
+    """
+    app.clientside_callback(
+        ClientsideFunction(namespace='accordions', function_name='toggle'),
+        [Output(collapse_id(f"{prefix}-collapse-{i}"), "is_open") for i in range(1, groups + 1)],
+        [Input(f"{prefix}-group-{i}-toggle", "n_clicks") for i in range(1, groups + 1)],
+        [State(collapse_id(f"{prefix}-collapse-{i}"), "is_open") for i in range(1, groups + 1)],
+    )
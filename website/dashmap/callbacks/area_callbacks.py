@@ -0,0 +1,214 @@
+from typing import Dict, Iterable, Optional
+
+import dash
+from dash.dependencies import ALL, Input, Output, State
+
+from .util.area import AreaSnapshot, build_area
+from .util.bundle import PANEL_BUNDLE
+from .util.cache import LRUCache
+from .util.helpers import get_postal_code
+from .util.patch import patch_children
+from ..layouts.templates.templates import ACCORDION_COLLAPSE, AREA_SECTION
+from .tab_census.census_callbacks import CENSUS_DATASETS, CENSUS_SECTIONS
+from .tab_real_estate.real_estate_callbacks import REAL_ESTATE_DATASETS, REAL_ESTATE_SECTIONS
+from .tab_services.services_callbacks import SERVICES_DATASETS, SERVICES_SECTIONS
+from .tab_mobility.mobility_callbacks import MOBILITY_DATASETS, MOBILITY_SECTIONS
+from ..snapshot import current_snapshot
+
+# Every section rendered for the clicked postal area, by container id
+AREA_SECTIONS = {
+    **CENSUS_SECTIONS,
+    **REAL_ESTATE_SECTIONS,
+    **SERVICES_SECTIONS,
+    **MOBILITY_SECTIONS,
+}
+
+# Tab of every section, by tab_id of the dbc.Tabs
+SECTION_TABS = {
+    **{section_id: 'census' for section_id in CENSUS_SECTIONS},
+    **{section_id: 'real-estate' for section_id in REAL_ESTATE_SECTIONS},
+    **{section_id: 'services' for section_id in SERVICES_SECTIONS},
+    **{section_id: 'mobility' for section_id in MOBILITY_SECTIONS},
+}
+
+# Datasets read by every section, a section stays valid while they are unchanged
+SECTION_DATASETS = {
+    **{section_id: CENSUS_DATASETS for section_id in CENSUS_SECTIONS},
+    **{section_id: REAL_ESTATE_DATASETS for section_id in REAL_ESTATE_SECTIONS},
+    **{section_id: SERVICES_DATASETS for section_id in SERVICES_SECTIONS},
+    **{section_id: MOBILITY_DATASETS for section_id in MOBILITY_SECTIONS},
+}
+
+# Accordion collapse containing every section
+SECTION_COLLAPSES = {
+    'id_age_dist_hist': 'tab-1-collapse-1',
+    'id_gender_pie_chart': 'tab-1-collapse-2',
+    'id_education_pie_chart': 'tab-1-collapse-3',
+    'id_income_pie_chart': 'tab-1-collapse-4',
+    'id_employment_pie_chart': 'tab-1-collapse-5',
+    'id_household_size': 'tab-1-2-collapse-1',
+    'id_household_structure': 'tab-1-2-collapse-2',
+    'id_household_income': 'tab-1-2-collapse-3',
+    'id_household_dwellings': 'tab-1-2-collapse-4',
+    'id_re_owning': 'tab-2-collapse-1',
+    'id_re_renting': 'tab-2-collapse-2',
+    'id_re_sauna': 'tab-2-collapse-3',
+    'id_services_industries': 'tab-3-collapse-1',
+    'id_workplaces': 'tab-3-collapse-2',
+    'id_mobility_index': 'tab-4-collapse-1',
+}
+
+# Rendered sections by (postal code, section id, version of the datasets of the section).
+# Sections of replaced data are never requested again and leave the cache by eviction.
+SECTION_CACHE = LRUCache()
+
+
+def render_section(area: AreaSnapshot, section_id: str) -> list:
+    """
+    Children of a section of an area, from the section cache if it was rendered before.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+        section_id (str): key of AREA_SECTIONS
+
+    Returns:
+        children (list): JSON form of the html components to be displayed.
+    """
+    render = AREA_SECTIONS[section_id]
+    version = area.version(*SECTION_DATASETS[section_id])
+    return SECTION_CACHE.get_or_render((area.postal_code, section_id, version), lambda: render(area))
+
+
+def visible_sections(active_tab: Optional[str], is_open: Dict[str, bool]) -> set:
+    """
+    Sections in an open accordion group of the active tab.
+    ---
+    Args:
+        active_tab (str): tab_id of the active tab
+        is_open (dict): is_open of the accordion collapses in the page, by collapse
+
+    Returns:
+        (set): section ids
+    """
+    return {
+        section_id for section_id, collapse in SECTION_COLLAPSES.items()
+        if is_open.get(collapse) and SECTION_TABS[section_id] == active_tab
+    }
+
+
+def section_children(area: AreaSnapshot, section_ids: Iterable[str]) -> dict:
+    """
+    Children of sections of an area, prerendered if the panel bundle has them and rendered otherwise.
+    ---
+    Args:
+        area (AreaSnapshot): postal area
+        section_ids (Iterable): keys of AREA_SECTIONS
+
+    Returns:
+        (dict): JSON form of the children by section id
+    """
+    section_ids = list(section_ids)
+    prerendered = PANEL_BUNDLE.sections(area) if section_ids else {}
+    return {
+        section_id: prerendered[section_id] if section_id in prerendered else render_section(area, section_id)
+        for section_id in section_ids
+    }
+
+
+def shown_postal_code(area: AreaSnapshot, section_id: str, key: Optional[str]) -> Optional[str]:
+    """
+    Postal code of the area a section shows, None unless it was rendered from the data of area.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+        section_id (str): key of AREA_SECTIONS
+        key (str): AreaSnapshot.key the section was rendered for
+
+    Returns:
+        postal_code (str): shown postal area
+    """
+    suffix = f"-{area.version(*SECTION_DATASETS[section_id])}"
+    if key and key.endswith(suffix):
+        return key[:-len(suffix)]
+    return None
+
+
+def render_area(click_data: dict, visible: Optional[Iterable[str]] = None,
+                rendered: Optional[dict] = None) -> tuple:
+    """
+    Resolves the clicked postal area once and returns the visible sections that do not show it yet,
+    prerendered if the panel bundle has them and rendered otherwise.
+    A section showing another area of the same data gets a dash.Patch of the differences only.
+    Hidden sections are left as they are and rendered when they are opened.
+    ---
+    Args:
+        click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
+        visible (Iterable): ids of the sections on screen, all sections if None
+        rendered (dict): key of the area and the datasets of every section when it was last rendered, by section id
+
+    Returns:
+        summary, rendered, sections (dict, dict, list): area summary, updated keys of the rendered areas
+        and the children or a patch of every section of AREA_SECTIONS, dash.no_update for those left as they are
+    """
+    snapshot = current_snapshot()
+    area = build_area(snapshot, get_postal_code(click_data))
+    visible = set(AREA_SECTIONS if visible is None else visible)
+    rendered = dict(rendered or {})
+
+    stale = [
+        section_id for section_id in AREA_SECTIONS
+        if section_id in visible and rendered.get(section_id) != area.key(*SECTION_DATASETS[section_id])
+    ]
+    children = section_children(area, stale)
+
+    # Sections showing another area, by that area
+    shown = {}
+    for section_id in stale:
+        postal_code = shown_postal_code(area, section_id, rendered.get(section_id))
+        if postal_code in snapshot.datum.index:
+            shown.setdefault(postal_code, []).append(section_id)
+
+    previous = {}
+    for postal_code, section_ids in shown.items():
+        previous.update(section_children(build_area(snapshot, postal_code), section_ids))
+
+    sections = []
+    for section_id in AREA_SECTIONS:
+        if section_id not in stale:
+            sections.append(dash.no_update)
+            continue
+        if section_id in previous:
+            sections.append(patch_children(previous[section_id], children[section_id]))
+        else:
+            sections.append(children[section_id])
+        rendered[section_id] = area.key(*SECTION_DATASETS[section_id])
+    return area.summary(), rendered, sections
+
+
+def init_area_callbacks(app: dash.Dash) -> None:
+    """
+    Initializes the map click handler. A click, opening an accordion group or switching tabs
+    is one request that publishes the area summary to the area-snapshot store and returns the
+    sections on screen that do not show the clicked area yet.
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
+
+    Returns: None
+    """
+    # Sections and collapses are matched with ALL, only those of the tabs loaded into the page take part
+    @app.callback(
+        Output('area-snapshot', 'data'),
+        Output('area-sections', 'data'),
+        Output({'type': AREA_SECTION, 'index': ALL}, 'children'),
+        Input('choropleth-map', 'clickData'),
+        Input('tabs', 'active_tab'),
+        Input({'type': ACCORDION_COLLAPSE, 'index': ALL}, 'is_open'),
+        State('area-sections', 'data'))
+    def display_click_data(click_data: dict, active_tab: str, is_open: list, rendered: dict) -> tuple:
+        collapses = [item['id']['index'] for item in dash.callback_context.inputs_list[2]]
+        visible = visible_sections(active_tab, dict(zip(collapses, is_open)))
+
+        summary, rendered, sections = render_area(click_data, visible, rendered)
+        sections = dict(zip(AREA_SECTIONS, sections))
+        return summary, rendered, [sections[item['id']['index']] for item in dash.callback_context.outputs_list[2]]
@@ -0,0 +1,59 @@
+import dash
+from dash.dependencies import ClientsideFunction, Input, Output, State
+
+from .util.cache import LRUCache
+from ..map_layout import TAB_CONTENTS, TAB_DATASETS, init_tab_content
+from ..snapshot import current_snapshot
+
+# Built tab contents by (tab_id, version of the datasets of the tab)
+TAB_CACHE = LRUCache(max_entries=len(TAB_CONTENTS))
+
+
+def load_tab(tab_id: str, loaded: list) -> tuple:
+    """
+    Content of a tab activated for the first time.
+    ---
+    Args:
+        tab_id (str): tab_id of the activated tab
+        loaded (list): tabs whose content is already in the page
+
+    Returns:
+        loaded, contents (list, list): updated loaded tabs and the children of every tab content,
+        dash.no_update for all but the activated tab
+    """
+    snapshot = current_snapshot()
+    content = TAB_CACHE.get_or_render(
+        (tab_id, snapshot.versions.key(*TAB_DATASETS[tab_id])), lambda: init_tab_content(snapshot, tab_id)
+    )
+    contents = [content if other == tab_id else dash.no_update for other in TAB_CONTENTS]
+    return list(loaded or []) + [tab_id], contents
+
+
+def init_tab_callbacks(app: dash.Dash) -> None:
+    """
+    Initializes the lazy loading of the tabs. Activating a tab whose content is not in the page yet
+    requests it once, see tabs.request in assets/clientside.js. Later activations need no request.
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
+
+    Returns: None
+    """
+    app.clientside_callback(
+        ClientsideFunction(namespace='tabs', function_name='request'),
+        Output('tab-request', 'data'),
+        Input('tabs', 'active_tab'),
+        State('tabs-loaded', 'data'),
+    )
+
+    @app.callback(
+        [Output('tabs-loaded', 'data')] + [Output(f"tab-content-{tab_id}", 'children') for tab_id in TAB_CONTENTS],
+        Input('tab-request', 'data'),
+        State('tabs-loaded', 'data'),
+        prevent_initial_call=True)
+    def display_tab(tab_id: str, loaded: list) -> list:
+        if tab_id not in TAB_CONTENTS or tab_id in (loaded or []):
+            raise dash.exceptions.PreventUpdate
+
+        loaded, contents = load_tab(tab_id, loaded)
+        return [loaded] + contents
@@ -1,28 +1,21 @@
-import dash
-import geopandas as gpd
 from .individual_callbacks import *
 from .household_callbacks import *
 
-
-def init_census_callbacks(app: dash.Dash, datum: gpd.GeoDataFrame) -> None:
-    """
-    Initializes Callbacks for filtering  graph objects data with the map.
-    ---
-    Args:
-        app (dash.Dash): main dash app to which callbacks are registered.
-        datum (gpd.GeoDataFrame): Geodataframe with postal area data.
-
-    Returns: None
-    """
+# Census sections rendered for the clicked postal area, by container id
+CENSUS_SECTIONS = {
     # Individual
-    init_age_histogram(app, datum)
-    init_gender_pie(app, datum)
-    init_education_pie(app, datum)
-    init_income_indicators(app, datum)
-    init_employment_pie(app, datum)
+    'id_age_dist_hist': render_age_histogram,
+    'id_gender_pie_chart': render_gender_pie,
+    'id_education_pie_chart': render_education_pie,
+    'id_income_pie_chart': render_income_indicators,
+    'id_employment_pie_chart': render_employment_pie,
 
     # Household
-    init_household_size(app, datum)
-    init_household_structure(app, datum)
-    init_household_income(app, datum)
-    init_household_dwellings(app, datum)
+    'id_household_size': render_household_size,
+    'id_household_structure': render_household_structure,
+    'id_household_income': render_household_income,
+    'id_household_dwellings': render_household_dwellings,
+}
+
+# Datasets read by the census sections, keys of DATASET_FILES
+CENSUS_DATASETS = ('datum',)
@@ -1,173 +1,231 @@
+import numpy as np
 import pandas as pd
 
 import dash
 from dash import html
 from dash import dcc
-import plotly.graph_objects as go
-from dash.dependencies import Input, Output
+from dash.dependencies import ClientsideFunction, Input, Output, State
 
-colors = [
-    '#4182C8', '#2E94B2',
-    '#39A791', '#6FB26C',
-    '#C0C15C', '#F9BD24',
-    '#F3903F', '#EC6546',
-    '#7D4C94', '#5B61AE'
-]
+from ...datasets.air_quality import PLOTTED_SERIES, chart_points
+from ...datasets.air_temperature import MONTHS, Climatology
+from ...callbacks.util.figures import BACKGROUND, BOTTOM_LEGEND, COLORS, chart
+from ...snapshot import current_snapshot
+
+
+def render_air_temperature(climatology: Climatology) -> list:
+    """
+    Generates the graphs for Air Temperature section. The section does not depend on the
+    clicked area, it is rendered into the layout of every data snapshot.
+    ---
+    Args:
+        climatology (Climatology): daily air temperature climatology
+
+    Returns:
+        children (list): List of html components to be displayed.
+    """
+    section_title = "Average Air Temperature"
+
+    text = f"""
+    Air temperature indirectly affects functioning, growth, and reproduction of a wide range of
+    biological and societal processes, Air temperature also affects nearly all other weather parameters
+    including, air temperature affects the rate of evaporation, relative humidity, wind patterns.
+    The band shows the range of daily mean temperatures between the 10th and 90th percentile over
+    {climatology.years[0]}-{climatology.years[-1]}, the line the daily means of {climatology.current_year}.
+    """
+
+    low, high = climatology.band()
+
+    fig = chart(
+        [
+            {
+                'type': 'scatter',
+                'x': climatology.dates,
+                'y': high,
+                'line': {'width': 0},
+                'hoverinfo': 'skip',
+                'showlegend': False,
+            },
+            {
+                'type': 'scatter',
+                'x': climatology.dates,
+                'y': low,
+                'fill': 'tonexty',
+                'fillcolor': 'rgba(65, 130, 200, 0.3)',
+                'line': {'width': 0},
+                'name': '10th-90th percentile',
+            },
+            {
+                'type': 'scatter',
+                'x': climatology.dates,
+                'y': climatology.doy['p50'],
+                'line': {'color': COLORS[0], 'width': 2, 'dash': 'dot'},
+                'name': 'Median',
+            },
+            {
+                'type': 'scatter',
+                'x': climatology.dates,
+                'y': climatology.current_doy,
+                'line': {'color': COLORS[5], 'width': 2},
+                'name': str(climatology.current_year),
+            },
+        ],
+        xaxis={'tickformat': '%b', 'dtick': 'M1'},
+        yaxis={'ticksuffix': '°C'},
+        legend={**BOTTOM_LEGEND, 'font': {'size': 12}},
+        hovermode='x unified',
+    )
+
+    anomaly = climatology.month['anomaly']
+
+    fig_anomaly = chart(
+        [
+            {
+                'type': 'bar',
+                'x': MONTHS,
+                'y': anomaly,
+                'marker': {'color': [COLORS[7] if value > 0 else COLORS[0] for value in np.nan_to_num(anomaly)]},
+                'name': f"Anomaly {climatology.current_year}",
+            },
+        ],
+        title={'text': f"Monthly anomaly of {climatology.current_year}", 'font': {'size': 14}},
+        yaxis={'ticksuffix': '°C'},
+        margin={'t': 50},
+    )
+
+    children = [
+        html.H4(section_title),
+        html.Hr(),
+        dcc.Graph(id='injected99', figure=fig, config={'displayModeBar': False}),
+        dcc.Graph(id='air-temperature-anomaly', figure=fig_anomaly, config={'displayModeBar': False}),
+        html.P(text),
+    ]
+    return children
 
 
 def init_env_callbacks(app: dash.Dash):
     """
-    Tab 5 Section 1 air temp CallBack
+    Tab 5 Environment CallBacks
     """
+    # Tab 5 Section 2 air pollution CallBack
+    app.clientside_callback(
+        ClientsideFunction(namespace='graphs', function_name='view'),
+        Output('air-pollution-view', 'data'),
+        Input('air-pollution-graph', 'relayoutData'),
+        State('air-pollution-graph', 'id'),
+        State('air-pollution-view', 'data'))
+
     @app.callback(
-        Output('id_air_temperature', 'children'),
-        Input('choropleth-map', 'clickData')
-    )
-    def display_click_data(click_data: dict) -> list:
+        Output('air-pollution-graph', 'figure'),
+        Input('air-pollution-view', 'data'))
+    def display_air_pollution(view: dict) -> dict:
         """
-        Generates the graphs for Bus section.
+        Generates the air pollution chart for the visible time window, one point per plotted pixel.
         ---
         Args:
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
+            view (dict): x axis relayoutData of the graph after a zoom or pan, None on load,
+                and its plotted width in pixels, see graphs.view in assets/clientside.js
 
         Returns:
-            children (list): List of html components to be displayed.
-        """
-        section_title = "Average Air Temperature"
-
-        text = f"""
-        Air temperature indirectly affects functioning, growth, and reproduction of a wide range of
-        biological and societal processes, Air temperature also affects nearly all other weather parameters
-        including, air temperature affects the rate of evaporation, relative humidity, wind patterns.
+            fig (dict): downsampled series of the window
         """
-        df = pd.read_csv("website/data/environment/air-temperature-wind/air_temp_data.csv")
-
-        fig = go.Figure()
-
-        fig.add_trace(
-            go.Scatter(
-                x=df['month'],
-                y=df['air_temp'],
-                line=dict(color=colors[5], width=4),
-                line_shape='spline'
-            )
-        )
-
-        fig.update_layout(
-                xaxis=dict(
-                    tickmode='array',
-                    tickvals=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-                    ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                ),
-                font=dict(size=14, color="#fff"),
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.25,
-                    xanchor="center",
-                    x=0.5),
-                legend_font_size=12,
-                paper_bgcolor='#1E1E1E',
-                plot_bgcolor='#1E1E1E',
-                margin={"r": 30, "t": 30, "l": 30, "b": 30},
-                autosize=True
-        )
-
-        children = [
-            html.H4(section_title),
-            html.Hr(),
-            dcc.Graph(id='injected99', figure=fig, config={'displayModeBar': False}),
-            html.P(text),
-        ]
-        return children
-
-    # Tab 5 Section 2 air pollution CallBack
+        view = view or {}
+        start, end = get_time_window(view.get('relayout'))
+        series = current_snapshot().air_quality.query(start, end, points=chart_points(view.get('width')))
+
+        data = []
+        for name, legend_name in PLOTTED_SERIES.items():
+            time, values = series[name]
+            data.append({'type': 'scattergl', 'x': time, 'y': values, 'mode': 'lines', 'name': legend_name})
+
+        layout = {
+            'legend': {**BOTTOM_LEGEND, 'y': -0.5, 'font': {'size': 12}},
+            # Keeps the zoom of the user when the figure is replaced with finer data
+            'uirevision': 'air-pollution',
+        }
+        if start is not None and end is not None:
+            layout['xaxis'] = {'range': [str(start), str(end)]}
+
+        return chart(data, **layout)
+
+    # Tab 5 Section 4 pollution by weather CallBack
     @app.callback(
-        Output('id_air_pollution', 'children'),
-        Input('choropleth-map', 'clickData'))
-    def display_click_data(click_data):
+        Output('id_pollution_weather', 'children'),
+        Input('pollution-weather-pollutant', 'value'),
+        Input('pollution-weather-condition', 'value'))
+    def display_pollution_weather(pollutant: str, condition: str) -> list:
         """
-        Generates the graphs for Bus section.
+        Generates the mean concentration of a pollutant by wind direction or air temperature.
         ---
-        Args: 
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
+        Args:
+            pollutant (str): name of the air quality series
+            condition (str): 'direction' or 'temperature'
 
-        Returns: 
+        Returns:
             children (list): List of html components to be displayed.
         """
-        section_title = "Air Pollution"
+        environment = current_snapshot().environment
+        legend_name = PLOTTED_SERIES.get(pollutant, pollutant)
 
-        df = pd.read_csv("website/data/environment/air-quality/air_quality_2020_clean.csv")
+        section_title = "Pollution and Weather"
 
-        fig = go.Figure()
-
-        fig.add_trace(
-            go.Scatter(
-                x=df['Date'],
-                y=df['Nitrogen dioxide (ug/m3)'],
-                mode='lines',
-                line_shape='spline',
-                name='Nitrogen dioxide (ug/m3)'
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=df['Date'],
-                y=df['Nitrogen monoxide (ug/m3)'],
-                mode='lines',
-                line_shape='spline',
-                name='Nitrogen monoxide (ug/m3)'
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=df['Date'],
-                y=df['Particulate matter < 10 µm (ug/m3)'],
-                mode='lines',
-                line_shape='spline',
-                name='Particulate matter < 10 µm (ug/m3)'
+        if condition == 'direction':
+            aggregate = environment.by_direction(pollutant)
+            fig = chart(
+                [{'type': 'barpolar', 'r': aggregate['mean'], 'theta': aggregate.index,
+                  'marker': {'color': COLORS[1]}, 'name': legend_name}],
+                polar={'bgcolor': BACKGROUND, 'angularaxis': {'rotation': 90, 'direction': 'clockwise'}},
             )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=df['Date'],
-                y=df['Particulate matter < 2.5 µm (ug/m3)'],
-                mode='lines',
-                line_shape='spline',
-                name='Particulate matter < 2.5 µm (ug/m3)'
+            condition_text = "the direction the wind blows from"
+        else:
+            aggregate = environment.by_temperature(pollutant)
+            fig = chart(
+                [{'type': 'bar', 'x': aggregate.index, 'y': aggregate['mean'],
+                  'marker': {'color': COLORS[1]}, 'name': legend_name}],
+                xaxis={'ticksuffix': '°C'},
             )
-        )
-
-        fig.update_layout(
-            font=dict(size=14, color="#fff"),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.5,
-                xanchor="center",
-                x=0.5,
-            ),
-            legend_font_size=12,
-            paper_bgcolor='#1E1E1E', 
-            plot_bgcolor='#1E1E1E', 
-            margin={"r": 30, "t": 30, "l": 30, "b": 30},
-            autosize=True
-        )
-
-        text = f"""
-        Air pollution refers to the release of pollutants into the air.
-        High level of pollutants in ambient air are detrimental to human health and the planet as a whole.
-        Pollutants are measured in micrograms of gaseous pollutant per cubic meter of ambient air (µg/m3).
-        """
+            condition_text = "the air temperature"
+
+        hours = int(aggregate['count'].sum())
+        if hours:
+            text = f"""
+            Mean hourly concentration of {legend_name} (µg/m3) by {condition_text},
+            over the {hours} hours with both measurements.
+            """
+        else:
+            text = f"""
+            The measurements of {legend_name} and of {condition_text} do not overlap in time yet.
+            """
 
         children = [
             html.H4(section_title),
             html.Hr(),
-            dcc.Graph(id='injected99', figure=fig, config={'displayModeBar': False}),
+            dcc.Graph(id='pollution-weather-graph', figure=fig, config={'displayModeBar': False}),
             html.P(text),
         ]
-
         return children
+
+
+def get_time_window(relayout_data: dict) -> tuple:
+    """
+    Reads the visible x axis range from the relayoutData of a graph.
+    ---
+    Args:
+        relayout_data (dict): relayoutData property of dcc.Graph
+
+    Returns:
+        start, end (np.datetime64): bounds of the window, both None for the full range
+    """
+    if not relayout_data or relayout_data.get('xaxis.autorange'):
+        return None, None
+
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        bounds = relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']
+    elif 'xaxis.range' in relayout_data:
+        bounds = relayout_data['xaxis.range']
+    else:
+        return None, None
+
+    try:
+        return tuple(np.datetime64(pd.Timestamp(bound).to_datetime64(), 's') for bound in bounds)
+    except (TypeError, ValueError):
+        return None, None
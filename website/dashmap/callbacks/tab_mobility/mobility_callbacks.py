@@ -1,124 +1,120 @@
-import pandas as pd
-import geopandas as gpd
-
 import dash
+import numpy as np
 from dash import html
 from dash import dcc
-import plotly.graph_objects as go
 from dash.dependencies import Input, Output
 
-from ...callbacks.util.helpers import privacy_check, privacy_notice, get_postal_code
-
-colors = [
-    '#4182C8', '#2E94B2',
-    '#39A791', '#6FB26C',
-    '#C0C15C', '#F9BD24',
-    '#F3903F', '#EC6546',
-    '#7D4C94', '#5B61AE'
-]
+from ...callbacks.util.area import AreaSnapshot
+from ...callbacks.util.figures import BACKGROUND, BOTTOM_LEGEND, COLORS, chart, indicator, indicator_grid
+from ...callbacks.util.helpers import privacy_notice
+from ...snapshot import current_snapshot
 
 
-def init_mobility_callbacks(app: dash.Dash, datum: gpd.GeoDataFrame) -> None:
+def render_mobility_index(area: AreaSnapshot) -> list:
     """
-    Initializes mobility callbacks
+    Generates the graphs for mobility index section.
     ---
     Args:
-        app (dash.Dash): Main dash app to which callbacks are registered.
-        datum (gpd.GeoDataFrame): Geodataframe containing data for postal areas.
+        area (AreaSnapshot): clicked postal area
 
     Returns:
-        children (list): List containing html components.
+        children (list): List of html components to be displayed.
+    """
+    section_title = "Mobility Index"
+
+    neighborhood = area.neighborhood
+
+    mobility_data = area.mobility
+    mobility_index = float(mobility_data['mobility_index'])
+    geometry = area.data.geometry
+    surface_area = float(geometry.table.at[area.postal_code, 'area']) / 1e6
+    mobility_nodes = float(mobility_data['mobility_nodes'])
+    network_diversity = float(mobility_data['network_diversity'])
+    nearest_stop = float(mobility_data['nearest_stop_median'])
+
+    # Data privacy check
+    if area.private:
+        return privacy_notice(section_title, neighborhood)
+
+    # Mean index of the neighbouring areas, weighted by the length of the shared boundary
+    neighbours = geometry.neighbours(area.postal_code)
+    neighbour_index = area.data.mobility['mobility_index'].reindex(neighbours.index).astype(float).dropna()
+    neighbour_mean = None
+    if len(neighbour_index):
+        neighbour_mean = float(np.average(neighbour_index, weights=neighbours[neighbour_index.index]))
+
+    fig = indicator_grid([
+        indicator(
+            mobility_index, "Mobility Index", "index is a value between 1 and 0, compared with the neighbouring areas",
+            number={'prefix': ""},
+            delta=None if neighbour_mean is None else {'reference': neighbour_mean, 'position': "top"},
+            mode='number' if neighbour_mean is None else 'number+delta',
+        ),
+    ])
+
+    text_pre = f"""
+    Dashmap mobility index is a composite index that indicates how well the given area is connected to
+    other areas within the city. The index takes into account various factors including the surface area
+    of the region, number of public transit routes and their relationships with each other. The higher the
+    index the better the connectivity of the given area.
     """
-    @app.callback(
-        Output('id_mobility_index', 'children'),
-        Input('choropleth-map', 'clickData')
-    )
-    def display_click_data(click_data: dict) -> list:
-        """
-        Generates the graphs for mobility index section.
-        ---
-        Args: 
-            click_data (dict): dictionary returned by dcc.Graph component.
-            Triggered by user-interaction with the map.
-
-        Returns: 
-            children (list): List of html components to be displayed.
-        """
-        section_title = "Mobility Index"
-
-        # Get the postal code based on clicked area
-        postal_code = get_postal_code(click_data)
-
-        # Get df row based on postal number
-        result = datum.loc[postal_code]
-        neighborhood = result['neighborhood']
 
-        mobility_data = pd.read_csv('website/data/mobility/mobility.csv', dtype='str')
-        mobility_data.set_index('index', inplace=True)
+    text_post = f"""
+    Dashmap mobility index for {neighborhood} neighborhood is {mobility_index:.3f}.
+    Dashmap mobility index is a composite index that indicates how well is the area connected to
+    other areas within the city. The index takes into account various factors including the surface area,
+    number of bus, tram and metro stations and their relationships with each other.
+    {neighborhood} neighborhood has a surface area of {surface_area:.1f} km²
+    and {mobility_nodes:.0f} mobility nodes. The diversity of its transit networks is {network_diversity:.2f},
+    from 0 when all stops belong to one network to 1 when bus, tram, train, metro and ferry stops are equally
+    present, and half of the area is within {nearest_stop:.0f} m of the nearest stop.
+    """
+    if neighbour_mean is not None:
+        text_post += f"""
+    Its {len(neighbour_index)} neighbouring areas have a mean mobility index of {neighbour_mean:.3f},
+    weighted by the length of the boundary they share with {neighborhood}.
+    """
 
-        mobility_data = mobility_data.loc[postal_code]
-        mobility_index = float(mobility_data['mobility_index'])
-        surface_area = float(mobility_data['Surface area'])/1000
-        mobility_nodes = float(mobility_data['mobility_nodes'])
+    children = [
+        html.H4(section_title),
+        html.Hr(),
+        html.P(text_pre),
+        dcc.Graph(id='injected5', figure=fig, config={'displayModeBar': False}),
+        html.P(text_post),
+    ]
+    return children
 
-        # Data privacy check
-        if privacy_check(postal_code):
-            return privacy_notice(section_title, neighborhood)
 
-        fig = go.Figure()
+MOBILITY_SECTIONS = {
+    'id_mobility_index': render_mobility_index,
+}
 
-        fig.add_trace(go.Indicator(
-            mode="number",
-            value=mobility_index,
-            number={'prefix': ""},
-            title={"text": f"Mobility Index<br><span style='font-size:0.8em;color:gray'>" +
-                           "index is a value between 1 and 0</span><br>"},
-            )
-        )
-        
-        fig.update_layout(
-            paper_bgcolor='#1E1E1E',
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 0, "t": 0, "l": 0, "b": 0},
-            autosize=True,
-            font=dict(color="white")
-        )
+# Datasets read by the mobility sections, keys of DATASET_FILES
+MOBILITY_DATASETS = ('datum', 'mobility', 'geometry')
 
-        text_pre = f"""
-        Dashmap mobility index is a composite index that indicates how well the given area is connected to
-        other areas within the city. The index takes into account various factors including the surface area
-        of the region, number of public transit routes and their relationships with each other. The higher the
-        index the better the connectivity of the given area.
-        """
 
-        text_post = f"""
-        Dashmap mobility index for {neighborhood} neighborhood is {mobility_index:.3f}.
-        Dashmap mobility index is a composite index that indicates how well is the area connected to
-        other areas within the city. The index takes into account various factors including the surface area,
-        number of bus, tram and metro stations and their relationships with each other.
-        {neighborhood} neighborhood has a surface area of {surface_area:.1f} km²
-        and {mobility_nodes:.0f} mobility nodes.
-        """
-
-        children = [
-            html.H4(section_title),
-            html.Hr(),
-            html.P(text_pre),
-            dcc.Graph(id='injected5', figure=fig, config={'displayModeBar': False}),
-            html.P(text_post),
-        ]
-        return children
+def init_mobility_callbacks(app: dash.Dash) -> None:
+    """
+    Initializes mobility callbacks
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
 
+    Returns:
+        children (list): List containing html components.
+    """
     # Tab 5 Section 1 Windrose CallBack
     @app.callback(
         Output('id_windrose', 'children'),
-        Input('choropleth-map', 'clickData'))
-    def display_click_data(click_data: dict) -> list:
+        Input('wind-year-select', 'value'),
+        Input('wind-season-select', 'value'))
+    def display_wind_rose(year: str, season: str) -> list:
         """
-        Generates the graphs for Bus section.
+        Generates the wind rose for the selected year and season.
         ---
         Args: 
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
+            year (str): selected year or 'all'
+            season (str): selected season or 'all'
 
         Returns: 
             children (list): List of html components to be displayed.
@@ -133,64 +129,21 @@ def init_mobility_callbacks(app: dash.Dash, datum: gpd.GeoDataFrame) -> None:
         spatial climate patterns.
         """
 
-        df = pd.read_csv("website/data/environment/air-temperature-wind/wind_data.csv")
-
-        r_1 = df['r_1'].to_list()
-        r_2 = df['r_2'].to_list()
-        r_3 = df['r_3'].to_list()
-        r_4 = df['r_4'].to_list()
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Barpolar(
-                r=r_1,
-                name='< 5 m/s',
-                marker_color=colors[3]
-            )
-        )
-        fig.add_trace(
-            go.Barpolar(
-                r=r_2,
-                name='5-8 m/s',
-                marker_color=colors[2]
-            )
-        )
-        fig.add_trace(
-            go.Barpolar(
-                r=r_3,
-                name='8-10 m/s',
-                marker_color=colors[1]
-            )
-        )
-        fig.add_trace(
-            go.Barpolar(
-                r=r_4,
-                name='> 11 m/s',
-                marker_color=colors[8]
-            )
-        )
-        fig.update_layout(
-            font=dict(
-                size=14,
-                color="#fff"
-            ),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.25,
-                xanchor="center",
-                x=0.5,
-            ),
-            legend_font_size=12,
-            polar_radialaxis_ticksuffix='%',
-            polar_angularaxis_rotation=0,
-            paper_bgcolor='#1E1E1E', 
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 30, "t": 30, "l": 30, "b": 30},
-            autosize=True
+        r_1, r_2, r_3, r_4 = current_snapshot().wind.rose(
+            year=None if year in (None, 'all') else int(year),
+            season=None if season in (None, 'all') else season,
         )
 
-        fig.update_polars(bgcolor='#1E1E1E')
+        fig = chart(
+            [
+                {'type': 'barpolar', 'r': r_1, 'name': '< 5 m/s', 'marker': {'color': COLORS[3]}},
+                {'type': 'barpolar', 'r': r_2, 'name': '5-8 m/s', 'marker': {'color': COLORS[2]}},
+                {'type': 'barpolar', 'r': r_3, 'name': '8-10 m/s', 'marker': {'color': COLORS[1]}},
+                {'type': 'barpolar', 'r': r_4, 'name': '> 11 m/s', 'marker': {'color': COLORS[8]}},
+            ],
+            legend={**BOTTOM_LEGEND, 'font': {'size': 12}},
+            polar={'radialaxis': {'ticksuffix': '%'}, 'angularaxis': {'rotation': 0}, 'bgcolor': BACKGROUND},
+        )
 
         children = [
             html.H4(section_title),
@@ -1,442 +1,306 @@
-import pandas as pd
+from typing import Callable, Optional
 
 import dash
+import pandas as pd
+
 from dash import html
 from dash import dcc
-import plotly.graph_objects as go
-from dash.dependencies import Input, Output
 
-from ...callbacks.util.helpers import privacy_check, privacy_notice, get_postal_code
+from ...callbacks.util.area import AreaSnapshot
+from ...callbacks.util.cache import to_plain
+from ...callbacks.util.figures import indicator, indicator_grid, listing_scatter
+from ...callbacks.util.helpers import privacy_notice
+from ...callbacks.util.jobs import init_background_panel_callback
 pd.options.mode.chained_assignment = None
 
 
-def init_re_callbacks(app: dash.Dash, real_estate: pd.DataFrame) -> None:
+def render_rentals(area: AreaSnapshot) -> list:
     """
+    Generates the graphs for rental Dwellings section.
+    Indicators are read from the running listing aggregates,
+    the scatter plot of the raw listings is a background panel, see render_listings.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+
+    Returns:
+        children (list): List of html components to be displayed.
     """
-    # Tab 2 Section 1 Rental Dwellings
-    @app.callback(
-        Output('id_re_renting', 'children'),
-        Input('choropleth-map', 'clickData')
-    )
-    def display_click_data(click_data: dict) -> list:
-        """
-        Generates the graphs for rental Dwellings section.
-        ---
-        Args:
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
-        Returns:
-            children (list): List of html components to be displayed.
-        """
-        section_title = "Rental Apartments"
-
-        # Get the postal code based on clicked area
-        postal_code = get_postal_code(click_data)
-
-        rentals = real_estate[real_estate['deal_type'] == 'rent']
-
-        rentals['price_per_square'] = (rentals['price'] / rentals['area'])
-
-        # Get df row based on postal number
-        if postal_code in rentals.index:
-            df = rentals.loc[postal_code]
-        else:
-            df = pd.DataFrame(0.0, columns=rentals.columns, index=rentals.index)
-            
-        try:
-            neighborhood = df['neighborhood'].values[0]
-
-        except AttributeError:
-            neighborhood = df['neighborhood']
-
-        finally:
-            neighborhood = ""
-
-        price_per_square = df['price_per_square'].mean()
-        average_area = df['area'].mean()
-        hels_avg_price_per_square = rentals['price_per_square'].mean()
-        hels_avg_re_area = rentals['area'].mean()
-
-        rent_indicators = go.Figure()
-
-        rent_indicators.add_trace(
-            go.Indicator(
-                mode="number",
-                value=price_per_square,
-                number={'prefix': "€", "font": {"size": 40}},
-                title={"text": f"Rent per m² in {neighborhood}<br><span style='font-size:0.8em;color:gray'>" +
-                               "Average monthly rent by square meter</span><br>"},
-                domain={'x': [0, 0.5], 'y': [0.5, 1]}
-            )
-        )
-
-        rent_indicators.add_trace(
-            go.Indicator(
-                mode="number",
-                value=hels_avg_price_per_square,
-                number={'prefix': "€", "font": {"size": 40}},
-                title={"text": "Average Rent in Helsinki<br><span style='font-size:0.8em;color:gray'>" +
-                               "Average monthly rent by square meter for Helsinki </span><br>"},
-                domain={'x': [0.5, 1], 'y': [0.5, 1]},
-            )
-        )
-
-        rent_indicators.add_trace(
-            go.Indicator(
-                mode="number",
-                value=hels_avg_re_area,
-                number={'suffix': " m²", "font": {"size": 40}},
-                title={"text": "Average Area in Helsinki<br><span style='font-size:0.8em;color:gray'>" +
-                               "All apartments average.</span><br>"},
-                domain={'x': [0.5, 1], 'y': [0, .5]},
-            )
-        )
-        rent_indicators.add_trace(
-            go.Indicator(
-                mode="number",
-                value=average_area,
-                number={'suffix': " m²", "font": {"size": 40}},
-                title={"text": f"Average area in {neighborhood}<br><span style='font-size:0.8em;color:gray'>" +
-                               "All apartments average.</span><br>"},
-                domain={'x': [0, 0.5], 'y': [0, 0.5]},
-            )
-        )
-
-        rent_indicators.update_layout(
-                paper_bgcolor='#1E1E1E',
-                plot_bgcolor='#1E1E1E',
-                margin={"r": 0, "t": 0, "l": 0, "b": 0},
-                autosize=True,
-                font=dict(color="white")
-        )
-
-        # Area VS Rent Scatter Plot
-        rental_df = real_estate[real_estate['deal_type'] == 'rent']
-        rental_df = rental_df[rental_df['price'] < 5000]
-        rental_df = rental_df[rental_df['area'] < 310]
-
-        y = rental_df['price']
-        x = rental_df['area']
-
-        scatter_chart_rent = go.Figure(
-            data=go.Scattergl(
-                x=x,
-                y=y,
-                mode='markers',
-                hovertemplate='<b>Price</b>: €%{y:.2f}' +
-                '<br><b>Area</b>: %{x}m²<br>',
-                marker=dict(
-                    size=8,
-                    color=rental_df['rooms'],
-                    colorscale='OrYel',
-                    showscale=True,
-                ),
-            )
-        )
-
-        scatter_chart_rent.update_layout(
-            showlegend=False,
-            paper_bgcolor='#1E1E1E',
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 50, "t": 50, "l": 50, "b": 50},
-            autosize=True,
-        )
-
-        scatter_chart_rent.update_traces(marker=dict(line=dict(color='#1E1E1E', width=3)))
-        scatter_chart_rent.update_xaxes(color='#fff', gridcolor='#D3D3D3')
-        scatter_chart_rent.update_yaxes(color='#fff', gridcolor='#D3D3D3')
-
-        children = [
-            html.H5(section_title),
-            html.P(
-                """
-                Residential rental property refers to homes that are purchased by an 
-                individual and inhabited by tenants on a lease or other type of rental agreement. 
-                Residential property is property dedicated specifically for living or dwelling for 
-                individuals or households; it may include standalone single-family dwellings to large, 
-                multi-unit apartment buildings.
-                """
-            ),
-            dcc.Graph(id='injected', figure=rent_indicators, config={'displayModeBar': False}),
-            html.P(
-                f"""
-                Indicators above demonstrate the Average monthly rent per square meter in the chosen 
-                postal area compared to average monthly rent per square meter in Helsinki.
-                Average monthly rent per square meter in {neighborhood} is {price_per_square:.2f}€. 
-                This means that the average monthly rent of a 30m² apartment will be approximately
-                {(price_per_square * 35):.2f}€, 60m² apartment will cost {(price_per_square * 65):.2f}€ 
-                and 90m² apartment will cost {(price_per_square * 95):.2f}€. If there is not enough data on the
-                neighborhood all values will be 0. Average square meters of the apartment can be used to compare
-                the average size of the apartments in {neighborhood} to the average size of apartment 
-                is Helsinki metropolitan region.
-                """
-            ),
-            dcc.Graph(id='injected2', figure=scatter_chart_rent, config={'displayModeBar': False}),
-            html.P(
-                """
-                Scatterplots above illustrates the relationships between apartment square meters and monthly
-                rent in Helsinki Metropolitan area. The graph helps us understand how the change in apartment
-                square meters affects the monthly rent.
-                """
-            ),
-        ]
-
-        return children
-
-    # Tab 2 Section 1 Owned Dwellings
-    @app.callback(
-        Output('id_re_owning', 'children'),
-        Input('choropleth-map', 'clickData'))
-    def display_click_data(click_data):
-        """
-        Generates the graphs for owned dwellings section.
-        ---
-        Args: 
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
-
-        Returns: 
-            children (list): List of html components to be displayed.
-        """
-        # Get the postal code based on clicked area
-        postal_code = get_postal_code(click_data)
-
-        selling = real_estate[real_estate['deal_type'] == 'sell']
-        selling['price_per_square'] = (selling['price'] / selling['area'])
-
-        # get df row based on postal number
-        if postal_code in selling.index:
-            df = selling.loc[postal_code]
-        else:
-            df = pd.DataFrame(0.0, columns=selling.columns, index=selling.index)
-            
-        try:
-            neighborhood = df['neighborhood'].values[0]
-
-        except AttributeError:
-            neighborhood = df['neighborhood']
-
-        finally:
-            neighborhood = ""
-
-        price_per_square = df['price_per_square'].mean()
-        average_area = df['area'].mean()
-        hels_avg_price_per_square = selling['price_per_square'].mean()
-        hels_avg_re_area = selling['area'].mean()
-
-        # Create graph object
-        sell_indicators = go.Figure()
-
-        sell_indicators.add_trace(go.Indicator(
-            mode="number",
-            value=price_per_square,
-            number={'prefix': "€", "font": {"size": 40}},
-            title={"text": f"Price per m² in {neighborhood}<br><span style='font-size:0.8em;color:gray'>" +
-                           "Average price per square meter</span><br>"},
-            domain={'x': [0, 0.5], 'y': [0.5, 1]}
-            )
-        )
-
-        sell_indicators.add_trace(go.Indicator(
-            mode="number",
-            value=hels_avg_price_per_square,
-            number={'prefix': "€", "font": {"size": 40}},
-            title={"text": "Average price in Helsinki<br><span style='font-size:0.8em;color:gray'>" +
-                           "Average price per square meter for Helsinki </span><br>"},
-            domain={'x': [0.5, 1], 'y': [0.5, 1]},
-            )
-        )
-
-        sell_indicators.add_trace(go.Indicator(
-            mode="number",
-            value=hels_avg_re_area,
-            number={'suffix': " m²", "font": {"size": 40}},
-            title={"text": "Average Area in Helsinki<br><span style='font-size:0.8em;color:gray'>" +
-                           "All apartments average.</span><br>"},
-            domain={'x': [0.5, 1], 'y': [0, .5]},
-            )
-        )
-
-        sell_indicators.add_trace(go.Indicator(
-            mode="number",
-            value=average_area,
-            number={'suffix': " m²", "font": {"size": 40}},
-            title={"text": f"Average area in {neighborhood}<br><span style='font-size:0.8em;color:gray'>" +
-                           "All apartments average.</span><br>"},
-            domain={'x': [0, 0.5], 'y': [0, 0.5]},
-            )
-        )
-
-        sell_indicators.update_layout(
-            paper_bgcolor='#1E1E1E',
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 0, "t": 0, "l": 0, "b": 0},
-            autosize=True,
-            font=dict(color="white")
-            )
-        
-        selling_df = real_estate[real_estate['deal_type'] == 'sell']
-        selling_df = selling_df[selling_df['price'] < 2000000]
-        selling_df = selling_df[selling_df['area'] < 310]
-
-        x = selling_df['area']
-        y = selling_df['price']
-
-        scatter_chart_sell = go.Figure(
-            data=go.Scattergl(
-                x=x,
-                y=y,
-                mode='markers',
-                hovertemplate='<b>Price</b>: €%{y:.2f}' +
-                '<br><b>Area</b>: %{x}m²<br>',
-                marker=dict(
-                    size=8,
-                    color=selling_df['rooms'],
-                    colorscale='tealgrn',
-                    showscale=True,
-                )
-            )
-        )
-
-        scatter_chart_sell.update_layout(
-            showlegend=False,
-            paper_bgcolor='#1E1E1E',
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 50, "t": 50, "l": 50, "b": 50},
-            autosize=True
-        )
-        scatter_chart_sell.update_traces(marker=dict(line=dict(color='#1E1E1E', width=3)))
-        scatter_chart_sell.update_xaxes(color='#fff', gridcolor='#D3D3D3')
-        scatter_chart_sell.update_yaxes(color='#fff', gridcolor='#D3D3D3')
-        
-        children = [
-            html.H5("Own Apartments"),
-            html.P(
-                """
-                Own apartment refers to homes that are inhabited by the owners. Residential property is property zoned
-                specifically for living or dwelling for individuals or households; it may include standalone 
-                single-family dwellings to large, multi-unit apartment buildings.
-                """
-            ),
-            dcc.Graph(
-                id='injected',
-                figure=sell_indicators,
-                config={'displayModeBar': False}
-            ),
-            html.P(
-                f"""
-                Indicators above demonstrate the Average buying price per square meter in {neighborhood} neighborhood
-                compared to the average price per square meter in Helsinki metropolitan region. 
-                Average price per square meter in {neighborhood} is {price_per_square:.2f}€. 
-                This means that the average price of a 30m² apartment will be approximately 
-                {(price_per_square * 35):.2f}€, 60m² apartment will cost {(price_per_square * 65):.2f}€ and 90m² 
-                apartment will cost {(price_per_square * 95):.2f}€. If there is not enough data on the neighborhood 
-                all values will be 0. Average square meters of the apartment can be used to compare the 
-                average size of the apartments in {neighborhood} to the average size of apartment is 
-                Helsinki metropolitan region. Note that In Finland, when you "buy an apartment" what 
-                you are actually buying are shares in a housing company (asunto-osakeyhtiö).
-                The amount of shares per apartment is proportional to the size of the apartment.
-                """
-            ),
-            dcc.Graph(
-                id='injected2',
-                figure=scatter_chart_sell,
-                config={'displayModeBar': False}
-            ),
-            html.P(
-                """
-                Scatterplots above illustrates the relationships between apartment square meters and apartment 
-                price in Helsinki Metropolitan area. The graph helps us understand how the change in apartment 
-                square meters affects the buying/selling price of the apartments.
-                """
-            ),            
-        ]
-
-        return children
-
-    # Tab 2 Section 1 Sauna Index
-    @app.callback(
-        Output('id_re_sauna', 'children'),
-        Input('choropleth-map', 'clickData')
-    )
-    def display_click_data(click_data: dict) -> list:
-        """
-        Generates the graphs for sauna index section.
-        ---
-        Args: 
-            click_data (dict): dictionary returned by dcc.Graph component triggered by user-interaction.
-
-        Returns: 
-            children (list): List of html components to be displayed.
-        """
-        # Section title
-        section_title = "Sauna Index"
-
-        # Get the postal code based on clicked area
-        postal_code = get_postal_code(click_data)
-
-        # get df row based on postal number
-        if postal_code in real_estate.index:
-            df = real_estate.loc[postal_code]
-        else:
-            df = pd.DataFrame(0.0, columns=real_estate.columns, index=real_estate.index)
-            
-        try:
-            neighborhood = real_estate['neighborhood'].values[0]
-
-        except AttributeError:
-            neighborhood = real_estate['neighborhood']
-
-        finally:
-            neighborhood = "" 
-
-        # Data privacy check
-        if privacy_check(postal_code):
-            return privacy_notice(section_title, neighborhood)
-
-        # Get number of saunas
-        saunas = df[df['sauna'] == True]
-        number_of_saunas = len(saunas)
-
-        # Create Graph Object
-        sauna = go.Figure()
-
-        sauna.add_trace(go.Indicator(
-            mode="number",
-            value=number_of_saunas,
+    section_title = "Rental Apartments"
+
+    # Running aggregates of the listings
+    snapshot = area.listings
+    rentals = snapshot.get(area.postal_code, 'rent')
+    neighborhood = ""
+
+    price_per_square = rentals.mean('price_per_square')
+    average_area = rentals.mean('area')
+    hels_avg_price_per_square = snapshot.region['rent'].mean('price_per_square')
+    hels_avg_re_area = snapshot.region['rent'].mean('area')
+
+    rent_indicators = indicator_grid([
+        indicator(
+            price_per_square, f"Rent per m² in {neighborhood}", "Average monthly rent by square meter",
+            domain={'x': [0, 0.5], 'y': [0.5, 1]}, number={'prefix': "€", "font": {"size": 40}},
+        ),
+        indicator(
+            hels_avg_price_per_square, "Average Rent in Helsinki", "Average monthly rent by square meter for Helsinki ",
+            domain={'x': [0.5, 1], 'y': [0.5, 1]}, number={'prefix': "€", "font": {"size": 40}},
+        ),
+        indicator(
+            hels_avg_re_area, "Average Area in Helsinki", "All apartments average.",
+            domain={'x': [0.5, 1], 'y': [0, .5]}, number={'suffix': " m²", "font": {"size": 40}},
+        ),
+        indicator(
+            average_area, f"Average area in {neighborhood}", "All apartments average.",
+            domain={'x': [0, 0.5], 'y': [0, 0.5]}, number={'suffix': " m²", "font": {"size": 40}},
+        ),
+    ])
+
+    children = [
+        html.H5(section_title),
+        html.P(
+            """
+            Residential rental property refers to homes that are purchased by an 
+            individual and inhabited by tenants on a lease or other type of rental agreement. 
+            Residential property is property dedicated specifically for living or dwelling for 
+            individuals or households; it may include standalone single-family dwellings to large, 
+            multi-unit apartment buildings.
+            """
+        ),
+        dcc.Graph(id='injected', figure=rent_indicators, config={'displayModeBar': False}),
+        html.P(
+            f"""
+            Indicators above demonstrate the Average monthly rent per square meter in the chosen 
+            postal area compared to average monthly rent per square meter in Helsinki.
+            Average monthly rent per square meter in {neighborhood} is {price_per_square:.2f}€. 
+            This means that the average monthly rent of a 30m² apartment will be approximately
+            {(price_per_square * 35):.2f}€, 60m² apartment will cost {(price_per_square * 65):.2f}€ 
+            and 90m² apartment will cost {(price_per_square * 95):.2f}€. If there is not enough data on the
+            neighborhood all values will be 0. Average square meters of the apartment can be used to compare
+            the average size of the apartments in {neighborhood} to the average size of apartment 
+            is Helsinki metropolitan region.
+            """
+        ),
+    ]
+
+    return children
+
+
+def render_owned(area: AreaSnapshot) -> list:
+    """
+    Generates the graphs for owned dwellings section.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+
+    Returns:
+        children (list): List of html components to be displayed.
+    """
+    # Running aggregates of the listings
+    snapshot = area.listings
+    selling = snapshot.get(area.postal_code, 'sell')
+    neighborhood = ""
+
+    price_per_square = selling.mean('price_per_square')
+    average_area = selling.mean('area')
+    hels_avg_price_per_square = snapshot.region['sell'].mean('price_per_square')
+    hels_avg_re_area = snapshot.region['sell'].mean('area')
+
+    sell_indicators = indicator_grid([
+        indicator(
+            price_per_square, f"Price per m² in {neighborhood}", "Average price per square meter",
+            domain={'x': [0, 0.5], 'y': [0.5, 1]}, number={'prefix': "€", "font": {"size": 40}},
+        ),
+        indicator(
+            hels_avg_price_per_square, "Average price in Helsinki", "Average price per square meter for Helsinki ",
+            domain={'x': [0.5, 1], 'y': [0.5, 1]}, number={'prefix': "€", "font": {"size": 40}},
+        ),
+        indicator(
+            hels_avg_re_area, "Average Area in Helsinki", "All apartments average.",
+            domain={'x': [0.5, 1], 'y': [0, .5]}, number={'suffix': " m²", "font": {"size": 40}},
+        ),
+        indicator(
+            average_area, f"Average area in {neighborhood}", "All apartments average.",
+            domain={'x': [0, 0.5], 'y': [0, 0.5]}, number={'suffix': " m²", "font": {"size": 40}},
+        ),
+    ])
+    
+    children = [
+        html.H5("Own Apartments"),
+        html.P(
+            """
+            Own apartment refers to homes that are inhabited by the owners. Residential property is property zoned
+            specifically for living or dwelling for individuals or households; it may include standalone 
+            single-family dwellings to large, multi-unit apartment buildings.
+            """
+        ),
+        dcc.Graph(
+            id='injected',
+            figure=sell_indicators,
+            config={'displayModeBar': False}
+        ),
+        html.P(
+            f"""
+            Indicators above demonstrate the Average buying price per square meter in {neighborhood} neighborhood
+            compared to the average price per square meter in Helsinki metropolitan region. 
+            Average price per square meter in {neighborhood} is {price_per_square:.2f}€. 
+            This means that the average price of a 30m² apartment will be approximately 
+            {(price_per_square * 35):.2f}€, 60m² apartment will cost {(price_per_square * 65):.2f}€ and 90m² 
+            apartment will cost {(price_per_square * 95):.2f}€. If there is not enough data on the neighborhood 
+            all values will be 0. Average square meters of the apartment can be used to compare the 
+            average size of the apartments in {neighborhood} to the average size of apartment is 
+            Helsinki metropolitan region. Note that In Finland, when you "buy an apartment" what 
+            you are actually buying are shares in a housing company (asunto-osakeyhtiö).
+            The amount of shares per apartment is proportional to the size of the apartment.
+            """
+        ),
+    ]
+
+    return children
+
+
+def render_sauna_index(area: AreaSnapshot) -> list:
+    """
+    Generates the graphs for sauna index section.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+
+    Returns:
+        children (list): List of html components to be displayed.
+    """
+    # Section title
+    section_title = "Sauna Index"
+
+    neighborhood = ""
+
+    # Data privacy check
+    if area.private:
+        return privacy_notice(section_title, neighborhood)
+
+    # Get number of saunas
+    number_of_saunas = area.listings.saunas(area.postal_code)
+
+    sauna = indicator_grid([
+        indicator(
+            number_of_saunas, f"Sauna Index{neighborhood}", "Number of known saunas in the area",
             number={'prefix': "#"},
-            title={"text": f"Sauna Index{neighborhood}<br><span style='font-size:0.8em;color:gray'>" +
-                           "Number of known saunas in the area</span><br>"},
-            )
-        )
-        
-        sauna.update_layout(
-            paper_bgcolor='#1E1E1E',
-            plot_bgcolor='#1E1E1E',
-            margin={"r": 0, "t": 0, "l": 0, "b": 0},
-            autosize=True,
-            font=dict(color="white")
-        )
-
-        children = [
-            html.H5(section_title),
-            html.P(
-                """
-                Dashmap Sauna index is a cutting edge urban metrics that highlights the number of available saunas 
-                in the postal code area. These are the saunas present in the apartments that are 
-                currently on the market. If leveraged properly this revolutionary metrics can boost your 
-                productivity and reduce stress.
-                """
-            ),
-            dcc.Graph(
-                id='injected',
-                figure=sauna,
-                config={'displayModeBar': False}
-            ),
-            html.P(
-                """
-                *This is an experimental metric. The actual number of saunas is dramatically higher!
-                However, due to limited availability of data a precise estimate cannot be made.
-                """
-            ),
-        ]
-
-        return children
+        ),
+    ])
+
+    children = [
+        html.H5(section_title),
+        html.P(
+            """
+            Dashmap Sauna index is a cutting edge urban metrics that highlights the number of available saunas 
+            in the postal code area. These are the saunas present in the apartments that are 
+            currently on the market. If leveraged properly this revolutionary metrics can boost your 
+            productivity and reduce stress.
+            """
+        ),
+        dcc.Graph(
+            id='injected',
+            figure=sauna,
+            config={'displayModeBar': False}
+        ),
+        html.P(
+            """
+            *This is an experimental metric. The actual number of saunas is dramatically higher!
+            However, due to limited availability of data a precise estimate cannot be made.
+            """
+        ),
+    ]
+
+    return children
+
+
+REAL_ESTATE_SECTIONS = {
+    'id_re_renting': render_rentals,
+    'id_re_owning': render_owned,
+    'id_re_sauna': render_sauna_index,
+}
+
+# Datasets read by the real estate sections, keys of DATASET_FILES
+REAL_ESTATE_DATASETS = ('datum', 'real_estate')
+
+
+# Scatter plots of the listings by deal type: upper price limit, colorscale and description
+LISTING_SCATTERS = {
+    'rent': (5000, 'OrYel', """
+            Scatterplots above illustrates the relationships between apartment square meters and monthly
+            rent in Helsinki Metropolitan area. The graph helps us understand how the change in apartment
+            square meters affects the monthly rent.
+            """),
+    'sell': (2000000, 'tealgrn', """
+            Scatterplots above illustrates the relationships between apartment square meters and apartment 
+            price in Helsinki Metropolitan area. The graph helps us understand how the change in apartment 
+            square meters affects the buying/selling price of the apartments.
+            """),
+}
+
+# Progress steps of render_listings
+LISTING_STEPS = 3
+
+
+def render_listings(area: AreaSnapshot, deal_type: str, set_progress: Optional[Callable] = None) -> list:
+    """
+    Generates the scatter plot of all listings of a deal type, with the listings of the clicked area highlighted.
+    Rendered in a background job, see callbacks/util/jobs.py.
+    ---
+    Args:
+        area (AreaSnapshot): clicked postal area
+        deal_type (str): 'rent' or 'sell'
+        set_progress (Callable): reports the finished steps out of LISTING_STEPS
+
+    Returns:
+        children (list): JSON form of the html components to be displayed.
+    """
+    set_progress = set_progress or (lambda step: None)
+    real_estate = area.data.real_estate
+    price_limit, colorscale_name, text = LISTING_SCATTERS[deal_type]
+
+    listings = real_estate[real_estate['deal_type'] == deal_type]
+    listings = listings[listings['price'] < price_limit]
+    listings = listings[listings['area'] < 310]
+    set_progress(1)
+
+    # The listings of private areas are not told apart
+    highlight = None
+    if not area.private:
+        local = listings[listings.index == area.postal_code]
+        highlight = (local['area'], local['price'])
+        text += f"Listings in {area.neighborhood} are highlighted in white."
+
+    scatter_chart = listing_scatter(
+        listings['area'], listings['price'], listings['rooms'], colorscale_name, highlight=highlight
+    )
+    set_progress(2)
+
+    children = to_plain([
+        dcc.Graph(id=f"listings-{deal_type}", figure=scatter_chart, config={'displayModeBar': False}),
+        html.P(text),
+    ])
+    set_progress(3)
+
+    return children
+
+
+# Panels rendered in background jobs, by id of the panel content
+REAL_ESTATE_PANELS = {
+    'id_re_owning_listings': lambda area, set_progress: render_listings(area, 'sell', set_progress),
+    'id_re_renting_listings': lambda area, set_progress: render_listings(area, 'rent', set_progress),
+}
+
+
+def init_re_callbacks(app: dash.Dash) -> None:
+    """
+    Initializes the background panels of the real estate tab.
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
+
+    Returns: None
+    """
+    for panel_id, render in REAL_ESTATE_PANELS.items():
+        init_background_panel_callback(app, panel_id, render)
@@ -0,0 +1,83 @@
+"""
+Postal area resolved once per map click.
+
+The click handler looks the clicked area up in the current data snapshot and passes the
+result to every section renderer, so the postal code, census row, privacy check and
+listing aggregates are read once per click instead of once per section. Together with
+the section id, the postal code and the version of the datasets a section reads key the
+rendered sections.
+"""
+import dataclasses
+
+import pandas as pd
+
+from .helpers import privacy_check
+from ...datasets.real_estate import RealEstateSnapshot
+from ...snapshot import DataSnapshot
+
+
+@dataclasses.dataclass(frozen=True)
+class AreaSnapshot:
+    """
+    Data of one postal area, and the snapshot it was read from.
+    """
+    postal_code: str
+    neighborhood: str
+    private: bool
+    row: pd.Series
+    mobility: pd.Series
+    data: DataSnapshot
+    listings: RealEstateSnapshot
+
+    def version(self, *datasets: str) -> str:
+        """
+        Version of the data the area is read from. The running listing aggregates are part of the
+        real estate dataset.
+        ---
+        Args:
+            datasets (str): datasets a section reads, keys of DATASET_FILES. All of them if none are named.
+
+        Returns:
+            (str): version of the datasets
+        """
+        return self.data.versions.key(*datasets) if datasets else self.data.versions.combined
+
+    def key(self, *datasets: str) -> str:
+        """
+        Identifies the area and the named datasets. Sections reading them rendered for the same key are the same.
+        """
+        return f"{self.postal_code}-{self.version(*datasets)}"
+
+    def summary(self) -> dict:
+        """
+        Compact JSON form of the area, published to the browser in the area-snapshot store.
+        """
+        return {
+            'postal_code': self.postal_code,
+            'neighborhood': self.neighborhood,
+            'private': self.private,
+            'version': self.version(),
+        }
+
+
+def build_area(data: DataSnapshot, postal_code: str) -> AreaSnapshot:
+    """
+    Reads a postal area from the datasets.
+    ---
+    Args:
+        data (DataSnapshot): datasets of the request
+        postal_code (str): Area postal code.
+
+    Returns:
+        (AreaSnapshot): the area
+    """
+    row = data.datum.loc[postal_code]
+    return AreaSnapshot(
+        postal_code=postal_code,
+        neighborhood=str(row.iloc[0]),
+        private=privacy_check(postal_code),
+        row=row,
+        mobility=data.mobility.loc[postal_code],
+        data=data,
+        listings=data.listings,
+    )
@@ -0,0 +1,206 @@
+"""
+Prerendered area sections.
+
+At build time every section of every postal area is rendered in a process pool and written as
+one brotli-compressed JSON file per area. A click is answered from the file of the area when the
+bundle was built from the data and code being served, and rendered live otherwise.
+
+Each build writes its files to a directory of its own and then replaces the manifest that points
+to it, so a rebuild never changes a file that is being served.
+"""
+import os
+import json
+import glob
+import shutil
+import hashlib
+import threading
+from functools import partial
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+import brotli
+
+from .area import AreaSnapshot, build_area
+from .cache import to_plain
+from ...snapshot import DataSnapshot, load_snapshot
+
+BUNDLE_DIR = 'website/data/panels'
+MANIFEST_FILE = 'manifest.json'
+
+# The dashmap package: the section renderers, the dataset loaders and the figure and layout templates
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def source_files(directory: str = SOURCE_DIR) -> list:
+    """
+    Python sources below a directory, sorted.
+    """
+    return sorted(glob.glob(os.path.join(directory, '**', '*.py'), recursive=True))
+
+
+def code_version(directory: str = SOURCE_DIR) -> str:
+    """
+    Hash of the source of the dashmap package, which the sections are rendered with.
+    A bundle built by other code is not used.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in source_files(directory):
+        digest.update(os.path.relpath(path, directory).encode())
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def encode(payload: dict) -> bytes:
+    return brotli.compress(json.dumps(payload, separators=(',', ':')).encode(), quality=11)
+
+
+def decode(data: bytes) -> dict:
+    return json.loads(brotli.decompress(data))
+
+
+def render_sections(snapshot: DataSnapshot, postal_code: str) -> tuple:
+    """
+    Renders all sections of a postal area.
+    ---
+    Args:
+        snapshot (DataSnapshot): datasets
+        postal_code (str): Area postal code.
+
+    Returns:
+        postal_code, version, data (str, str, bytes): area, its version and its compressed sections by id
+    """
+    # Imported here, the renderers import this module through the click handler
+    from ..area_callbacks import AREA_SECTIONS
+
+    area = build_area(snapshot, postal_code)
+    sections = {section_id: to_plain(render(area)) for section_id, render in AREA_SECTIONS.items()}
+    return postal_code, area.version(), encode(sections)
+
+
+_worker_snapshot: Optional[DataSnapshot] = None
+
+
+def _init_worker() -> None:
+    global _worker_snapshot
+    _worker_snapshot = load_snapshot()
+
+
+def _render_in_worker(postal_code: str) -> tuple:
+    return render_sections(_worker_snapshot, postal_code)
+
+
+def build_bundle(directory: str = BUNDLE_DIR, postal_codes: Optional[Iterable[str]] = None,
+                 jobs: Optional[int] = None) -> dict:
+    """
+    Prerenders the sections of the postal areas and replaces the bundle.
+    ---
+    Args:
+        directory (str): bundle directory
+        postal_codes (list): areas to render. All areas if None.
+        jobs (int): worker processes, the number of CPUs if None. 1 renders in this process.
+
+    Returns:
+        manifest (dict): version, renderer code version, section ids and compressed size of every area
+    """
+    from ..area_callbacks import AREA_SECTIONS
+
+    snapshot = load_snapshot()
+    postal_codes = list(snapshot.datum.index if postal_codes is None else postal_codes)
+
+    version = None
+    sizes = {}
+    staging = os.path.join(directory, f".staging-{os.getpid()}")
+    os.makedirs(staging, exist_ok=True)
+
+    with ExitStack() as stack:
+        if jobs == 1:
+            results = map(partial(render_sections, snapshot), postal_codes)
+        else:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker))
+            results = pool.map(_render_in_worker, postal_codes, chunksize=4)
+
+        for postal_code, area_version, data in results:
+            if version not in (None, area_version):
+                raise RuntimeError(f"Data changed while prerendering: {version} != {area_version}")
+            version = area_version
+            with open(os.path.join(staging, f"{postal_code}.json.br"), 'wb') as file:
+                file.write(data)
+            sizes[postal_code] = len(data)
+
+    target = os.path.join(directory, version)
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+
+    manifest = {
+        'version': version,
+        'code': code_version(),
+        'sections': list(AREA_SECTIONS),
+        'areas': sizes,
+    }
+    path = os.path.join(directory, MANIFEST_FILE)
+    with open(f"{path}.tmp", 'w') as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(f"{path}.tmp", path)
+
+    # Bundles of older versions are no longer referenced
+    for name in os.listdir(directory):
+        if name not in (version, MANIFEST_FILE) and os.path.isdir(os.path.join(directory, name)) \
+                and not name.startswith('.staging'):
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+    return manifest
+
+
+class PanelBundle:
+    """
+    Reader of the prerendered sections. The manifest is read again when it changes on disk.
+    """
+    def __init__(self, directory: str = BUNDLE_DIR):
+        self.directory = directory
+        self.code = code_version()
+        self._manifest = None
+        self._manifest_key = None
+        self._lock = threading.Lock()
+
+    def manifest(self) -> Optional[dict]:
+        """
+        Manifest of the current bundle, None if there is none or it was built by other code.
+        """
+        path = os.path.join(self.directory, MANIFEST_FILE)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key != self._manifest_key:
+                with open(path) as file:
+                    manifest = json.load(file)
+                self._manifest = manifest if manifest.get('code') == self.code else None
+                self._manifest_key = key
+            return self._manifest
+
+    def read(self, postal_code: str, version: str) -> Optional[bytes]:
+        """
+        Compressed sections of an area, None if the bundle has no sections of that version for it.
+        """
+        manifest = self.manifest()
+        if manifest is None or manifest['version'] != version or postal_code not in manifest['areas']:
+            return None
+        try:
+            with open(os.path.join(self.directory, version, f"{postal_code}.json.br"), 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def sections(self, area: AreaSnapshot) -> dict:
+        """
+        Prerendered sections of an area by id, empty on a miss.
+        """
+        data = self.read(area.postal_code, area.version())
+        return decode(data) if data is not None else {}
+
+
+PANEL_BUNDLE = PanelBundle()
@@ -0,0 +1,93 @@
+"""
+Bounded in-memory cache of rendered section outputs.
+
+Section outputs are pure functions of the postal area, the section and the data version,
+so they are kept in their JSON form and returned as is on a repeat click, without building
+the figures again.
+"""
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from plotly.io.json import to_json_plotly
+
+# Entries kept by the section cache, 0 disables it
+SECTION_CACHE_SIZE = int(os.environ.get('DASHMAP_SECTION_CACHE_SIZE', 1024))
+
+
+def to_plain(value) -> object:
+    """
+    JSON form of dash components and figures: dicts, lists and scalars only.
+    """
+    return json.loads(to_json_plotly(value))
+
+
+class LRUCache:
+    """
+    Least recently used cache with a maximum number of entries, safe to share between threads.
+    """
+    def __init__(self, max_entries: int = SECTION_CACHE_SIZE):
+        """
+        Args:
+            max_entries (int): entries kept before the least recently used one is evicted, 0 disables the cache
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], object]) -> object:
+        """
+        Cached value of a key, rendered and stored on a miss.
+        The value is rendered outside of the lock, concurrent misses of a key may both render it.
+        ---
+        Args:
+            key (Hashable): cache key
+            render (Callable): function returning the value, converted with to_plain before it is stored
+
+        Returns:
+            (object): JSON form of the value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = to_plain(render())
+        if self.max_entries <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Size and hit, miss and eviction counts of the cache.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
@@ -0,0 +1,240 @@
+"""
+Figures of the sections, built as plain dicts.
+
+go.Figure validates every property as it is set, and a section builds and updates several
+figures. Here figures are assembled from precompiled layouts of the dark theme instead and are
+not validated. Their JSON is the one of the equivalent go.Figure, see tests/test_figures.py.
+Set DASHMAP_VALIDATE_FIGURES=1 to pass every figure through go.Figure, which raises on an
+invalid property, e.g. while developing a section.
+"""
+import os
+from functools import lru_cache
+from typing import Optional
+
+import plotly.graph_objects as go
+
+from .cache import to_plain
+
+# Validate the figures with go.Figure
+VALIDATE_FIGURES = os.environ.get('DASHMAP_VALIDATE_FIGURES') == '1'
+
+BACKGROUND = '#1E1E1E'
+
+COLORS = [
+    '#4182C8', '#2E94B2',
+    '#39A791', '#6FB26C',
+    '#C0C15C', '#F9BD24',
+    '#F3903F', '#EC6546',
+    '#7D4C94', '#5B61AE'
+]
+
+# Default template that go.Figure adds to every layout. Shared by all figures, never modified.
+PLOTLY_TEMPLATE = to_plain(go.Figure())['layout']['template']
+
+# Pie, bar, polar and line charts
+CHART_LAYOUT = {
+    'font': {'size': 14, 'color': '#fff'},
+    'paper_bgcolor': BACKGROUND,
+    'plot_bgcolor': BACKGROUND,
+    'margin': {'r': 30, 't': 30, 'l': 30, 'b': 30},
+    'autosize': True,
+}
+
+# Grids of number indicators
+INDICATOR_LAYOUT = {
+    'paper_bgcolor': BACKGROUND,
+    'plot_bgcolor': BACKGROUND,
+    'margin': {'r': 0, 't': 0, 'l': 0, 'b': 0},
+    'autosize': True,
+    'font': {'color': 'white'},
+}
+
+# Scatter plots of the listings
+SCATTER_LAYOUT = {
+    'showlegend': False,
+    'paper_bgcolor': BACKGROUND,
+    'plot_bgcolor': BACKGROUND,
+    'margin': {'r': 50, 't': 50, 'l': 50, 'b': 50},
+    'autosize': True,
+    'xaxis': {'color': '#fff', 'gridcolor': '#D3D3D3'},
+    'yaxis': {'color': '#fff', 'gridcolor': '#D3D3D3'},
+}
+
+# Legend below a chart
+BOTTOM_LEGEND = {'orientation': 'h', 'yanchor': 'bottom', 'y': -0.25, 'xanchor': 'center', 'x': 0.5}
+
+
+def merge(base: dict, update: dict) -> dict:
+    """
+    Copy of a layout with the properties of another one set on it, nested dicts are merged.
+    ---
+    Args:
+        base (dict): template, left unchanged
+        update (dict): properties to set
+
+    Returns:
+        (dict): merged layout
+    """
+    merged = dict(base)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=None)
+def colorscale(name: str) -> list:
+    """
+    Named colorscale as the color stops go.Figure expands it to, computed once per name.
+    """
+    return to_plain(go.scattergl.Marker(colorscale=name))['colorscale']
+
+
+def figure(data: list, layout: dict) -> dict:
+    """
+    Figure of traces and a layout, validated with go.Figure if VALIDATE_FIGURES is set.
+    ---
+    Args:
+        data (list): trace dicts, each with its type
+        layout (dict): layout without template
+
+    Returns:
+        (dict): figure with data and layout
+    """
+    fig = {'data': data, 'layout': {'template': PLOTLY_TEMPLATE, **layout}}
+    if VALIDATE_FIGURES:
+        return to_plain(go.Figure(fig))
+    return fig
+
+
+def chart(data: list, **layout) -> dict:
+    """
+    Figure on the chart layout of the dark theme.
+    ---
+    Args:
+        data (list): trace dicts, each with its type
+        **layout: layout properties set on CHART_LAYOUT
+
+    Returns:
+        (dict): figure
+    """
+    return figure(data, merge(CHART_LAYOUT, layout))
+
+
+def pie(labels: list, values: list, hole: float, legend: dict, showlegend: bool = True,
+        hoverinfo: str = 'label+percent+value', colors: list = COLORS) -> dict:
+    """
+    Pie or donut chart.
+    ---
+    Args:
+        labels (list): slice labels
+        values (list): slice values
+        hole (float): fraction of the radius cut out of the middle, 0 for a pie
+        legend (dict): legend position
+        showlegend (bool): show the legend
+        hoverinfo (str): hover label contents
+        colors (list): slice colors
+
+    Returns:
+        (dict): figure
+    """
+    trace = {
+        'type': 'pie',
+        'labels': labels,
+        'values': values,
+        'hole': hole,
+        'hoverinfo': hoverinfo,
+        'marker': {'colors': colors, 'line': {'color': BACKGROUND, 'width': 2}},
+    }
+    return chart([trace], showlegend=showlegend, legend=legend)
+
+
+def indicator(value: float, title: str, subtitle: str, domain: Optional[dict] = None,
+              number: Optional[dict] = None, delta: Optional[dict] = None, mode: str = 'number') -> dict:
+    """
+    Number indicator trace with a title and a gray subtitle.
+    ---
+    Args:
+        value (float): shown number
+        title (str): title above the number
+        subtitle (str): description below the title
+        domain (dict): position in the figure, the whole figure if None
+        number (dict): number format, e.g. prefix, suffix and font
+        delta (dict): reference value to show the difference to
+        mode (str): indicator mode
+
+    Returns:
+        (dict): trace
+    """
+    trace = {
+        'type': 'indicator',
+        'mode': mode,
+        'value': value,
+        'title': {'text': f"{title}<br><span style='font-size:0.8em;color:gray'>{subtitle}</span><br>"},
+    }
+    if number is not None:
+        trace['number'] = number
+    if domain is not None:
+        trace['domain'] = domain
+    if delta is not None:
+        trace['delta'] = delta
+    return trace
+
+
+def indicator_grid(indicators: list) -> dict:
+    """
+    Figure of number indicators.
+    ---
+    Args:
+        indicators (list): indicator traces
+
+    Returns:
+        (dict): figure
+    """
+    return figure(indicators, INDICATOR_LAYOUT)
+
+
+def listing_scatter(x: object, y: object, rooms: object, colorscale_name: str,
+                    highlight: Optional[tuple] = None) -> dict:
+    """
+    Scatter plot of the listings by area and price, colored by the number of rooms.
+    ---
+    Args:
+        x (array-like): area of the listings
+        y (array-like): price of the listings
+        rooms (array-like): rooms of the listings
+        colorscale_name (str): name of the colorscale
+        highlight (tuple): optional (x, y) of listings drawn in white on top of the others
+
+    Returns:
+        (dict): figure
+    """
+    hovertemplate = '<b>Price</b>: €%{y:.2f}<br><b>Area</b>: %{x}m²<br>'
+    trace = {
+        'type': 'scattergl',
+        'x': x,
+        'y': y,
+        'mode': 'markers',
+        'hovertemplate': hovertemplate,
+        'marker': {
+            'size': 8,
+            'color': rooms,
+            'colorscale': colorscale(colorscale_name),
+            'showscale': True,
+            'line': {'color': BACKGROUND, 'width': 3},
+        },
+    }
+    data = [trace]
+
+    if highlight is not None:
+        data.append({
+            'type': 'scattergl',
+            'x': highlight[0],
+            'y': highlight[1],
+            'mode': 'markers',
+            'hovertemplate': hovertemplate,
+            'marker': {'size': 9, 'color': '#fff', 'line': {'color': BACKGROUND, 'width': 1}},
+        })
+    return figure(data, SCATTER_LAYOUT)
@@ -1,5 +1,5 @@
 from dash import html
-from dash.dependencies import Input, Output, State
+from dash.dependencies import ClientsideFunction, Input, Output, State
 
 
 def get_postal_code(click_data: dict) -> str:
@@ -74,24 +74,16 @@ def privacy_notice(section_title: str, neighborhood: str) -> list:
 
 def init_modal_popup(app):
     """
+    Toggles the help modal in the browser with a clientside callback, see assets/clientside.js.
+    ---
+    Args:
+        app (dash.Dash): Dash application to which the callback is registered to.
+
+    Returns: None
     """
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace='modal', function_name='toggle'),
         Output("help-modal-centered", "is_open"),
         [Input("help-open-centered", "n_clicks"), Input("help-close-centered", "n_clicks")],
         [State("help-modal-centered", "is_open")],
     )
-    def toggle_modal(n1: str, n2: str, is_open: bool):
-        """
-        Toggle modal pop-ups.
-        ---
-        Args:
-            n1 (str): id of the trigger button
-            n2 (str): id of the trigger button
-            is_open (bool): Current state of the modal. True for Open, False otherwise.
-
-        Returns:
-            is_open (bool): True for Open, False otherwise. Default value is False.
-        """
-        if n1 or n2:
-            return not is_open
-        return is_open
@@ -0,0 +1,111 @@
+"""
+Background jobs of the expensive panels.
+
+A background panel is rendered in a worker process instead of the request thread. Its callback is
+registered with background=True on the job queue of dash.DiskcacheManager, which keeps the jobs,
+their progress and results in a disk cache shared by the processes of the server. The request
+returns a job at once, the browser shows the placeholder of the panel (init_background_panel in
+layouts/templates/templates.py) and polls the job for its progress and result. A new request of
+the panel, e.g. after a click on another area, terminates the job it supersedes. Finished results
+stay in the cache by postal code and the version of the datasets the panels read, and are answered
+on the first poll.
+"""
+import os
+from typing import Callable
+
+import dash
+import diskcache
+from dash import DiskcacheManager
+from dash.dependencies import ALL, ClientsideFunction, Input, Output, State
+
+from .area import build_area
+from ...layouts.templates.templates import ACCORDION_COLLAPSE, PANEL_REQUEST, panel_request_id
+from ...snapshot import current_snapshot
+
+# Disk cache of the jobs and results, shared by the processes of a server
+JOB_DIR = os.environ.get('DASHMAP_JOB_DIR', 'website/data/.cache/jobs')
+
+# Seconds a finished result is kept after it was last read
+JOB_EXPIRE = int(os.environ.get('DASHMAP_JOB_EXPIRE', 24 * 3600))
+
+# Milliseconds between the polls of a running job
+POLL_INTERVAL = 250
+
+# Datasets read by the background panels, keys of DATASET_FILES
+PANEL_DATASETS = ('datum', 'real_estate')
+
+PLACEHOLDER_SHOWN = {'display': 'block'}
+PLACEHOLDER_HIDDEN = {'display': 'none'}
+
+
+def data_version() -> str:
+    """
+    Version of the datasets the panels are rendered from, part of the key of every cached result.
+    Results stay valid when only other datasets change.
+    """
+    return current_snapshot().versions.key(*PANEL_DATASETS)
+
+
+def init_job_manager(directory: str = JOB_DIR, expire: int = JOB_EXPIRE) -> DiskcacheManager:
+    """
+    Job queue of the background panels. Results are keyed by the request and the data version.
+    ---
+    Args:
+        directory (str): directory of the disk cache
+        expire (int): seconds a result is kept after it was last read
+
+    Returns:
+        (DiskcacheManager): background callback manager of the app
+    """
+    return DiskcacheManager(diskcache.Cache(directory), cache_by=[data_version], expire=expire)
+
+
+def init_panel_requests(app: dash.Dash) -> None:
+    """
+    Requests every background panel in the page for the clicked area while its accordion group is open,
+    see panels.request in assets/clientside.js. A panel showing the area is not requested again.
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
+
+    Returns: None
+    """
+    # Panels and collapses are matched with ALL, only those of the tabs loaded into the page take part
+    app.clientside_callback(
+        ClientsideFunction(namespace='panels', function_name='request'),
+        Output({'type': PANEL_REQUEST, 'index': ALL}, 'data'),
+        Input('area-snapshot', 'data'),
+        Input({'type': ACCORDION_COLLAPSE, 'index': ALL}, 'is_open'),
+        State({'type': PANEL_REQUEST, 'index': ALL}, 'data'),
+    )
+
+
+def init_background_panel_callback(app: dash.Dash, panel_id: str, render: Callable) -> None:
+    """
+    Renders a background panel in a job for every request of an area.
+    ---
+    Args:
+        app (dash.Dash): Main dash app to which callbacks are registered.
+        panel_id (str): id of the panel content
+        render (Callable): render(area, set_progress) returning the children of the panel,
+            set_progress(step) reports the finished steps to the progress bar of the placeholder
+
+    Returns: None
+    """
+    @app.callback(
+        Output(panel_id, 'children'),
+        Input(panel_request_id(panel_id), 'data'),
+        background=True,
+        running=[(Output(f"{panel_id}-placeholder", 'style'), PLACEHOLDER_SHOWN, PLACEHOLDER_HIDDEN)],
+        progress=[Output(f"{panel_id}-progress", 'value')],
+        progress_default=[0],
+        interval=POLL_INTERVAL,
+        # The panels share this function, the triggering request tells their results apart
+        cache_ignore_triggered=False,
+        prevent_initial_call=True)
+    def display_panel(set_progress: Callable, request: dict) -> list:
+        if not request or not request.get('postal_code'):
+            raise dash.exceptions.PreventUpdate
+
+        area = build_area(current_snapshot(), request['postal_code'])
+        return render(area, set_progress)
@@ -0,0 +1,94 @@
+"""
+Partial updates of the sections.
+
+A section shows the same components for every postal area: titles, static paragraphs, graphs
+and the figure templates. Only some numbers, arrays and sentences differ. When a section shows
+one area and another one is clicked, the difference of their children is sent as a dash.Patch,
+which the browser applies to the children it has.
+"""
+import math
+from typing import Any, List, Tuple
+
+from dash import Patch
+
+# Value of the operations that remove a key
+DELETE = object()
+
+
+def is_leaf(value: Any) -> bool:
+    """
+    Values replaced as a whole: scalars and lists of scalars, like the data arrays of a trace.
+    """
+    if isinstance(value, dict):
+        return False
+    if isinstance(value, list):
+        return not any(isinstance(item, (dict, list)) for item in value)
+    return True
+
+
+def same(old: Any, new: Any) -> bool:
+    return old == new or (isinstance(old, float) and isinstance(new, float) and math.isnan(old) and math.isnan(new))
+
+
+def diff(old: Any, new: Any, location: tuple = ()) -> List[Tuple[tuple, Any]]:
+    """
+    Operations that turn the JSON form of a value into another one.
+    ---
+    Args:
+        old (Any): JSON form shown by the browser
+        new (Any): JSON form to show
+        location (tuple): keys and indices of the values within the property
+
+    Returns:
+        operations (list): (location, value) pairs, the value is DELETE for removed keys
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations = [(location + (key,), DELETE) for key in old if key not in new]
+        for key, value in new.items():
+            if key in old:
+                operations += diff(old[key], value, location + (key,))
+            else:
+                operations.append((location + (key,), value))
+        return operations
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new) \
+            and not (is_leaf(old) and is_leaf(new)):
+        operations = []
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            operations += diff(old_item, new_item, location + (i,))
+        return operations
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new) \
+            and all(same(old_item, new_item) for old_item, new_item in zip(old, new)):
+        return []
+
+    if isinstance(old, list) or isinstance(new, list) or not same(old, new):
+        return [(location, new)]
+    return []
+
+
+def patch_children(old: list, new: list) -> object:
+    """
+    Update of a section showing old to show new.
+    ---
+    Args:
+        old (list): JSON form of the children shown by the browser
+        new (list): JSON form of the children to show
+
+    Returns:
+        (object): dash.Patch of the changes, or new when they replace the children as a whole
+    """
+    operations = diff(old, new)
+    if any(not location for location, _ in operations):
+        return new
+
+    patch = Patch()
+    for location, value in operations:
+        target = patch
+        for key in location[:-1]:
+            target = target[key]
+        if value is DELETE:
+            del target[location[-1]]
+        else:
+            target[location[-1]] = value
+    return patch
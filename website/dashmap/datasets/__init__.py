@@ -0,0 +1,3 @@
+"""
+Datasets served by the dash app and the build steps that produce them.
+"""
@@ -0,0 +1,140 @@
+"""
+Hourly air quality series with zoom-aware downsampling.
+
+The series are built by website/data/environment/air-quality/data_cleaner.py
+and kept in memory as typed arrays. A query returns at most as many points as the
+chart has pixels, picked with Largest-Triangle-Three-Buckets so that peaks survive.
+The browser reports the plotted width of the chart with its visible range.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+SERIES_PATH = 'website/data/environment/air-quality/air_quality_series.npz'
+
+# Points of a query when the width of the chart is not known yet
+DEFAULT_POINTS = 600
+
+# Bounds of the points of a query, whatever width the browser reports
+MIN_POINTS, MAX_POINTS = 100, 4000
+
+# Series drawn in the air pollution chart, with their legend names
+PLOTTED_SERIES = {
+    'Nitrogen dioxide (ug/m3)': 'NO2',
+    'Nitrogen monoxide (ug/m3)': 'NO',
+    'Particulate matter < 10 µm (ug/m3)': 'PM10',
+    'Particulate matter < 2.5 µm (ug/m3)': 'PM2.5',
+}
+
+
+def chart_points(width: Optional[float]) -> int:
+    """
+    Points of a query for a chart of a width in pixels, one point per pixel.
+    ---
+    Args:
+        width (float): plotted width of the chart, None if unknown
+
+    Returns:
+        (int): maximum number of points per series
+    """
+    if not width:
+        return DEFAULT_POINTS
+    return int(min(max(int(width), MIN_POINTS), MAX_POINTS))
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    ---
+    Args:
+        x (np.ndarray): sorted x values
+        y (np.ndarray): y values without NaNs
+        n_out (int): number of points to keep
+
+    Returns:
+        (np.ndarray): positions of the kept points, first and last included
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+
+    # Inner points are split into n_out - 2 buckets, the end points are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+
+        # Average of the next bucket, or the last point for the final bucket
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+            next_x, next_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        prev_x, prev_y = x[kept[bucket]], y[kept[bucket]]
+        areas = np.abs(
+            (prev_x - next_x) * (y[start:stop] - prev_y) - (prev_x - x[start:stop]) * (next_y - prev_y)
+        )
+        kept[bucket + 1] = start + int(np.argmax(areas))
+
+    return kept
+
+
+class AirQualitySeries:
+    """
+    Hourly measurements of all years as epoch seconds and float32 columns.
+    """
+    def __init__(self, time: np.ndarray, names: np.ndarray, values: np.ndarray):
+        self.time = time
+        self.names = [str(name) for name in names]
+        self.values = values
+
+    @classmethod
+    def load(cls, path: str = SERIES_PATH) -> 'AirQualitySeries':
+        with np.load(path) as archive:
+            return cls(archive['time'], archive['names'], archive['values'])
+
+    @property
+    def start(self) -> np.datetime64:
+        return self.time[0].astype('datetime64[s]')
+
+    @property
+    def end(self) -> np.datetime64:
+        return self.time[-1].astype('datetime64[s]')
+
+    def query(self, start: Optional[np.datetime64] = None, end: Optional[np.datetime64] = None,
+              points: int = DEFAULT_POINTS) -> Dict[str, tuple]:
+        """
+        Downsampled series of a time window.
+        ---
+        Args:
+            start (np.datetime64): start of the window. Start of the data if None.
+            end (np.datetime64): end of the window. End of the data if None.
+            points (int): maximum number of points per series
+
+        Returns:
+            (dict): series name -> (timestamps as datetime64[s], values)
+        """
+        first = 0 if start is None else np.searchsorted(self.time, self._seconds(start), side='left')
+        last = len(self.time) if end is None else np.searchsorted(self.time, self._seconds(end), side='right')
+
+        # One point of margin on both sides so that lines reach the edges of the window
+        first, last = max(first - 1, 0), min(last + 1, len(self.time))
+        time = self.time[first:last]
+
+        result = {}
+        for name, values in zip(self.names, self.values[:, first:last]):
+            valid = ~np.isnan(values)
+            x, y = time[valid], values[valid]
+            kept = lttb(x, y, points)
+            result[name] = (x[kept].astype('datetime64[s]'), y[kept])
+        return result
+
+    @staticmethod
+    def _seconds(timestamp) -> int:
+        return int(np.datetime64(timestamp, 's').astype(np.int64))
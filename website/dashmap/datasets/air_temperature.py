@@ -0,0 +1,42 @@
+"""
+Precomputed air temperature climatology.
+
+The climatology is built by website/data/environment/air-temperature-wind/data_cleaner.py
+from the daily mean temperatures of all years. It holds the mean and 10/50/90th percentiles
+per day of year and per month, and the anomaly of the latest year, so the panel only reads arrays.
+"""
+import numpy as np
+import pandas as pd
+
+CLIMATOLOGY_PATH = 'website/data/environment/air-temperature-wind/air_temp_climatology.npz'
+
+PERCENTILES = [10, 50, 90]
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+class Climatology:
+    """
+    Day of year (366, leap year calendar) and month (12) statistics of daily mean temperatures.
+    """
+    def __init__(self, arrays: dict):
+        self.years = [int(year) for year in arrays['years']]
+        self.current_year = int(arrays['current_year'])
+        self.doy = {key[4:]: arrays[key] for key in arrays if key.startswith('doy_')}
+        self.month = {key[6:]: arrays[key] for key in arrays if key.startswith('month_')}
+        self.current_doy = arrays['current_doy']
+        self.current_month = arrays['current_month']
+
+        # Dates of the day of year axis, in a leap year so that every day has a position
+        self.dates = pd.date_range('2000-01-01', periods=366, freq='D')
+
+    @classmethod
+    def load(cls, path: str = CLIMATOLOGY_PATH) -> 'Climatology':
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def band(self, low: int = 10, high: int = 90) -> tuple:
+        """
+        Lower and upper percentile of each day of year.
+        """
+        return self.doy[f'p{low}'], self.doy[f'p{high}']
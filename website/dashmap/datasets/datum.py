@@ -0,0 +1,96 @@
+"""
+Postal area geometries and PAAVO attributes, stored apart.
+
+The datum build writes the polygons as a geometry-only GeoJSON with the postal code as
+feature id, and the PAAVO attributes as a columnar table joined by the same postal code.
+The map reads only the geometries and the panels only the attributes.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+
+AREAS_PATH = 'website/data/datum/areas.geojson'
+ATTRIBUTES_PATH = 'website/data/datum/attributes.npz'
+
+
+def save_areas(areas: gpd.GeoSeries, path: str = AREAS_PATH) -> None:
+    """
+    Writes the polygons as a FeatureCollection without properties, the postal code as feature id.
+    ---
+    Args:
+        areas (gpd.GeoSeries): polygons in WGS84 indexed by postal code
+        path (str): GeoJSON file
+    """
+    with open(path, 'w') as file:
+        file.write(areas.to_json())
+
+
+def load_areas(path: str = AREAS_PATH) -> dict:
+    """
+    Loads the polygons as GeoJSON, ready for the `geojson` of a choropleth trace.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def load_area_geometries(path: str = AREAS_PATH) -> gpd.GeoDataFrame:
+    """
+    Loads the polygons for geometry operations.
+    ---
+    Args:
+        path (str): geometry-only GeoJSON written by save_areas
+
+    Returns:
+        (gpd.GeoDataFrame): polygons in WGS84 indexed by postal code
+    """
+    areas = load_areas(path)
+    return gpd.GeoDataFrame.from_features(areas, crs='EPSG:4326').set_index(
+        pd.Index([feature['id'] for feature in areas['features']], name='postal_code')
+    )
+
+
+def to_columns(attributes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Gives every attribute column that is numeric in all areas a numeric dtype.
+    Columns with missing value markers such as '..' keep their text.
+    """
+    columns = {}
+    for name in attributes.columns:
+        numbers = pd.to_numeric(attributes[name], errors='coerce')
+        columns[name] = attributes[name] if numbers.isna().any() else numbers
+    return pd.DataFrame(columns, index=attributes.index)
+
+
+def save_attributes(attributes: pd.DataFrame, path: str = ATTRIBUTES_PATH) -> None:
+    """
+    Writes the attribute table as a compressed numpy archive with one array per column,
+    in column order after a `postal_code` array.
+    """
+    arrays = {'postal_code': attributes.index.to_numpy(dtype=str)}
+    for name in attributes.columns:
+        column = attributes[name]
+        arrays[name] = column.to_numpy(dtype=str) if column.dtype == object else column.to_numpy()
+    np.savez_compressed(path, **arrays)
+
+
+def load_attributes(path: str = ATTRIBUTES_PATH) -> pd.DataFrame:
+    """
+    Loads the attribute table.
+    ---
+    Args:
+        path (str): archive written by save_attributes
+
+    Returns:
+        (pd.DataFrame): PAAVO attributes indexed by postal code, in the column order of the census
+    """
+    with np.load(path) as archive:
+        columns = {name: archive[name] for name in archive.files}
+
+    index = pd.Index(columns.pop('postal_code').astype(object), name='postal_code')
+    attributes = pd.DataFrame(columns, index=index)
+    for name in attributes.columns:
+        if attributes[name].dtype.kind == 'U':
+            attributes[name] = attributes[name].astype(object)
+    return attributes
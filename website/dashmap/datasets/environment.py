@@ -0,0 +1,266 @@
+"""
+Time-aligned environment store.
+
+Wind (10 minute), air temperature (hourly) and air quality (hourly) observations are aligned
+on one hourly UTC index at build time: wind is resampled to hourly means and the hourly series
+are joined as of the nearest hour. The aligned table is stored column by column together with
+the mean of every pollutant by wind direction and by air temperature, so that panels relating
+the series only read small arrays.
+"""
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .wind import DIRECTIONS
+
+WIND_PATH = 'website/data/environment/air-temperature-wind/raw_wind.csv'
+TEMPERATURE_PATH = 'website/data/environment/air-temperature-wind/raw_air_temp.csv'
+AIR_QUALITY_PATH = 'website/data/environment/air-quality/air_quality_2020.csv'
+STORE_PATH = 'website/data/environment/environment_store.npz'
+
+FREQUENCY = '1h'
+
+# Hourly observations further than this from an hour of the index are not joined to it
+TOLERANCE = pd.Timedelta('30min')
+
+WIND_SPEED = 'Wind speed (m/s)'
+WIND_DIRECTION = 'Wind direction (deg)'
+TEMPERATURE = 'Air temperature (degC)'
+
+# 2 degC bins of the pollutant means by air temperature
+TEMPERATURE_EDGES = np.arange(-30.0, 36.0, 2.0)
+
+KEY_COLUMNS = ['Year', 'm', 'd', 'Time', 'Time zone']
+
+
+def read_observations(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Reads an FMI observation file.
+    ---
+    Args:
+        path (str): CSV with Year, m, d, Time and Time zone (UTC) columns
+        columns (list): value columns to read. All non-empty value columns if None.
+
+    Returns:
+        (pd.DataFrame): values indexed by timestamp, sorted
+    """
+    df = pd.read_csv(path, usecols=None if columns is None else KEY_COLUMNS[:4] + columns)
+    if columns is None:
+        df = df.dropna(axis=1, how='all')
+        columns = [column for column in df.columns if column not in KEY_COLUMNS]
+
+    time = pd.to_datetime(
+        df['Year'].astype(str) + '-' + df['m'].astype(str) + '-' + df['d'].astype(str) + ' ' + df['Time'],
+        format='%Y-%m-%d %H:%M',
+    )
+    return df[columns].set_index(pd.DatetimeIndex(time, name='time')).sort_index()
+
+
+def hourly_wind(wind: pd.DataFrame) -> pd.DataFrame:
+    """
+    Hourly mean wind speed and mean wind direction. Directions are averaged as unit vectors,
+    so that 350° and 10° average to north and not to south.
+    """
+    radians = np.deg2rad(wind[WIND_DIRECTION].to_numpy(dtype=float))
+    vectors = pd.DataFrame({
+        'u': np.sin(radians),
+        'v': np.cos(radians),
+        'speed': wind[WIND_SPEED].to_numpy(dtype=float),
+    }, index=wind.index).dropna()
+
+    hourly = vectors.resample(FREQUENCY).mean().dropna()
+    return pd.DataFrame({
+        WIND_SPEED: hourly['speed'],
+        WIND_DIRECTION: np.rad2deg(np.arctan2(hourly['u'], hourly['v'])) % 360,
+    }, index=hourly.index)
+
+
+def join_as_of(index: pd.DatetimeIndex, frame: pd.DataFrame, tolerance: pd.Timedelta = TOLERANCE) -> pd.DataFrame:
+    """
+    Values of the observation nearest to every timestamp of the index, NaN if none is within tolerance.
+    """
+    joined = pd.merge_asof(
+        pd.DataFrame({'time': index}),
+        frame.rename_axis('time').reset_index(),
+        on='time',
+        direction='nearest',
+        tolerance=tolerance,
+    )
+    return joined.set_index('time')
+
+
+def align(wind: pd.DataFrame, temperature: pd.DataFrame, air_quality: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aligns the observations on an hourly index covering all of them.
+    The air temperature of the wind file fills the hours the temperature file has no value for.
+    ---
+    Args:
+        wind (pd.DataFrame): 10 minute wind speed, direction and air temperature
+        temperature (pd.DataFrame): hourly air temperature
+        air_quality (pd.DataFrame): hourly pollutant concentrations
+
+    Returns:
+        (pd.DataFrame): float32 columns indexed by hour, hours without any value dropped
+    """
+    fallback = wind[[TEMPERATURE]].dropna().resample(FREQUENCY).mean().dropna()
+    temperature = temperature[[TEMPERATURE]].dropna()
+    temperature = pd.concat([temperature, fallback[~fallback.index.isin(temperature.index)]]).sort_index()
+
+    wind = hourly_wind(wind)
+    sources = [frame for frame in (wind, temperature, air_quality) if len(frame)]
+    index = pd.date_range(
+        min(frame.index[0] for frame in sources).floor(FREQUENCY),
+        max(frame.index[-1] for frame in sources).ceil(FREQUENCY),
+        freq=FREQUENCY,
+        name='time',
+    )
+
+    aligned = pd.concat(
+        [wind.reindex(index), join_as_of(index, temperature), join_as_of(index, air_quality)],
+        axis=1,
+    )
+    return aligned.dropna(how='all').astype(np.float32)
+
+
+def direction_index(degrees: np.ndarray) -> np.ndarray:
+    """
+    Index of the 16-point compass direction (N, NNE, NE ... NNW) of directions in degrees.
+    """
+    return np.floor((np.asarray(degrees) + 11.25) / 22.5).astype(int) % 16
+
+
+def conditional_means(keys: np.ndarray, n_groups: int, values: np.ndarray) -> tuple:
+    """
+    Count and mean of every value column per group, over the rows where both key and value are known.
+    ---
+    Args:
+        keys (np.ndarray): group of every row, -1 where unknown
+        n_groups (int): number of groups
+        values (np.ndarray): values of shape (rows, columns) with NaN gaps
+
+    Returns:
+        counts, means (np.ndarray): uint32 and float32 arrays of shape (columns, n_groups)
+    """
+    counts = np.zeros((values.shape[1], n_groups), dtype=np.uint32)
+    sums = np.zeros((values.shape[1], n_groups))
+    for column in range(values.shape[1]):
+        valid = (keys >= 0) & ~np.isnan(values[:, column])
+        counts[column] = np.bincount(keys[valid], minlength=n_groups)
+        sums[column] = np.bincount(keys[valid], weights=values[valid, column], minlength=n_groups)
+
+    means = np.divide(sums, counts, out=np.full(sums.shape, np.nan), where=counts > 0)
+    return counts, means.astype(np.float32)
+
+
+def store_arrays(aligned: pd.DataFrame, pollutants: List[str]) -> dict:
+    """
+    Arrays of the environment store: the aligned columns and the pollutant means by
+    wind direction and by air temperature bin.
+    ---
+    Args:
+        aligned (pd.DataFrame): output of align
+        pollutants (list): columns aggregated by wind direction and air temperature
+
+    Returns:
+        (dict): arrays by name
+    """
+    values = aligned[pollutants].to_numpy(dtype=np.float64)
+
+    directions = aligned[WIND_DIRECTION].to_numpy(dtype=float)
+    direction_keys = np.where(np.isnan(directions), -1, direction_index(np.nan_to_num(directions)))
+    direction_count, direction_mean = conditional_means(direction_keys, len(DIRECTIONS), values)
+
+    temperatures = aligned[TEMPERATURE].to_numpy(dtype=float)
+    n_bins = len(TEMPERATURE_EDGES) - 1
+    temperature_keys = np.searchsorted(TEMPERATURE_EDGES, temperatures, side='right') - 1
+    temperature_keys[np.isnan(temperatures) | (temperature_keys >= n_bins)] = -1
+    temperature_count, temperature_mean = conditional_means(temperature_keys, n_bins, values)
+
+    return {
+        'time': aligned.index.to_numpy().astype('datetime64[s]').astype(np.int64),
+        'names': np.array(aligned.columns, dtype=str),
+        'values': aligned.to_numpy(dtype=np.float32).T,
+        'pollutants': np.array(pollutants, dtype=str),
+        'direction_count': direction_count,
+        'direction_mean': direction_mean,
+        'temperature_edges': TEMPERATURE_EDGES,
+        'temperature_count': temperature_count,
+        'temperature_mean': temperature_mean,
+    }
+
+
+def build_environment(wind_path: str = WIND_PATH, temperature_path: str = TEMPERATURE_PATH,
+                      air_quality_path: str = AIR_QUALITY_PATH, path: Optional[str] = STORE_PATH) -> pd.DataFrame:
+    """
+    Builds the environment store.
+    ---
+    Args:
+        wind_path (str): raw FMI wind observations
+        temperature_path (str): raw FMI air temperature observations
+        air_quality_path (str): hourly air quality observations
+        path (str): where the store is written. Not written if None.
+
+    Returns:
+        aligned (pd.DataFrame): hourly table of all series
+    """
+    air_quality = read_observations(air_quality_path)
+    aligned = align(
+        read_observations(wind_path, [TEMPERATURE, WIND_DIRECTION, WIND_SPEED]),
+        read_observations(temperature_path, [TEMPERATURE]),
+        air_quality,
+    )
+
+    if path:
+        np.savez_compressed(path, **store_arrays(aligned, list(air_quality.columns)))
+    return aligned
+
+
+class EnvironmentStore:
+    """
+    Hourly wind, air temperature and air quality columns on one time index,
+    with the pollutant means by wind direction and air temperature.
+    """
+    def __init__(self, arrays: dict):
+        self.time = arrays['time']
+        self.names = [str(name) for name in arrays['names']]
+        self.values = arrays['values']
+        self.pollutants = [str(name) for name in arrays['pollutants']]
+        self.temperature_edges = arrays['temperature_edges']
+        self.aggregates = {
+            'direction': (arrays['direction_count'], arrays['direction_mean']),
+            'temperature': (arrays['temperature_count'], arrays['temperature_mean']),
+        }
+
+    @classmethod
+    def load(cls, path: str = STORE_PATH) -> 'EnvironmentStore':
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        The aligned table, or some of its columns, indexed by hour.
+        """
+        columns = columns or self.names
+        return pd.DataFrame(
+            {name: self.values[self.names.index(name)] for name in columns},
+            index=pd.DatetimeIndex(self.time.astype('datetime64[s]'), name='time'),
+        )
+
+    def by_direction(self, pollutant: str) -> pd.DataFrame:
+        """
+        Mean and number of hourly values of a pollutant by 16-point wind direction.
+        """
+        return self._aggregate('direction', pollutant, DIRECTIONS)
+
+    def by_temperature(self, pollutant: str) -> pd.DataFrame:
+        """
+        Mean and number of hourly values of a pollutant by air temperature bin, indexed by bin centre.
+        """
+        edges = self.temperature_edges
+        return self._aggregate('temperature', pollutant, (edges[:-1] + edges[1:]) / 2)
+
+    def _aggregate(self, condition: str, pollutant: str, index) -> pd.DataFrame:
+        counts, means = self.aggregates[condition]
+        i = self.pollutants.index(pollutant)
+        return pd.DataFrame({'mean': means[i], 'count': counts[i]}, index=index)
@@ -0,0 +1,199 @@
+"""
+Projected geometry attributes of the postal areas.
+
+The postal polygons are reprojected to ETRS-TM35FIN (EPSG:3067) once at build time,
+and their area, centroids, bounding boxes, perimeter and adjacency are stored as arrays,
+so that density metrics and neighbour lookups need no geometry operations at request time.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import shapely
+import geopandas as gpd
+
+SHAPEFILE_PATH = 'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shp'
+CENSUS_PATH = 'website/data/census-csv/census_2020.csv'
+GEOMETRY_PATH = 'website/data/datum/geometry.npz'
+
+METRIC_CRS = 'EPSG:3067'
+
+# Areas sharing less boundary than this only touch at a corner and are not neighbours
+MIN_SHARED_BOUNDARY = 10  # meters
+
+# Gaps and overlaps between the polygons of the source data are tolerated up to this distance
+SNAP_DISTANCE = 1  # meters
+
+
+def read_population_centroids(path: str = CENSUS_PATH) -> pd.DataFrame:
+    """
+    PAAVO coordinates of the postal areas, which are population weighted centres in EPSG:3067.
+    ---
+    Args:
+        path (str): PAAVO census CSV
+
+    Returns:
+        (pd.DataFrame): x and y indexed by postal code
+    """
+    census = pd.read_csv(
+        path, encoding='ISO-8859-1', skiprows=1,
+        usecols=['Postal code area', 'X coordinate', 'Y coordinate'],
+    )
+    census['Postal code area'] = census['Postal code area'].str.split('  ', expand=True)[0]
+    census = census.set_index('Postal code area')
+    return census.rename(columns={'X coordinate': 'x', 'Y coordinate': 'y'}).astype(float)
+
+
+def adjacency(geometries: np.ndarray, min_shared: float = MIN_SHARED_BOUNDARY,
+              snap: float = SNAP_DISTANCE) -> tuple:
+    """
+    Sparse adjacency of polygons, weighted by the length of their shared boundary.
+    ---
+    Args:
+        geometries (np.ndarray): polygons in a metric CRS
+        min_shared (float): minimum shared boundary of neighbours
+        snap (float): tolerance of gaps between neighbouring polygons
+
+    Returns:
+        indptr, indices, shared (np.ndarray): CSR matrix, neighbours of area i are indices[indptr[i]:indptr[i + 1]]
+    """
+    tree = shapely.STRtree(geometries)
+    left, right = tree.query(geometries, predicate='dwithin', distance=snap)
+    distinct = left != right
+    left, right = left[distinct], right[distinct]
+
+    shared = shapely.intersection(
+        shapely.buffer(geometries[left], snap),
+        shapely.boundary(geometries[right]),
+    )
+    lengths = shapely.length(shared)
+
+    keep = lengths >= min_shared
+    left, right, lengths = left[keep], right[keep], lengths[keep]
+
+    order = np.lexsort((right, left))
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(left, minlength=len(geometries)))])
+    return indptr, right[order].astype(np.int32), lengths[order].astype(np.float32)
+
+
+def geometry_arrays(postal_codes: np.ndarray, geometries: np.ndarray,
+                    population_x: np.ndarray, population_y: np.ndarray) -> dict:
+    """
+    Geometry attributes of polygons in a metric CRS, in the layout of geometry.npz.
+    ---
+    Args:
+        postal_codes (np.ndarray): postal code of each polygon, sorted
+        geometries (np.ndarray): polygons in EPSG:3067
+        population_x, population_y (np.ndarray): population weighted centre of each polygon
+
+    Returns:
+        (dict): arrays by name, one row per polygon
+    """
+    centroids = shapely.centroid(geometries)
+    indptr, indices, shared = adjacency(geometries)
+
+    return {
+        'postal_code': np.asarray(postal_codes, dtype=str),
+        'area': shapely.area(geometries).astype(np.float32),
+        'perimeter': shapely.length(geometries).astype(np.float32),
+        'centroid_x': shapely.get_x(centroids),
+        'centroid_y': shapely.get_y(centroids),
+        'population_centroid_x': np.asarray(population_x, dtype=float),
+        'population_centroid_y': np.asarray(population_y, dtype=float),
+        'bbox': shapely.bounds(geometries),
+        'adjacency_indptr': indptr.astype(np.int32),
+        'adjacency_indices': indices,
+        'adjacency_shared': shared,
+    }
+
+
+def build_geometry(shapefile: str = SHAPEFILE_PATH, census: str = CENSUS_PATH,
+                   path: Optional[str] = GEOMETRY_PATH) -> dict:
+    """
+    Builds the geometry attributes of every postal area.
+    ---
+    Args:
+        shapefile (str): postal area polygons
+        census (str): PAAVO census with the population weighted centres
+        path (str): where the arrays are written. Not written if None.
+
+    Returns:
+        (dict): arrays by name, one row per postal area sorted by postal code
+    """
+    areas = gpd.read_file(shapefile)[['Posno', 'geometry']].to_crs(METRIC_CRS)
+    areas = areas.sort_values('Posno').reset_index(drop=True)
+    geometries = areas.geometry.to_numpy()
+
+    centroids = shapely.centroid(geometries)
+    population = read_population_centroids(census).reindex(areas['Posno'])
+    population_x = population['x'].fillna(pd.Series(shapely.get_x(centroids), index=population.index))
+    population_y = population['y'].fillna(pd.Series(shapely.get_y(centroids), index=population.index))
+
+    arrays = geometry_arrays(areas['Posno'].to_numpy(), geometries, population_x.to_numpy(), population_y.to_numpy())
+
+    if path:
+        np.savez_compressed(path, **arrays)
+    return arrays
+
+
+class AreaGeometry:
+    """
+    Lookups of the projected geometry attributes by postal code. Lengths are in meters,
+    areas in square meters and coordinates in EPSG:3067.
+    """
+    def __init__(self, arrays: dict):
+        self.postal_codes = [str(code) for code in arrays['postal_code']]
+        self.positions = {code: i for i, code in enumerate(self.postal_codes)}
+        self.table = pd.DataFrame({
+            'area': arrays['area'],
+            'perimeter': arrays['perimeter'],
+            'centroid_x': arrays['centroid_x'],
+            'centroid_y': arrays['centroid_y'],
+            'population_centroid_x': arrays['population_centroid_x'],
+            'population_centroid_y': arrays['population_centroid_y'],
+            'min_x': arrays['bbox'][:, 0],
+            'min_y': arrays['bbox'][:, 1],
+            'max_x': arrays['bbox'][:, 2],
+            'max_y': arrays['bbox'][:, 3],
+        }, index=pd.Index(self.postal_codes, name='postal_code'))
+        self.indptr = arrays['adjacency_indptr']
+        self.indices = arrays['adjacency_indices']
+        self.shared = arrays['adjacency_shared']
+
+    @classmethod
+    def load(cls, path: str = GEOMETRY_PATH) -> 'AreaGeometry':
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def neighbours(self, postal_code: str) -> pd.Series:
+        """
+        Postal codes of the neighbouring areas and the length of the shared boundary.
+        """
+        i = self.positions[postal_code]
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return pd.Series(
+            self.shared[start:stop],
+            index=[self.postal_codes[j] for j in self.indices[start:stop]],
+            name='shared_boundary',
+        )
+
+    def density(self, values: pd.Series) -> pd.Series:
+        """
+        Values per square kilometre of true area.
+        ---
+        Args:
+            values (pd.Series): values indexed by postal code
+
+        Returns:
+            (pd.Series): values / km²
+        """
+        return values / (self.table['area'].reindex(values.index) / 1e6)
+
+    def within(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list:
+        """
+        Postal codes of the areas whose bounding box intersects a box.
+        """
+        table = self.table
+        mask = (table['min_x'] <= max_x) & (table['max_x'] >= min_x) & \
+               (table['min_y'] <= max_y) & (table['max_y'] >= min_y)
+        return table.index[mask].to_list()
@@ -0,0 +1,532 @@
+"""
+Incremental real estate listing store.
+
+New listing batches are appended to real-estate.csv, deduplicated by a content
+hash and folded into per-postcode aggregates without re-reading the whole dump.
+The aggregates are published as a snapshot file, which the app loads and swaps in
+together with the other datasets (see dashmap/snapshot.py).
+"""
+import os
+import json
+import fcntl
+import hashlib
+import contextlib
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = 'website/data/real-estate'
+LISTINGS_FILE = 'real-estate.csv'
+SNAPSHOT_FILE = 'aggregates.json'
+LOCK_FILE = '.ingest.lock'
+
+LISTING_COLUMNS = [
+    'price', 'area', 'rooms', 'balcony', 'sauna',
+    'category', 'neighborhood', 'city', 'postcode', 'deal_type'
+]
+
+# Metrics that get running count, sum and sum of squares
+METRICS = ['price', 'area', 'price_per_square']
+
+# Relative accuracy of the quantile sketches
+SKETCH_ACCURACY = 0.01
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative error guarantees.
+    Positive values are counted in logarithmically spaced buckets,
+    so adding values or merging two sketches is a dictionary update.
+    """
+    def __init__(self, accuracy: float = SKETCH_ACCURACY, bins: Optional[Dict[int, int]] = None, zero: int = 0):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.bins = dict(bins) if bins else {}
+        self.zero = zero
+
+    @property
+    def count(self) -> int:
+        return self.zero + sum(self.bins.values())
+
+    def bucket_index(self, values: np.ndarray) -> np.ndarray:
+        """
+        Maps positive values to their bucket indexes.
+        ---
+        Args:
+            values (np.ndarray): positive values
+
+        Returns:
+            (np.ndarray): integer bucket indexes
+        """
+        return np.ceil(np.log(values) / np.log(self.gamma)).astype(np.int64)
+
+    def add_counts(self, indexes: np.ndarray, counts: np.ndarray, zero: int = 0) -> None:
+        """
+        Adds pre-bucketed counts to the sketch.
+        """
+        for index, count in zip(indexes.tolist(), counts.tolist()):
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.zero += zero
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Adds raw values to the sketch.
+        """
+        values = np.asarray(values, dtype=float)
+        positive = values[values > 0]
+        indexes, counts = np.unique(self.bucket_index(positive), return_counts=True)
+        self.add_counts(indexes, counts, zero=int(len(values) - len(positive)))
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Merges another sketch into this one.
+        """
+        self.add_counts(np.array(list(other.bins.keys())), np.array(list(other.bins.values())), other.zero)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the q-th quantile.
+        ---
+        Args:
+            q (float): quantile between 0 and 1
+
+        Returns:
+            (float): estimated value. 0.0 for an empty sketch.
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+
+        rank = q * (total - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self) -> dict:
+        return {'zero': self.zero, 'bins': {str(k): v for k, v in sorted(self.bins.items())}}
+
+    @classmethod
+    def from_dict(cls, data: dict, accuracy: float = SKETCH_ACCURACY) -> 'QuantileSketch':
+        return cls(accuracy, {int(k): v for k, v in data['bins'].items()}, data['zero'])
+
+
+class PostcodeAggregate:
+    """
+    Running aggregates of listings in one postcode for one deal type.
+    """
+    def __init__(self, count: int = 0, sums: Optional[dict] = None, squares: Optional[dict] = None,
+                 saunas: int = 0, sketch: Optional[QuantileSketch] = None):
+        self.count = count
+        self.sums = dict(sums) if sums else {metric: 0.0 for metric in METRICS}
+        self.squares = dict(squares) if squares else {metric: 0.0 for metric in METRICS}
+        self.saunas = saunas
+        self.sketch = sketch if sketch is not None else QuantileSketch()
+
+    def merge(self, other: 'PostcodeAggregate') -> 'PostcodeAggregate':
+        """
+        Folds another aggregate into this one.
+        """
+        self.count += other.count
+        for metric in METRICS:
+            self.sums[metric] += other.sums[metric]
+            self.squares[metric] += other.squares[metric]
+        self.saunas += other.saunas
+        self.sketch.merge(other.sketch)
+        return self
+
+    def mean(self, metric: str) -> float:
+        """
+        Mean of a metric. 0.0 when there are no listings.
+        """
+        if self.count == 0:
+            return 0.0
+        return self.sums[metric] / self.count
+
+    def std(self, metric: str) -> float:
+        """
+        Population standard deviation of a metric.
+        """
+        if self.count == 0:
+            return 0.0
+        variance = self.squares[metric] / self.count - self.mean(metric) ** 2
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sums': self.sums,
+            'squares': self.squares,
+            'saunas': self.saunas,
+            'sketch': self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PostcodeAggregate':
+        return cls(data['count'], data['sums'], data['squares'], data['saunas'],
+                   QuantileSketch.from_dict(data['sketch']))
+
+
+class RealEstateSnapshot:
+    """
+    Immutable view of the listing aggregates at one point of the ingestion log.
+    """
+    def __init__(self, aggregates: dict, rows: int, csv_bytes: int, version: str, hashes_file: str):
+        self.aggregates = aggregates
+        self.rows = rows
+        self.csv_bytes = csv_bytes
+        self.version = version
+        self.hashes_file = hashes_file
+
+        # Region wide aggregates are derived once per snapshot
+        self.region = {}
+        for deal_type, postcodes in aggregates.items():
+            total = PostcodeAggregate()
+            for aggregate in postcodes.values():
+                total.merge(aggregate)
+            self.region[deal_type] = total
+
+    def get(self, postal_code: str, deal_type: str) -> PostcodeAggregate:
+        """
+        Aggregate of one postcode. Empty aggregate if the postcode has no listings.
+        """
+        return self.aggregates.get(deal_type, {}).get(postal_code, PostcodeAggregate())
+
+    def saunas(self, postal_code: str) -> int:
+        """
+        Number of listings with a sauna in a postcode across all deal types.
+        """
+        return sum(self.get(postal_code, deal_type).saunas for deal_type in self.aggregates)
+
+    def to_dict(self) -> dict:
+        return {
+            'version': self.version,
+            'rows': self.rows,
+            'csv_bytes': self.csv_bytes,
+            'hashes': self.hashes_file,
+            'sketch_accuracy': SKETCH_ACCURACY,
+            'aggregates': {
+                deal_type: {postcode: aggregate.to_dict() for postcode, aggregate in sorted(postcodes.items())}
+                for deal_type, postcodes in sorted(self.aggregates.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RealEstateSnapshot':
+        aggregates = {
+            deal_type: {postcode: PostcodeAggregate.from_dict(value) for postcode, value in postcodes.items()}
+            for deal_type, postcodes in data['aggregates'].items()
+        }
+        return cls(aggregates, data['rows'], data['csv_bytes'], data['version'], data['hashes'])
+
+
+def normalize_listings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerces a listing batch to the schema of real-estate.csv.
+    Rows without a price, a positive area, a postcode or a deal type are dropped, blank postcodes count as missing.
+    ---
+    Args:
+        df (pd.DataFrame): raw listings
+
+    Returns:
+        df (pd.DataFrame): listings with LISTING_COLUMNS in order
+    """
+    missing = [column for column in LISTING_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Listing batch is missing columns: {missing}")
+
+    df = df[LISTING_COLUMNS].copy()
+    for column in ['price', 'area', 'rooms']:
+        df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
+    for column in ['balcony', 'sauna']:
+        df[column] = df[column].astype(str).str.lower().isin(['true', '1', 'yes'])
+
+    # Missing postcodes are dropped before the string conversion, which would turn them into 'nan' or 'None'
+    df = df.dropna(subset=['price', 'area', 'postcode', 'deal_type'])
+    df['postcode'] = df['postcode'].astype(str).str.strip()
+    df = df[(df['postcode'] != '') & (df['area'] > 0)].copy()
+    df['postcode'] = df['postcode'].str.zfill(5)
+
+    return df.reset_index(drop=True)
+
+
+def read_batch(path: str) -> pd.DataFrame:
+    """
+    Reads a listing batch from CSV or JSON lines.
+    ---
+    Args:
+        path (str): path of a .csv, .jsonl or .ndjson file
+
+    Returns:
+        (pd.DataFrame): normalized listings
+    """
+    if path.endswith(('.jsonl', '.ndjson')):
+        # Kept as read, a str dtype would turn null postcodes into 'None'
+        df = pd.read_json(path, lines=True, dtype={'postcode': object})
+    else:
+        df = pd.read_csv(path, dtype={'postcode': str})
+    return normalize_listings(df)
+
+
+def hash_listings(df: pd.DataFrame) -> np.ndarray:
+    """
+    Computes a 64-bit content hash for every listing.
+    ---
+    Args:
+        df (pd.DataFrame): normalized listings
+
+    Returns:
+        (np.ndarray): uint64 hashes
+    """
+    columns = []
+    for column in LISTING_COLUMNS:
+        if df[column].dtype.kind == 'f':
+            columns.append(df[column].astype(float).map(float.__repr__))
+        else:
+            columns.append(df[column].astype(str))
+    canonical = columns[0].str.cat(columns[1:], sep='\x1f')
+
+    hashes = [hashlib.blake2b(row.encode('utf-8'), digest_size=8).digest() for row in canonical]
+    return np.frombuffer(b''.join(hashes), dtype='<u8').copy()
+
+
+def aggregate_listings(df: pd.DataFrame) -> dict:
+    """
+    Aggregates listings per deal type and postcode in one vectorized pass.
+    ---
+    Args:
+        df (pd.DataFrame): normalized listings
+
+    Returns:
+        aggregates (dict): {deal_type: {postcode: PostcodeAggregate}}
+    """
+    df = df[['postcode', 'deal_type', 'price', 'area', 'sauna']].copy()
+    df['price_per_square'] = df['price'] / df['area']
+    for metric in METRICS:
+        df[f'{metric}_sq'] = df[metric] ** 2
+
+    grouped = df.groupby(['deal_type', 'postcode'], sort=False)
+    totals = grouped[METRICS + [f'{metric}_sq' for metric in METRICS]].sum()
+    counts = grouped.size()
+    saunas = grouped['sauna'].sum()
+
+    # Bucket the price per square meter of all listings at once
+    sketch = QuantileSketch()
+    positive = df[df['price_per_square'] > 0].copy()
+    positive['bucket'] = sketch.bucket_index(positive['price_per_square'].to_numpy())
+    buckets = positive.groupby(['deal_type', 'postcode', 'bucket']).size()
+    zeros = df[df['price_per_square'] <= 0].groupby(['deal_type', 'postcode']).size()
+
+    aggregates = {}
+    for (deal_type, postcode), count in counts.items():
+        row = totals.loc[(deal_type, postcode)]
+        aggregates.setdefault(deal_type, {})[postcode] = PostcodeAggregate(
+            count=int(count),
+            sums={metric: float(row[metric]) for metric in METRICS},
+            squares={metric: float(row[f'{metric}_sq']) for metric in METRICS},
+            saunas=int(saunas.loc[(deal_type, postcode)]),
+            sketch=QuantileSketch(zero=int(zeros.get((deal_type, postcode), 0))),
+        )
+
+    for (deal_type, postcode, bucket), count in buckets.items():
+        aggregates[deal_type][postcode].sketch.bins[int(bucket)] = int(count)
+
+    return aggregates
+
+
+def merge_aggregates(base: dict, update: dict) -> dict:
+    """
+    Returns new aggregates with the update folded into a copy of base.
+    The base aggregates are left untouched, so current readers are not affected.
+    """
+    merged = {
+        deal_type: {postcode: PostcodeAggregate.from_dict(aggregate.to_dict())
+                    for postcode, aggregate in postcodes.items()}
+        for deal_type, postcodes in base.items()
+    }
+    for deal_type, postcodes in update.items():
+        target = merged.setdefault(deal_type, {})
+        for postcode, aggregate in postcodes.items():
+            target.setdefault(postcode, PostcodeAggregate()).merge(aggregate)
+    return merged
+
+
+def next_version(previous: str, hashes: np.ndarray) -> str:
+    """
+    Chains the content hashes of a batch onto the previous snapshot version.
+    """
+    digest = hashlib.blake2b(previous.encode('utf-8'), digest_size=8)
+    digest.update(np.sort(hashes).tobytes())
+    return digest.hexdigest()
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Writes a file so that readers either see the old or the new content.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def save_snapshot(snapshot: RealEstateSnapshot, hashes: np.ndarray, data_dir: str = DATA_DIR) -> None:
+    """
+    Persists the hash index and the snapshot.
+    Replacing the snapshot file is the commit point of an ingestion.
+    """
+    hashes_path = os.path.join(data_dir, snapshot.hashes_file)
+    with open(f"{hashes_path}.tmp", 'wb') as file:
+        np.save(file, hashes)
+    os.replace(f"{hashes_path}.tmp", hashes_path)
+
+    previous = read_snapshot_file(data_dir)
+    write_atomic(os.path.join(data_dir, SNAPSHOT_FILE), json.dumps(snapshot.to_dict(), separators=(',', ':')).encode('utf-8'))
+
+    # The old hash index is no longer referenced
+    if previous and previous['hashes'] != snapshot.hashes_file:
+        old_path = os.path.join(data_dir, previous['hashes'])
+        if os.path.exists(old_path):
+            os.remove(old_path)
+
+
+def read_snapshot_file(data_dir: str = DATA_DIR) -> Optional[dict]:
+    path = os.path.join(data_dir, SNAPSHOT_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+@contextlib.contextmanager
+def ingestion_lock(data_dir: str = DATA_DIR) -> Iterator[None]:
+    """
+    Serializes the writers of a listing store, across threads and processes.
+    Each holder opens the lock file on its own, so the lock is not reentrant.
+    """
+    with open(os.path.join(data_dir, LOCK_FILE), 'a') as file:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def rebuild(data_dir: str = DATA_DIR) -> RealEstateSnapshot:
+    """
+    Builds the snapshot and the hash index from the full listings file.
+    Only needed once, or when the snapshot is lost.
+    Rows already in the dump are taken as they are, without deduplication.
+    ---
+    Args:
+        data_dir (str): directory of real-estate.csv
+
+    Returns:
+        snapshot (RealEstateSnapshot)
+    """
+    with ingestion_lock(data_dir):
+        return _rebuild(data_dir)
+
+
+def _rebuild(data_dir: str) -> RealEstateSnapshot:
+    listings_path = os.path.join(data_dir, LISTINGS_FILE)
+    df = normalize_listings(pd.read_csv(listings_path, dtype={'postcode': str}))
+    hashes = np.unique(hash_listings(df))
+    version = next_version('', hashes)
+
+    snapshot = RealEstateSnapshot(
+        aggregate_listings(df),
+        rows=len(df),
+        csv_bytes=os.path.getsize(listings_path),
+        version=version,
+        hashes_file=f"listing_hashes-{version}.npy",
+    )
+    save_snapshot(snapshot, hashes, data_dir)
+    return snapshot
+
+
+def ingest(path: str, data_dir: str = DATA_DIR) -> RealEstateSnapshot:
+    """
+    Ingests a batch of new listings.
+    The cost is proportional to the batch, not to the size of the existing data.
+    Concurrent ingestions into the same directory run one after the other.
+    ---
+    Args:
+        path (str): CSV or JSON lines file with new listings
+        data_dir (str): directory of real-estate.csv
+
+    Returns:
+        snapshot (RealEstateSnapshot): new snapshot
+    """
+    with ingestion_lock(data_dir):
+        return _ingest(path, data_dir)
+
+
+def _ingest(path: str, data_dir: str) -> RealEstateSnapshot:
+    data = read_snapshot_file(data_dir)
+    if data is None:
+        current = _rebuild(data_dir)
+    else:
+        current = RealEstateSnapshot.from_dict(data)
+    known = np.load(os.path.join(data_dir, current.hashes_file))
+
+    batch = read_batch(path)
+    batch_hashes = hash_listings(batch)
+
+    # Drop listings seen before and repeats within the batch
+    _, first = np.unique(batch_hashes, return_index=True)
+    first = np.sort(first)
+    fresh = first[~np.isin(batch_hashes[first], known)]
+    batch = batch.iloc[fresh]
+    batch_hashes = batch_hashes[fresh]
+
+    if batch.empty:
+        return current
+
+    # Drop rows appended by an ingestion that never reached its commit point
+    listings_path = os.path.join(data_dir, LISTINGS_FILE)
+    with open(listings_path, 'r+b') as file:
+        file.truncate(current.csv_bytes)
+        if current.csv_bytes:
+            file.seek(current.csv_bytes - 1)
+            if file.read(1) != b'\n':
+                file.write(b'\n')
+        file.seek(0, os.SEEK_END)
+        file.write(batch.to_csv(header=False, index=False).encode('utf-8'))
+        file.flush()
+        os.fsync(file.fileno())
+        csv_bytes = file.tell()
+
+    hashes = np.union1d(known, batch_hashes)
+    version = next_version(current.version, batch_hashes)
+    snapshot = RealEstateSnapshot(
+        merge_aggregates(current.aggregates, aggregate_listings(batch)),
+        rows=current.rows + len(batch),
+        csv_bytes=csv_bytes,
+        version=version,
+        hashes_file=f"listing_hashes-{version}.npy",
+    )
+    save_snapshot(snapshot, hashes, data_dir)
+    return snapshot
+
+
+def load_snapshot(data_dir: str = DATA_DIR) -> RealEstateSnapshot:
+    """
+    Loads the persisted snapshot or aggregates the listings file in memory if there is none.
+    """
+    data = read_snapshot_file(data_dir)
+    if data is not None:
+        return RealEstateSnapshot.from_dict(data)
+
+    df = normalize_listings(pd.read_csv(os.path.join(data_dir, LISTINGS_FILE), dtype={'postcode': str}))
+    return RealEstateSnapshot(aggregate_listings(df), len(df), 0, '', '')
@@ -0,0 +1,52 @@
+"""
+Region-wide reference statistics of the census attributes.
+
+Sections compare a postal area with the whole region. The reference values only depend on
+the census attributes, so they are computed once when a data snapshot is loaded, not on every click.
+"""
+import numpy as np
+import pandas as pd
+
+QUANTILES = {'p10': 0.1, 'p25': 0.25, 'p75': 0.75, 'p90': 0.9}
+
+# Prefix of the column of inhabitants, the weight of the population-weighted means
+POPULATION_PREFIX = 'Inhabitants, total'
+
+
+def population(datum: pd.DataFrame) -> pd.Series:
+    """
+    Inhabitants of every postal area.
+    """
+    column = next(column for column in datum.columns if str(column).startswith(POPULATION_PREFIX))
+    return datum[column].astype(float)
+
+
+def reference_statistics(datum: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mean, population-weighted mean, median and quantiles of every census attribute over all postal areas.
+    ---
+    Args:
+        datum (pd.DataFrame): census attributes by postal code
+
+    Returns:
+        (pd.DataFrame): statistics by attribute, in the column order of datum. NaN for text attributes.
+    """
+    numeric = datum.select_dtypes('number')
+    values = numeric.to_numpy(dtype=float)
+    weights = population(datum).to_numpy()
+
+    known = ~np.isnan(values)
+    weighted = known * weights[:, None]
+    weight_sums = weighted.sum(axis=0)
+    weighted_mean = np.divide(
+        np.nansum(values * weighted, axis=0), weight_sums,
+        out=np.full(values.shape[1], np.nan), where=weight_sums > 0,
+    )
+
+    statistics = pd.DataFrame({
+        'mean': np.nanmean(values, axis=0),
+        'weighted_mean': weighted_mean,
+        'median': np.nanmedian(values, axis=0),
+        **{name: np.nanquantile(values, q, axis=0) for name, q in QUANTILES.items()},
+    }, index=numeric.columns)
+    return statistics.reindex(datum.columns)
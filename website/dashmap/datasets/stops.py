@@ -0,0 +1,161 @@
+"""
+HSL public transport stop layer.
+
+The stops of hsl_public_transport.csv are reprojected from KKJ to WGS84 in one
+batch transform, the platforms of a station are merged into one stop and the result
+is stored as a compact typed table with categorical network and stop type columns.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import shapely
+import geopandas as gpd
+from pyproj import Transformer
+
+SOURCE_PATH = 'website/data/mobility/hsl_public_transport.csv'
+STOPS_PATH = 'website/data/mobility/stops.npz'
+
+# KKJ / Finland zone 2 (X about 2.55 million), not ETRS-GK25 (EPSG:3879), which maps the stops to infinity
+SOURCE_CRS = 'EPSG:2392'
+
+# Platforms with the same name and network closer than this are one station
+STATION_RADIUS = 150  # meters
+
+CATEGORICAL_COLUMNS = ['VERKKO', 'PYSAKKITYY']
+
+
+def read_source(path: str = SOURCE_PATH) -> pd.DataFrame:
+    """
+    Reads the stop platforms of the HSL export.
+    """
+    return pd.read_csv(
+        path,
+        encoding='utf-8-sig',
+        usecols=['SOLMUTUNNU', 'LYHYTTUNNU', 'X', 'Y', 'NIMI1', 'NAMN1', 'VERKKO', 'PYSAKKITYY'],
+        dtype={'LYHYTTUNNU': str, 'NIMI1': str, 'NAMN1': str},
+    )
+
+
+def to_wgs84(x: np.ndarray, y: np.ndarray, crs: str = SOURCE_CRS) -> tuple:
+    """
+    Reprojects coordinate arrays to longitude and latitude in a single call.
+    """
+    transformer = Transformer.from_crs(crs, 'EPSG:4326', always_xy=True)
+    return transformer.transform(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+
+
+def station_labels(x: np.ndarray, y: np.ndarray, keys: np.ndarray, radius: float = STATION_RADIUS) -> np.ndarray:
+    """
+    Groups platforms into stations: platforms with the same key within `radius` of each other,
+    directly or through other platforms, get the same label.
+    ---
+    Args:
+        x, y (np.ndarray): metric coordinates of the platforms
+        keys (np.ndarray): integer key of each platform, e.g. a code of the name and network
+        radius (float): linking distance in the units of the coordinates
+
+    Returns:
+        (np.ndarray): station label of each platform, the smallest position of its platforms
+    """
+    points = shapely.points(x, y)
+    left, right = shapely.STRtree(points).query(points, predicate='dwithin', distance=radius)
+    linked = keys[left] == keys[right]
+    left, right = left[linked], right[linked]
+
+    # Label propagation with pointer jumping, converges in a few rounds for small clusters
+    labels = np.arange(len(points))
+    while True:
+        updated = labels.copy()
+        np.minimum.at(updated, left, labels[right])
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def build_stops(source: str = SOURCE_PATH, path: Optional[str] = STOPS_PATH) -> pd.DataFrame:
+    """
+    Builds the stop table: one row per station with WGS84 coordinates and typed columns.
+    ---
+    Args:
+        source (str): HSL stop export in KKJ / Finland zone 2
+        path (str): where the table is written. Not written if None.
+
+    Returns:
+        stops (pd.DataFrame): stations sorted by SOLMUTUNNU
+    """
+    platforms = read_source(source)
+    platforms['lon'], platforms['lat'] = to_wgs84(platforms['X'], platforms['Y'])
+
+    keys, _ = pd.factorize(pd.MultiIndex.from_frame(platforms[['NIMI1', 'VERKKO']]))
+    platforms['station'] = station_labels(platforms['X'].to_numpy(), platforms['Y'].to_numpy(), keys)
+
+    platforms.sort_values('SOLMUTUNNU', inplace=True)
+    stops = platforms.groupby('station', sort=False).agg(
+        SOLMUTUNNU=('SOLMUTUNNU', 'first'),
+        LYHYTTUNNU=('LYHYTTUNNU', 'first'),
+        NIMI1=('NIMI1', 'first'),
+        NAMN1=('NAMN1', 'first'),
+        VERKKO=('VERKKO', 'first'),
+        PYSAKKITYY=('PYSAKKITYY', 'first'),
+        platforms=('SOLMUTUNNU', 'size'),
+        lon=('lon', 'mean'),
+        lat=('lat', 'mean'),
+    ).reset_index(drop=True)
+
+    stops = stops.astype({
+        'SOLMUTUNNU': np.int32,
+        'platforms': np.uint16,
+        'lon': np.float32,
+        'lat': np.float32,
+        'VERKKO': 'category',
+        'PYSAKKITYY': 'category',
+    })
+    stops[['LYHYTTUNNU', 'NIMI1', 'NAMN1']] = stops[['LYHYTTUNNU', 'NIMI1', 'NAMN1']].fillna('')
+
+    if path:
+        save_stops(stops, path)
+    return stops
+
+
+def save_stops(stops: pd.DataFrame, path: str = STOPS_PATH) -> None:
+    """
+    Writes the stop table as a compressed numpy archive. Categorical columns are stored
+    as uint8 codes and a `<column>__categories` array.
+    """
+    arrays = {}
+    for column in stops.columns:
+        if column in CATEGORICAL_COLUMNS:
+            arrays[column] = stops[column].cat.codes.to_numpy(dtype=np.uint8)
+            arrays[f"{column}__categories"] = stops[column].cat.categories.to_numpy()
+        elif stops[column].dtype == object:
+            arrays[column] = stops[column].to_numpy(dtype=str)
+        else:
+            arrays[column] = stops[column].to_numpy()
+    np.savez_compressed(path, **arrays)
+
+
+def load_stops(path: str = STOPS_PATH) -> gpd.GeoDataFrame:
+    """
+    Loads the stop table.
+    ---
+    Args:
+        path (str): archive written by build_stops
+
+    Returns:
+        stops (gpd.GeoDataFrame): one point per station in WGS84
+    """
+    with np.load(path) as archive:
+        columns = {
+            name: archive[name] for name in archive.files if not name.endswith('__categories')
+        }
+        for name in CATEGORICAL_COLUMNS:
+            columns[name] = pd.Categorical.from_codes(columns[name], archive[f"{name}__categories"])
+
+    stops = pd.DataFrame(columns)
+    return gpd.GeoDataFrame(
+        stops,
+        geometry=gpd.points_from_xy(stops['lon'], stops['lat']),
+        crs='EPSG:4326',
+    )
@@ -0,0 +1,110 @@
+"""
+Content-derived versions of the datasets served by the app.
+
+Every dataset is versioned by a hash of the files it is loaded from. Caches and HTTP
+validators key on the versions of the datasets they depend on, so a data refresh only
+invalidates what was built from the data that changed.
+"""
+import os
+import hashlib
+import threading
+from typing import Dict, Tuple
+
+DATASET_FILES = {
+    'datum': ('website/data/datum/attributes.npz',),
+    'areas': ('website/data/datum/areas.geojson',),
+    'geometry': ('website/data/datum/geometry.npz',),
+    'real_estate': (
+        'website/data/real-estate/real-estate.csv',
+        'website/data/real-estate/aggregates.json',
+    ),
+    'stops': ('website/data/mobility/stops.npz',),
+    'mobility': ('website/data/mobility/mobility.csv',),
+    'environment': (
+        'website/data/environment/air-quality/air_quality_series.npz',
+        'website/data/environment/air-temperature-wind/wind_cube.npz',
+        'website/data/environment/air-temperature-wind/air_temp_climatology.npz',
+        'website/data/environment/environment_store.npz',
+    ),
+}
+
+# File hashes by (path, size, mtime), so unchanged files are not read again
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+_file_hashes_lock = threading.Lock()
+
+
+def file_version(path: str) -> str:
+    """
+    Hash of the content of a file, memoized while its size and modification time are unchanged.
+    """
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    with _file_hashes_lock:
+        if key in _file_hashes:
+            return _file_hashes[key]
+
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+
+    with _file_hashes_lock:
+        _file_hashes[key] = digest.hexdigest()
+    return _file_hashes[key]
+
+
+def combine(versions: Dict[str, str]) -> str:
+    """
+    Order independent version of a set of named versions.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name in sorted(versions):
+        digest.update(f"{name}={versions[name]};".encode())
+    return digest.hexdigest()
+
+
+class DataVersions:
+    """
+    Versions of the datasets loaded by the app, and their combination.
+    """
+    def __init__(self, datasets: Dict[str, str]):
+        self.datasets = dict(datasets)
+        self.combined = combine(self.datasets)
+
+    def key(self, *names: str) -> str:
+        """
+        Version of a subset of the datasets, for caches that depend on only some of them.
+        ---
+        Args:
+            names (str): dataset names, keys of DATASET_FILES
+
+        Returns:
+            (str): combined version of the named datasets
+        """
+        return combine({name: self.datasets[name] for name in names})
+
+    def to_dict(self) -> dict:
+        return {'version': self.combined, 'datasets': dict(self.datasets)}
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DataVersions) and self.datasets == other.datasets
+
+    def __repr__(self) -> str:
+        return f"DataVersions({self.combined})"
+
+
+def load_versions(dataset_files: Dict[str, tuple] = DATASET_FILES) -> DataVersions:
+    """
+    Versions of the datasets as they are on disk now. Call it when the datasets are loaded,
+    so that the versions describe the data in memory.
+    ---
+    Args:
+        dataset_files (dict): dataset name -> files it is loaded from
+
+    Returns:
+        (DataVersions)
+    """
+    return DataVersions({
+        name: combine({path: file_version(path) for path in paths})
+        for name, paths in dataset_files.items()
+    })
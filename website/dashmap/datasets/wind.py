@@ -0,0 +1,77 @@
+"""
+Precomputed wind rose histogram cube.
+
+The cube is built by website/data/environment/air-temperature-wind/data_cleaner.py
+and holds sample counts by year, month, speed bin and 16-point direction.
+Any wind rose is a sum over a slice of the cube, no raw data is read at request time.
+"""
+from typing import Optional
+
+import numpy as np
+
+CUBE_PATH = 'website/data/environment/air-temperature-wind/wind_cube.npz'
+
+SPEED_LABELS = ['< 5 m/s', '5-8 m/s', '8-10 m/s', '> 11 m/s']
+
+DIRECTIONS = [
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+]
+
+SEASONS = {
+    'winter': (12, 1, 2),
+    'spring': (3, 4, 5),
+    'summer': (6, 7, 8),
+    'autumn': (9, 10, 11),
+}
+
+
+class WindCube:
+    """
+    Year x month x speed bin x direction counts of wind samples.
+    """
+    def __init__(self, counts: np.ndarray, years: np.ndarray):
+        self.counts = counts
+        self.years = [int(year) for year in years]
+
+        # Month masks of every season, as positions on the month axis
+        self.season_months = {season: np.array(months) - 1 for season, months in SEASONS.items()}
+
+    @classmethod
+    def load(cls, path: str = CUBE_PATH) -> 'WindCube':
+        with np.load(path) as archive:
+            return cls(archive['counts'], archive['years'])
+
+    def slice_counts(self, year: Optional[int] = None, season: Optional[str] = None) -> np.ndarray:
+        """
+        Counts of a year and season summed to a (speed bin, direction) matrix.
+        ---
+        Args:
+            year (int): year to select. All years if None.
+            season (str): key of SEASONS. Whole year if None.
+
+        Returns:
+            (np.ndarray): counts of shape (speed bins, 16)
+        """
+        counts = self.counts
+        if year is not None:
+            counts = counts[self.years.index(year):self.years.index(year) + 1]
+        if season is not None:
+            counts = counts[:, self.season_months[season]]
+        return counts.sum(axis=(0, 1))
+
+    def rose(self, year: Optional[int] = None, season: Optional[str] = None) -> list:
+        """
+        Share of each direction within each speed bin, in percent.
+        ---
+        Args:
+            year (int): year to select. All years if None.
+            season (str): key of SEASONS. Whole year if None.
+
+        Returns:
+            (list): one list of 16 percentages per speed bin
+        """
+        counts = self.slice_counts(year, season)
+        totals = counts.sum(axis=1, keepdims=True)
+        percentages = np.divide(100 * counts, totals, out=np.zeros(counts.shape), where=totals > 0)
+        return percentages.tolist()
@@ -1,4 +1,4 @@
-from ..templates.templates import init_accordion_element, assemble_accordion
+from ..templates.templates import init_accordion_element, assemble_accordion, area_section_id
 
 
 def init_census_household_accordion() -> object:
@@ -11,28 +11,28 @@ def init_census_household_accordion() -> object:
     """
     accord_household_size = init_accordion_element(
         title="Household Size", 
-        graph_id='id_household_size',
+        graph_id=area_section_id('id_household_size'),
         tab_n='1-2', 
         group_n=1
     )
 
     accord_household_structure = init_accordion_element(
         title="Household Structure",
-        graph_id='id_household_structure',
+        graph_id=area_section_id('id_household_structure'),
         tab_n='1-2',
         group_n=2
     )
     
     accord_household_income = init_accordion_element(
         title="Household Income",
-        graph_id='id_household_income',
+        graph_id=area_section_id('id_household_income'),
         tab_n='1-2',
         group_n=3
     )
 
     accord_household_dwell = init_accordion_element(
         title="Household Dwelling Type",
-        graph_id='id_household_dwellings',
+        graph_id=area_section_id('id_household_dwellings'),
         tab_n='1-2',
         group_n=4
     )
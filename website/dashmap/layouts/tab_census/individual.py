@@ -1,4 +1,4 @@
-from ..templates.templates import init_accordion_element, assemble_accordion
+from ..templates.templates import init_accordion_element, assemble_accordion, area_section_id
 
 
 def init_census_individual_accordion() -> object:
@@ -11,35 +11,35 @@ def init_census_individual_accordion() -> object:
     """
     accordion_age = init_accordion_element(
         title="Age", 
-        graph_id='id_age_dist_hist',
+        graph_id=area_section_id('id_age_dist_hist'),
         tab_n=1, 
         group_n=1
     )
 
     accordion_gender = init_accordion_element(
         title="Gender",
-        graph_id='id_gender_pie_chart',
+        graph_id=area_section_id('id_gender_pie_chart'),
         tab_n=1,
         group_n=2
     )
     
     accordion_education = init_accordion_element(
         title="Education",
-        graph_id='id_education_pie_chart',
+        graph_id=area_section_id('id_education_pie_chart'),
         tab_n=1,
         group_n=3
     )
 
     accordion_income = init_accordion_element(
         title="Income",
-        graph_id='id_income_pie_chart',
+        graph_id=area_section_id('id_income_pie_chart'),
         tab_n=1,
         group_n=4
     )
 
     accordion_employment = init_accordion_element(
         title="Employment",
-        graph_id='id_employment_pie_chart',
+        graph_id=area_section_id('id_employment_pie_chart'),
         tab_n=1,
         group_n=5
     )
@@ -1,11 +1,108 @@
+from dash import html
+from dash import dcc
+import dash_bootstrap_components as dbc
+
 from ..templates.templates import init_accordion_element, assemble_accordion
+from ...datasets.wind import SEASONS
+from ...datasets.air_quality import PLOTTED_SERIES
 
 
-def init_environment_accordion():
+def init_wind_controls(years: list) -> list:
     """
-    Initialize the accordion for environment tab.
+    Year and season selectors of the wind rose.
+    Args:
+        years (list): years of the wind cube
+
+    Returns:
+        (list): dash components
+    """
+    year_select = dbc.Select(
+        id='wind-year-select',
+        options=[{'label': 'All years', 'value': 'all'}] +
+                [{'label': str(year), 'value': str(year)} for year in years],
+        value='all',
+    )
+    season_select = dbc.Select(
+        id='wind-season-select',
+        options=[{'label': 'Whole year', 'value': 'all'}] +
+                [{'label': season.capitalize(), 'value': season} for season in SEASONS],
+        value='all',
+    )
+
+    return [
+        dbc.Row(
+            [
+                dbc.Col([html.Small("Year"), year_select], width=6),
+                dbc.Col([html.Small("Season"), season_select], width=6),
+            ]
+        )
+    ]
+
+
+def init_pollution_weather_controls() -> list:
+    """
+    Pollutant and weather condition selectors of the pollution by weather section.
     Args: None
 
+    Returns:
+        (list): dash components
+    """
+    pollutant_select = dbc.Select(
+        id='pollution-weather-pollutant',
+        options=[{'label': label, 'value': name} for name, label in PLOTTED_SERIES.items()],
+        value=next(iter(PLOTTED_SERIES)),
+    )
+    condition_select = dbc.Select(
+        id='pollution-weather-condition',
+        options=[
+            {'label': 'Wind direction', 'value': 'direction'},
+            {'label': 'Air temperature', 'value': 'temperature'},
+        ],
+        value='temperature',
+    )
+
+    return [
+        dbc.Row(
+            [
+                dbc.Col([html.Small("Pollutant"), pollutant_select], width=6),
+                dbc.Col([html.Small("By"), condition_select], width=6),
+            ]
+        )
+    ]
+
+
+def init_air_pollution_body() -> list:
+    """
+    Static content of the air pollution section. Only the figure is updated by callbacks,
+    which downsample the series to the visible time window on load and on every zoom.
+    Args: None
+
+    Returns:
+        (list): dash components
+    """
+    text = """
+    Air pollution refers to the release of pollutants into the air.
+    High level of pollutants in ambient air are detrimental to human health and the planet as a whole.
+    Pollutants are measured in micrograms of gaseous pollutant per cubic meter of ambient air (µg/m3).
+    """
+
+    return [
+        html.H4("Air Pollution"),
+        html.Hr(),
+        dcc.Graph(id='air-pollution-graph', config={'displayModeBar': False}),
+        # Visible range and plotted width of the graph, see graphs.view in assets/clientside.js
+        dcc.Store(id='air-pollution-view'),
+        html.P(text),
+    ]
+
+
+def init_environment_accordion(wind_years: list, air_temperature: list = None):
+    """
+    Initialize the accordion for environment tab.
+    Args:
+        wind_years (list): years of the wind rose selector
+        air_temperature (list): prerendered content of the air temperature section
+
     Returns: 
         census_individuals_accordion (object): dash html.Div that contains individual accordions
     """
@@ -13,27 +110,39 @@ def init_environment_accordion():
         title="Wind Patterns", 
         graph_id='id_windrose',
         tab_n=5, 
-        group_n=1
+        group_n=1,
+        controls=init_wind_controls(wind_years),
     )
 
     avg_air_temp = init_accordion_element(
         title="Air Temperature",
         graph_id='id_air_temperature',
         tab_n=5,
-        group_n=2
+        group_n=2,
+        children=air_temperature,
     )
 
     air_pollution = init_accordion_element(
         title="Air Pollution",
         graph_id='id_air_pollution',
         tab_n=5,
-        group_n=3
+        group_n=3,
+        children=init_air_pollution_body(),
+    )
+
+    pollution_weather = init_accordion_element(
+        title="Pollution and Weather",
+        graph_id='id_pollution_weather',
+        tab_n=5,
+        group_n=4,
+        controls=init_pollution_weather_controls(),
     )
 
     accordions = [
         wind_rose, 
         avg_air_temp,
         air_pollution,
+        pollution_weather,
     ]
 
     return assemble_accordion(accordions)
@@ -5,15 +5,17 @@ import dash_bootstrap_components as dbc
 from .environment import init_environment_accordion
 
 
-def init_tab_environment() -> object:
+def init_tab_environment(wind_years: list, air_temperature: list = None) -> object:
     """
     Initialize the environment tab.
-    Args: None
+    Args:
+        wind_years (list): years of the wind rose selector
+        air_temperature (list): prerendered content of the air temperature section
 
     Returns: 
         environment_tab_content (object): dash dbc.Card() that contains all relevant accordions
     """
-    environment_accordion = init_environment_accordion()
+    environment_accordion = init_environment_accordion(wind_years, air_temperature)
 
     environment_tab_content = dbc.Card(
         dbc.CardBody(
@@ -1,4 +1,4 @@
-from ..templates.templates import init_accordion_element, assemble_accordion
+from ..templates.templates import init_accordion_element, assemble_accordion, area_section_id
 
 
 def init_mobility_accordion():
@@ -11,7 +11,7 @@ def init_mobility_accordion():
     """
     accord_1 = init_accordion_element(
         title="Mobility Index", 
-        graph_id='id_mobility_index',
+        graph_id=area_section_id('id_mobility_index'),
         tab_n=4,
         group_n=1
     )
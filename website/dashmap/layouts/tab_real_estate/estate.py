@@ -1,4 +1,4 @@
-from ..templates.templates import init_accordion_element, assemble_accordion
+from ..templates.templates import init_accordion_element, assemble_accordion, area_section_id, init_background_panel
 
 
 def init_real_estate_accordion():
@@ -11,21 +11,23 @@ def init_real_estate_accordion():
     """
     accord_re_owning = init_accordion_element(
         title="Ownership", 
-        graph_id='id_re_owning',
+        graph_id=area_section_id('id_re_owning'),
         tab_n=2,
-        group_n=1
+        group_n=1,
+        panels=[init_background_panel('id_re_owning_listings', 'tab-2-collapse-1', "Loading the listings...", steps=3)]
     )
 
     accord_re_renting = init_accordion_element(
         title="Rentals", 
-        graph_id='id_re_renting',
+        graph_id=area_section_id('id_re_renting'),
         tab_n=2, 
-        group_n=2
+        group_n=2,
+        panels=[init_background_panel('id_re_renting_listings', 'tab-2-collapse-2', "Loading the listings...", steps=3)]
     )
 
     accord_re_sauna = init_accordion_element(
         title="Sauna Index", 
-        graph_id='id_re_sauna',
+        graph_id=area_section_id('id_re_sauna'),
         tab_n=2, 
         group_n=3
     )
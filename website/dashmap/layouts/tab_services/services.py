@@ -1,4 +1,4 @@
-from ..templates.templates import init_accordion_element, assemble_accordion
+from ..templates.templates import init_accordion_element, assemble_accordion, area_section_id
 
 
 def init_services_accordion():
@@ -11,14 +11,14 @@ def init_services_accordion():
     """
     accord_industries = init_accordion_element(
         title="Industry", 
-        graph_id='id_services_industries',
+        graph_id=area_section_id('id_services_industries'),
         tab_n=3, 
         group_n=1
     )
 
     accord_workplaces = init_accordion_element(
         title="Workplaces",
-        graph_id='id_workplaces',
+        graph_id=area_section_id('id_workplaces'),
         tab_n=3,
         group_n=2
     )
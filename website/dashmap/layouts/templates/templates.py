@@ -1,20 +1,94 @@
 # Dash and Plotly
 from dash import html
+from dash import dcc
 import dash_bootstrap_components as dbc
 
+# Pattern-matching id types. A callback selects every component of a type with ALL,
+# so it works whichever tabs have been loaded into the page.
+AREA_SECTION = 'area-section'
+ACCORDION_COLLAPSE = 'accordion-collapse'
+PANEL_REQUEST = 'panel-request'
 
-def init_accordion_element(title: str, graph_id: str, tab_n: int, group_n: int) -> object:
+
+def area_section_id(section_id: str) -> dict:
+    """
+    id of the card body of a section rendered for the clicked postal area.
+    """
+    return {'type': AREA_SECTION, 'index': section_id}
+
+
+def collapse_id(collapse: str) -> dict:
+    """
+    id of an accordion collapse, e.g. collapse_id('tab-1-collapse-1').
+    """
+    return {'type': ACCORDION_COLLAPSE, 'index': collapse}
+
+
+def panel_request_id(panel_id: str) -> dict:
+    """
+    id of the store requesting a background panel for the clicked postal area.
+    """
+    return {'type': PANEL_REQUEST, 'index': panel_id}
+
+
+def init_background_panel(panel_id: str, collapse: str, text: str, steps: int) -> object:
+    """
+    Template of a panel rendered by a background job, see callbacks/util/jobs.py.
+    Shows a placeholder with the progress of the job until its result arrives.
+    Args:
+        panel_id (str): id of the panel content
+        collapse (str): accordion collapse containing the panel, the panel is requested while it is open
+        text (str): placeholder text
+        steps (int): number of progress steps of the job
+
+    Returns:
+        panel (object)
+    """
+    placeholder = html.Div(
+        [
+            html.P(text, className="text-muted"),
+            dbc.Progress(id=f"{panel_id}-progress", value=0, max=steps, striped=True, animated=True),
+        ],
+        id=f"{panel_id}-placeholder",
+        className="px-3 pb-3",
+        style={'display': 'none'},
+    )
+
+    panel = html.Div([
+        dcc.Store(id=panel_request_id(panel_id), data={'collapse': collapse, 'postal_code': None}),
+        placeholder,
+        html.Div(id=panel_id, className="px-3"),
+    ])
+    return panel
+
+
+def init_accordion_element(title: str, graph_id: object, tab_n: int, group_n: int, controls: list = None,
+                           children: list = None, panels: list = None) -> object:
     """
     This function defines the template for the accordion cards.
     Args:
         title (str): Title of the card
-        graph_id (str): id of the collapse
+        graph_id (str or dict): id of the card body
         tab_n (int): Number of the card
         group_n (int): Number of the group
+        controls (list): Optional input components shown above the card body
+        children (list): Optional static content of the card body
+        panels (list): Optional background panels shown below the card body
 
     Returns: 
         accordion (object)
     """
+    body = dbc.CardBody(
+        id=graph_id,
+        children=children or []
+    )
+
+    if controls:
+        body = [html.Div(controls, className="px-3 pt-3"), body]
+
+    if panels:
+        body = (body if isinstance(body, list) else [body]) + panels
+
     accordion = dbc.Card(
         [
             dbc.CardHeader(
@@ -29,11 +103,8 @@ def init_accordion_element(title: str, graph_id: str, tab_n: int, group_n: int)
             ),
             
             dbc.Collapse(
-                dbc.CardBody(
-                    id=graph_id,
-                    children=[]
-                ),
-                id=f"tab-{tab_n}-collapse-{group_n}",
+                body,
+                id=collapse_id(f"tab-{tab_n}-collapse-{group_n}"),
                 is_open=False,
             ),
         ], color="#1E1E1E"
@@ -1,3 +1,8 @@
+import os
+import dataclasses
+
+import flask
+
 # Dash and Plotly
 from dash import Dash
 
@@ -7,6 +12,34 @@ from .map_layout import init_layout
 # Dash Callbacks
 from .map_callbacks import init_callbacks
 
+# Datasets
+from .snapshot import SnapshotReloader, current_snapshot, on_swap
+from .callbacks.util.bundle import code_version
+from .callbacks.util.jobs import init_job_manager
+
+# Token of the admin endpoints, which are disabled when it is not set
+ADMIN_TOKEN = os.environ.get('DASHMAP_ADMIN_TOKEN')
+
+# Endpoints answered from the data snapshot alone, validated by the data version
+DATA_ENDPOINTS = ('_dash-layout', '_data-version')
+
+
+def warm_layout(snapshot):
+    """
+    Builds the page layout of a new snapshot before it is swapped in.
+    """
+    return dataclasses.replace(snapshot, layout=init_layout(snapshot))
+
+
+def serve_layout():
+    """
+    Layout of the current snapshot, prebuilt when the snapshot was loaded.
+    """
+    return current_snapshot().layout
+
+
+reloader = SnapshotReloader(warmers=[warm_layout])
+
 
 def edit_index_string(app) -> object:
     """
@@ -48,6 +81,79 @@ def edit_index_string(app) -> object:
     return app
 
 
+def init_data_versions(app) -> None:
+    """
+    Exposes the version of the served data on the app and in the HTTP validators of the dashboard.
+    Responses carry the combined version in an X-Data-Version header. GET responses of the data
+    endpoints get an ETag of the data version and the dashboard code, and are answered with
+    304 Not Modified without being built when the client has the current one.
+    The version follows the current data snapshot.
+    ---
+    Args:
+        app (object): Dash app
+
+    Returns: None
+    """
+    def set_versions(snapshot):
+        app.data_versions = snapshot.versions
+        app.server.config['DATA_VERSION'] = snapshot.versions.combined
+
+    set_versions(current_snapshot())
+    on_swap(set_versions)
+    base_path = app.config.url_base_pathname
+
+    @app.server.route(f"{base_path}_data-version")
+    def data_version():
+        return flask.jsonify(app.data_versions.to_dict())
+
+    # The responses of the data endpoints only change with the data and the code that builds them
+    code = code_version()
+    data_paths = {f"{base_path}{endpoint}" for endpoint in DATA_ENDPOINTS}
+
+    @app.server.before_request
+    def check_data_version():
+        if flask.request.method != 'GET' or flask.request.path not in data_paths:
+            return None
+
+        # Read before the response is built, so that a swap in between never tags new data as old
+        flask.g.etag = f"{current_snapshot().versions.combined}-{code}"
+        if flask.g.etag in flask.request.if_none_match:
+            response = flask.Response(status=304)
+            response.set_etag(flask.g.etag)
+            return response
+        return None
+
+    @app.server.after_request
+    def add_data_version(response):
+        if not flask.request.path.startswith(base_path):
+            return response
+
+        response.headers['X-Data-Version'] = current_snapshot().versions.combined
+        if 'etag' in flask.g and response.status_code == 200 and 'ETag' not in response.headers:
+            response.set_etag(flask.g.etag)
+        return response
+
+
+def init_admin_reload(app, reloader: SnapshotReloader) -> None:
+    """
+    Adds an endpoint that reloads the datasets in the background.
+    It needs the DASHMAP_ADMIN_TOKEN in an X-Admin-Token header and is disabled if no token is set.
+    ---
+    Args:
+        app (object): Dash app
+        reloader (SnapshotReloader): reloader of the data snapshots
+
+    Returns: None
+    """
+    @app.server.route(f"{app.config.url_base_pathname}_admin/reload", methods=['POST'])
+    def admin_reload():
+        if not ADMIN_TOKEN or flask.request.headers.get('X-Admin-Token') != ADMIN_TOKEN:
+            flask.abort(404)
+
+        reloader.trigger(force=flask.request.args.get('force') == '1')
+        return flask.jsonify({'status': 'reloading', 'version': current_snapshot().versions.combined}), 202
+
+
 def init_dashboard(server):
     """
     Initialize the dashboard.
@@ -62,13 +168,26 @@ def init_dashboard(server):
         __name__,
         title="Dashmap",
         server=server,
-        url_base_pathname='/helsinki/'
+        url_base_pathname='/helsinki/',
+        # Job queue of the panels rendered in the background
+        background_callback_manager=init_job_manager(),
     )
 
     dash_app = edit_index_string(dash_app)
 
-    dash_app.layout = init_layout()
+    # The first snapshot is loaded once per process, later ones by the reloader
+    if current_snapshot() is None:
+        reloader.reload()
+
+    # Callback validation only needs the component ids of every tab, not the data of a snapshot
+    dash_app.validation_layout = init_layout(current_snapshot(), with_map=False, lazy_tabs=False)
+    dash_app.layout = serve_layout
 
     init_callbacks(dash_app)
 
+    init_data_versions(dash_app)
+    init_admin_reload(dash_app, reloader)
+
+    reloader.start()
+
     return dash_app.server
@@ -6,17 +6,14 @@ from .map_graphs import *
 from .callbacks.util.helpers import *
 from .callbacks.accordions.init_accordions import init_all_accordions
 
-from .callbacks.tab_census.census_callbacks import init_census_callbacks
+from .callbacks.tab_callbacks import init_tab_callbacks
+from .callbacks.area_callbacks import init_area_callbacks
+from .callbacks.util.jobs import init_panel_requests
 from .callbacks.tab_real_estate.real_estate_callbacks import init_re_callbacks
-from .callbacks.tab_services.services_callbacks import init_services_callbacks
 from .callbacks.tab_mobility.mobility_callbacks import init_mobility_callbacks
 from .callbacks.tab_environment.environment_callbacks import init_env_callbacks
 
 
-# Load datasets
-datum, real_estate, bus_stops = load_datum()
-
-
 def init_callbacks(dash_app: dash.callback_context) -> None:
     """
     Initialize Dash callbacks.
@@ -29,11 +26,16 @@ def init_callbacks(dash_app: dash.callback_context) -> None:
     init_modal_popup(dash_app)
     init_all_accordions(dash_app)
 
+    # Tabs loaded on first activation
+    init_tab_callbacks(dash_app)
+
+    # Panels rendered in background jobs
+    init_panel_requests(dash_app)
+
     # Dashboards
-    init_census_callbacks(dash_app, datum)
-    init_re_callbacks(dash_app, real_estate)
-    init_services_callbacks(dash_app, datum)
-    init_mobility_callbacks(dash_app, datum)
+    init_area_callbacks(dash_app)
+    init_re_callbacks(dash_app)
+    init_mobility_callbacks(dash_app)
     init_env_callbacks(dash_app)
 
  
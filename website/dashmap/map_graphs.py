@@ -2,13 +2,15 @@
 This module creates the main Graph objects.
 """
 import os
-import json
 import pandas as pd
 import geopandas as gpd
 
 # Dash & Plotly
 import plotly.graph_objects as go
 
+from .datasets.datum import load_attributes
+from .datasets.stops import load_stops
+
 # Colors used by graphs
 colors = [
     '#4182C8', '#2E94B2',
@@ -25,23 +27,21 @@ def load_datum():
     Args: None
 
     Returns:
-        datum (object: gpd.GeoDataFrame): main geodataframe
+        datum (object: pd.DataFrame): census attributes by postal code
         real_estate (object: pd.DataFrame): dataframe with real estate data
-        bus_stops (object: gpd.GeoDataFrame): dataframe with real estate data
+        bus_stops (object: gpd.GeoDataFrame): public transport stations
     """
-    datum = gpd.read_file(open("website/data/datum/datum.geojson"), crs="WGS84")
-    datum.rename(columns={'index': 'postal_code'}, inplace=True)
-    datum.set_index('postal_code', inplace=True)
+    datum = load_attributes()
 
     real_estate = pd.read_csv('website/data/real-estate/real-estate.csv')
     real_estate.set_index('postcode', inplace=True)
 
-    bus_stops = gpd.read_file(open("website/data/mobility/HSL_stations.geojson"), crs="WGS84")
+    bus_stops = load_stops()
     return datum, real_estate, bus_stops
 
 
 def add_choropleth_layer(
-        name: str, fig: go.Figure, df: pd.DataFrame, z_index: int,
+        name: str, fig: go.Figure, df: pd.DataFrame, geojson: dict, z_index: int,
         colorscale: str, ticksize: int, visible: str = 'legendonly') -> None:
     """
     This function adds a trace
@@ -50,7 +50,8 @@ def add_choropleth_layer(
     Args:
         name (str): Name of the trace
         fig (go.Figure): plotly graph object
-        df (pd.DataFrame): dataframe or geodataframe
+        df (pd.DataFrame): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
         z_index (int): Choropleth color value
         colorscale (str): Color map of color bar
         ticksize (int): Size of color bar ticks
@@ -59,7 +60,6 @@ def add_choropleth_layer(
     Returns:
         None
     """
-    geojson = json.loads(df.to_json())
     locations = df.index
     neighborhood = df['neighborhood']
     z = df.iloc[:, z_index]
@@ -92,14 +92,15 @@ def add_choropleth_layer(
     )
 
 
-def add_postal_areas(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_postal_areas(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with postal districts
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -107,7 +108,7 @@ def add_postal_areas(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Postal Areas",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=df['Inhabitants, total, 2019 (HE)'],
             colorscale=["#A9A9A9", "#A9A9A9"],
@@ -131,14 +132,15 @@ def add_postal_areas(fig: go.Figure, df: pd.DataFrame) -> None:
     )
 
 
-def add_population(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_population(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with population
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -146,7 +148,7 @@ def add_population(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Population",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=df['Inhabitants, total, 2019 (HE)'],
             colorscale='blues',
@@ -171,14 +173,15 @@ def add_population(fig: go.Figure, df: pd.DataFrame) -> None:
     )
 
 
-def add_income(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_income(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with Avg. Individual Income
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -187,7 +190,7 @@ def add_income(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Avg. Individual Income",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=df['Average income of inhabitants, 2019 (HR)'],
             colorscale="Bluered",
@@ -213,14 +216,15 @@ def add_income(fig: go.Figure, df: pd.DataFrame) -> None:
     )
 
 
-def add_household_income(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_household_income(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with Avg. Households Income
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -228,7 +232,7 @@ def add_household_income(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Avg. Households Income",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=df['Average income of households, 2019 (TR)'],
             colorscale="hot",
@@ -254,14 +258,15 @@ def add_household_income(fig: go.Figure, df: pd.DataFrame) -> None:
     )
 
 
-def add_avg_age(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_avg_age(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with Avg. Inhabitant Age
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -270,7 +275,7 @@ def add_avg_age(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Avg. Inhabitant Age",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=z,
             colorscale="tealgrn",
@@ -295,14 +300,15 @@ def add_avg_age(fig: go.Figure, df: pd.DataFrame) -> None:
     )
 
 
-def add_avg_household_size(fig: go.Figure, df: pd.DataFrame) -> None:
+def add_avg_household_size(fig: go.Figure, df: pd.DataFrame, geojson: dict) -> None:
     """
     This function adds a trace with Avg. Household Size
     for plotly figure object.
     ---
     Args:
         fig (object): plotly graph object
-        df (object): dataframe or geodataframe
+        df (object): dataframe with the attributes
+        geojson (dict): postal area geometries, postal code as feature id
 
     Returns:
         None
@@ -310,7 +316,7 @@ def add_avg_household_size(fig: go.Figure, df: pd.DataFrame) -> None:
     fig.add_trace(
         go.Choroplethmapbox(
             name="Avg. Household Size",
-            geojson=json.loads(df.to_json()),
+            geojson=geojson,
             locations=df.index,
             z=df['Average size of households, 2019 (TE)'],
             colorscale="aggrnyl",
@@ -434,12 +440,13 @@ def save_image(fig: go.Figure, width: int = 3840, height: int = 2160) -> None:
     )
 
 
-def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
+def init_choropleth(df: pd.DataFrame, geojson: dict, df_mobility: pd.DataFrame) -> object:
     """
     Initialize the main choropleth map.
     ---
     Args:
         df (pd.DataFrame): DataFrame containing census data
+        geojson (dict): postal area geometries, postal code as feature id
         df_mobility (pd.DataFrame): DataFrame containing bus stops data
     Returns:
         choropleth (go.Figure): Plotly Graph Object
@@ -451,6 +458,7 @@ def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
         name="Postal Areas",
         fig=choropleth,
         df=df,
+        geojson=geojson,
         z_index=3,
         colorscale=["#A9A9A9", "#A9A9A9"],
         ticksize=1,
@@ -461,6 +469,7 @@ def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
         name="Population",
         fig=choropleth,
         df=df,
+        geojson=geojson,
         z_index=3,
         colorscale='blues',
         ticksize=10,
@@ -470,6 +479,7 @@ def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
         name="Avg. Individual Income",
         fig=choropleth,
         df=df,
+        geojson=geojson,
         z_index=35,
         colorscale='Bluered',
         ticksize=10,
@@ -479,6 +489,7 @@ def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
         name="Avg. Households Income",
         fig=choropleth,
         df=df,
+        geojson=geojson,
         z_index=59,
         colorscale='hot',
         ticksize=10,
@@ -488,6 +499,7 @@ def init_choropleth(df: pd.DataFrame, df_mobility: pd.DataFrame) -> object:
         name="Avg. Household Size",
         fig=choropleth,
         df=df,
+        geojson=geojson,
         z_index=42,
         colorscale='aggrnyl',
         ticksize=10,
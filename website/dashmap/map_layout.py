@@ -15,6 +15,8 @@ from .layouts.tab_environment.main_environment import init_tab_environment
 
 from .layouts.navbar.navbar import init_navbar
 
+from .callbacks.tab_environment.environment_callbacks import render_air_temperature
+
 
 def layout_main(navbar: dbc.NavbarSimple, tabs: object, choropleth: object) -> html.Div:
     """
@@ -55,38 +57,91 @@ def layout_main(navbar: dbc.NavbarSimple, tabs: object, choropleth: object) -> h
                     ),
                 ]
             ), 
+            # Summary of the clicked postal area, written by the map click handler
+            dcc.Store(id='area-snapshot'),
+            # Key of the area every section was last rendered for, sections showing another area are stale
+            dcc.Store(id='area-sections', data={}),
+            # Tabs whose content is in the page, and the tab to load next
+            dcc.Store(id='tabs-loaded', data=[DEFAULT_TAB]),
+            dcc.Store(id='tab-request'),
         ]
     )
     return layout
 
 
-def init_layout() -> object:
+# Content of every tab, by tab_id. Only the first tab is in the initial layout,
+# the others are loaded the first time they are activated and then kept in the page.
+TAB_CONTENTS = {
+    'census': lambda snapshot: init_tab_census(),
+    'real-estate': lambda snapshot: init_tab_real_estate(),
+    'services': lambda snapshot: init_tab_services(),
+    'mobility': lambda snapshot: init_tab_mobility(),
+    'environment': lambda snapshot: init_tab_environment(
+        snapshot.wind.years, render_air_temperature(snapshot.climatology)
+    ),
+}
+
+# Datasets read by the content of every tab, keys of DATASET_FILES
+TAB_DATASETS = {
+    'census': (),
+    'real-estate': (),
+    'services': (),
+    'mobility': (),
+    'environment': ('environment',),
+}
+
+TAB_LABELS = {
+    'census': "Census",
+    'real-estate': "Real Estate",
+    'services': "Services",
+    'mobility': "Mobility",
+    'environment': "Environment",
+}
+
+DEFAULT_TAB = 'census'
+
+
+def init_tab_content(snapshot, tab_id: str) -> object:
+    """
+    Builds the content of a tab.
+    Args:
+        snapshot (DataSnapshot): datasets shown by the layout
+        tab_id (str): tab_id of the tab, key of TAB_CONTENTS
+
+    Returns:
+        content (object): dash dbc.Card() of the tab
+    """
+    return TAB_CONTENTS[tab_id](snapshot)
+
+
+def init_layout(snapshot, with_map: bool = True, lazy_tabs: bool = True) -> object:
     """
     Initialize the navbar and all tabs.
-    Args: None
+    Args:
+        snapshot (DataSnapshot): datasets shown by the layout
+        with_map (bool): build the choropleth. An empty map is enough for callback validation.
+        lazy_tabs (bool): build only the content of the default tab. Callback validation needs all tabs.
 
     Returns: 
         layout (object): Main layout of the app
     """
-    datum, real_estate, bus_stops = load_datum()
-    choropleth = init_choropleth(datum, bus_stops)
+    choropleth = init_choropleth(snapshot.datum, snapshot.areas, snapshot.bus_stops) if with_map else go.Figure()
 
     navbar = init_navbar()
 
-    census_tab_content = init_tab_census()
-    real_estate_tab_content = init_tab_real_estate()
-    services_tab_content = init_tab_services()
-    mobility_tab_content = init_tab_mobility()
-    environment_tab_content = init_tab_environment()
-
     tabs = dbc.Tabs(
         [
-            dbc.Tab(census_tab_content, label="Census", disabled=False),
-            dbc.Tab(real_estate_tab_content, label="Real Estate", disabled=False),
-            dbc.Tab(services_tab_content, label="Services", disabled=False),
-            dbc.Tab(mobility_tab_content, label="Mobility", disabled=False),
-            dbc.Tab(environment_tab_content, label="Environment", disabled=False),
-        ]
+            dbc.Tab(
+                html.Div(
+                    init_tab_content(snapshot, tab_id) if tab_id == DEFAULT_TAB or not lazy_tabs else None,
+                    id=f"tab-content-{tab_id}",
+                ),
+                label=label, tab_id=tab_id, disabled=False,
+            )
+            for tab_id, label in TAB_LABELS.items()
+        ],
+        id='tabs',
+        active_tab=DEFAULT_TAB,
     )
 
     return layout_main(navbar, tabs, choropleth)
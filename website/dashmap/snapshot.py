@@ -0,0 +1,192 @@
+"""
+Immutable snapshots of the datasets served by the dash app, and their hot reload.
+
+Callbacks read their data from `current_snapshot()` once per request. A reload loads
+a complete new snapshot in the background, warms it and then swaps the reference,
+so in-flight requests finish on the snapshot they started with and the old one is
+freed when the last of them returns.
+"""
+import os
+import time
+import logging
+import threading
+import dataclasses
+from typing import Callable, List, Optional
+
+import pandas as pd
+import geopandas as gpd
+
+from .map_graphs import load_datum
+from .datasets.datum import load_areas
+from .datasets.versions import DataVersions, load_versions
+from .datasets.geometry import AreaGeometry
+from .datasets.wind import WindCube
+from .datasets.air_quality import AirQualitySeries
+from .datasets.air_temperature import Climatology
+from .datasets.environment import EnvironmentStore
+from .datasets.reference import reference_statistics
+from .datasets.real_estate import RealEstateSnapshot, load_snapshot as load_listings
+
+logger = logging.getLogger(__name__)
+
+MOBILITY_PATH = 'website/data/mobility/mobility.csv'
+
+# Seconds between checks of the data files, 0 disables the file watch
+RELOAD_INTERVAL = float(os.environ.get('DASHMAP_RELOAD_INTERVAL', 30))
+
+
+@dataclasses.dataclass(frozen=True)
+class DataSnapshot:
+    """
+    Every dataset used by the callbacks, loaded together and never modified afterwards.
+    """
+    versions: DataVersions
+    datum: pd.DataFrame
+    reference: pd.DataFrame
+    areas: dict
+    geometry: AreaGeometry
+    real_estate: pd.DataFrame
+    listings: RealEstateSnapshot
+    bus_stops: gpd.GeoDataFrame
+    mobility: pd.DataFrame
+    wind: WindCube
+    climatology: Climatology
+    air_quality: AirQualitySeries
+    environment: EnvironmentStore
+    layout: object = None
+
+
+def load_snapshot(attempts: int = 3) -> DataSnapshot:
+    """
+    Loads all datasets. The versions are read before and after loading and the load is
+    repeated if a file changed in between, so that the versions describe the loaded data.
+    ---
+    Args:
+        attempts (int): maximum number of loads
+
+    Returns:
+        (DataSnapshot): snapshot without a layout
+    """
+    for _ in range(attempts):
+        versions = load_versions()
+
+        datum, real_estate, bus_stops = load_datum()
+        mobility = pd.read_csv(MOBILITY_PATH, dtype='str')
+        mobility.set_index('index', inplace=True)
+
+        snapshot = DataSnapshot(
+            versions=versions,
+            datum=datum,
+            reference=reference_statistics(datum),
+            areas=load_areas(),
+            geometry=AreaGeometry.load(),
+            real_estate=real_estate,
+            listings=load_listings(),
+            bus_stops=bus_stops,
+            mobility=mobility,
+            wind=WindCube.load(),
+            climatology=Climatology.load(),
+            air_quality=AirQualitySeries.load(),
+            environment=EnvironmentStore.load(),
+        )
+        if load_versions() == versions:
+            return snapshot
+
+    raise RuntimeError(f"Data files kept changing during {attempts} loads")
+
+
+_current: Optional[DataSnapshot] = None
+_listeners: List[Callable[[DataSnapshot], None]] = []
+
+
+def current_snapshot() -> DataSnapshot:
+    """
+    Snapshot for readers. Keep the returned reference for the duration of a request.
+    """
+    return _current
+
+
+def swap_snapshot(snapshot: DataSnapshot) -> None:
+    """
+    Atomically replaces the snapshot seen by readers and notifies the listeners.
+    """
+    global _current
+    _current = snapshot
+    for listener in list(_listeners):
+        listener(snapshot)
+
+
+def on_swap(listener: Callable[[DataSnapshot], None]) -> None:
+    """
+    Registers a function called with every new snapshot.
+    """
+    _listeners.append(listener)
+
+
+class SnapshotReloader:
+    """
+    Builds, warms and swaps in a new snapshot when the data versions change.
+    """
+    def __init__(self, warmers: List[Callable[[DataSnapshot], DataSnapshot]] = (),
+                 interval: float = RELOAD_INTERVAL):
+        """
+        Args:
+            warmers (list): functions that return a warmed copy of a new snapshot, applied in order
+            interval (float): seconds between checks of the data files, 0 disables the watch
+        """
+        self.warmers = list(warmers)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Builds and swaps in a new snapshot if the data changed.
+        ---
+        Args:
+            force (bool): rebuild even if the versions did not change
+
+        Returns:
+            (bool): True if a new snapshot was swapped in
+        """
+        with self._lock:
+            current = current_snapshot()
+            if not force and current is not None and load_versions() == current.versions:
+                return False
+
+            start = time.perf_counter()
+            snapshot = load_snapshot()
+            for warm in self.warmers:
+                snapshot = warm(snapshot)
+            swap_snapshot(snapshot)
+
+        logger.info("Swapped in data snapshot %s in %.2fs", snapshot.versions.combined, time.perf_counter() - start)
+        return True
+
+    def trigger(self, force: bool = False) -> threading.Thread:
+        """
+        Runs a reload in a background thread.
+        """
+        thread = threading.Thread(target=self._reload_logged, args=(force,), daemon=True)
+        thread.start()
+        return thread
+
+    def start(self) -> None:
+        """
+        Starts watching the data files, once per process.
+        """
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def _watch(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            self._reload_logged(False)
+
+    def _reload_logged(self, force: bool) -> None:
+        try:
+            self.reload(force)
+        except Exception:
+            logger.exception("Data reload failed, keeping snapshot %s", current_snapshot().versions.combined)
@@ -1,8 +1,9 @@
-# This file can be used to preview the datum.json
+# This file can be used to preview the datum
 # on a map with its traces.
 import os
 import sys
 from dashmap import map_graphs
+from dashmap.datasets.datum import load_areas
 
 dirname = os.path.dirname(__file__)
 dirname = dirname.replace('data/datum', '')
@@ -11,13 +12,13 @@ sys.path.insert(0, dirname)
 
 def main() -> None:
     """
-    Plots the datum json on a map.
+    Plots the datum on a map.
     ---
     Args: None
     Returns: None
     """
     df1, df2, df3 = map_graphs.load_datum()
-    choropleth = map_graphs.init_choropleth(df1, df3)
+    choropleth = map_graphs.init_choropleth(df1, load_areas(), df3)
     choropleth = map_graphs.update_layout_and_traces(choropleth)
     choropleth.show()
 
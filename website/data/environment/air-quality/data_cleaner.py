@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -23,12 +24,37 @@ def cleaner():
     df.drop(['year', 'month', 'day'], axis=1, inplace=True)
     df.dropna(axis=1, how='all', inplace=True)
 
-    x = df.groupby(df.Date.dt.date).mean().reset_index()
+    x = df.groupby(df.Date.dt.date).mean(numeric_only=True).reset_index()
     print(x.describe())
     x.to_csv('website/data/environment/air-quality/air_quality_2020_clean.csv', index=False)
     return x
 
 
+def build_series(path: str = "website/data/environment/air-quality/air_quality_2020.csv") -> None:
+    """
+    Exports the full hourly history as typed arrays for the air quality series engine.
+    Timestamps are stored as int64 seconds since epoch (UTC), measurements as float32 with NaN gaps.
+    """
+    df = pd.read_csv(path)
+    df.dropna(axis=1, how='all', inplace=True)
+
+    timestamps = pd.to_datetime(
+        df['Year'].astype(str) + '-' + df['m'].astype(str) + '-' + df['d'].astype(str) + ' ' + df['Time'],
+        format='%Y-%m-%d %H:%M',
+    )
+    order = np.argsort(timestamps.to_numpy(), kind='stable')
+
+    names = [column for column in df.columns if column not in ('Year', 'm', 'd', 'Time', 'Time zone')]
+    values = df[names].to_numpy(dtype=np.float32)[order].T
+
+    np.savez_compressed(
+        'website/data/environment/air-quality/air_quality_series.npz',
+        time=timestamps.to_numpy()[order].astype('datetime64[s]').astype(np.int64),
+        names=np.array(names),
+        values=values,
+    )
+
+
 def create_temp_graph(df):
     """
     """
@@ -94,4 +120,5 @@ def main():
     create_temp_graph(df)
 
 
-main()
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,5 @@
+import warnings
+
 import pandas as pd
 import numpy as np
 
@@ -13,40 +15,188 @@ colors = [
 ]
 
 
-def degrees_to_cardinal(degree: float):
+# Speed bins of the wind rose, applied to wind speeds rounded up to whole m/s
+# Same bins as (-1, 5], (5, 8], (8, 10], (10, 11] of the former pd.cut
+SPEED_EDGES = [-0.5, 5.5, 8.5, 10.5, 11.5]
+
+# 1 degC bins of the air temperature histogram
+TEMPERATURE_EDGES = np.arange(-40.5, 41.5, 1.0)
+
+# Position of the first day of each month in a leap year, shared day-of-year axis of all years
+MONTH_OFFSETS = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+# Days on each side of a day of year pooled into its climatology
+CLIMATOLOGY_WINDOW = 7
+
+CLIMATOLOGY_PERCENTILES = [10, 50, 90]
+
+# Rows of a raw file held in memory at once
+CHUNK_ROWS = 100_000
+
+DAY_KEYS = ['Year', 'm', 'd']
+
+TEMPERATURE = 'Air temperature (degC)'
+
+
+def read_chunks(path: str, columns: list, chunk_rows: int = CHUNK_ROWS):
     """
+    Streams the complete rows of a raw FMI observation file.
+    ---
+    Args:
+        path (str): raw CSV file
+        columns (list): columns to read, rows with a missing value are dropped
+        chunk_rows (int): rows per chunk
+
+    Yields:
+        (pd.DataFrame): chunks of at most chunk_rows rows
     """
-    dirs = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    index = int((degree + 11.25)/22.5)
-    return dirs[index % 16]
+    for chunk in pd.read_csv(path, usecols=DAY_KEYS + columns, chunksize=chunk_rows):
+        chunk = chunk.dropna()
+        if len(chunk):
+            yield chunk
 
 
-def get_values(df: object, column: str = 'direction') -> dict:
+class Rollup:
     """
-    This function calculates what percentage of speed-range was from a given direction.
-    For example 20% of all 10-15 m/s wind records was from North.
+    Running daily aggregates and a monthly histogram of observations, updated chunk by chunk.
+    Memory depends on the number of days and histogram bins, not on the number of rows.
     """
-    percentages = df[column].value_counts(normalize=True)
-    result = percentages.multiply(other=100)
-    result = result.to_dict()
-    return result
+    def __init__(self, values: dict, edges: dict):
+        """
+        Args:
+            values (dict): column aggregated per day (count, sum, min and max) -> short name used in exports
+            edges (dict): column -> bin edges of the histogram axes
+        """
+        self.values = values
+        self.edges = edges
+        self.daily = None
+        self.counts = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        days = chunk.groupby(DAY_KEYS)[list(self.values)].agg(['count', 'sum', 'min', 'max'])
+        if self.daily is not None:
+            days = pd.concat([self.daily, days]).groupby(level=DAY_KEYS).agg(
+                {column: column[1] if column[1] in ('min', 'max') else 'sum' for column in days.columns}
+            )
+        self.daily = days
+
+        bins = [np.arange(13) - 0.5] + list(self.edges.values())
+        for year, rows in chunk.groupby('Year'):
+            sample = np.column_stack(
+                [rows['m'].to_numpy() - 1] + [rows[column].to_numpy(dtype=float) for column in self.edges]
+            )
+            counts, _ = np.histogramdd(sample, bins=bins)
+            self.counts[year] = self.counts.get(year, 0) + counts.astype(np.uint32)
+
+    def monthly(self) -> pd.DataFrame:
+        """
+        Monthly count, sum, min and max of every value, derived from the daily aggregates.
+        """
+        return self.daily.groupby(level=['Year', 'm']).agg(
+            {column: column[1] if column[1] in ('min', 'max') else 'sum' for column in self.daily.columns}
+        )
+
+    def cube(self) -> tuple:
+        """
+        Returns:
+            counts (np.ndarray): uint32 counts of shape (years, 12, *histogram bins)
+            years (np.ndarray): year of each slice of the first axis
+        """
+        years = np.array(sorted(self.counts), dtype=int)
+        return np.stack([self.counts[year] for year in years]), years
+
+    def arrays(self) -> dict:
+        """
+        Daily and monthly aggregates as flat arrays, keyed like `daily_<short name>_<stat>`.
+        """
+        result = {}
+        for name, table in [('daily', self.daily), ('monthly', self.monthly())]:
+            for level in table.index.names:
+                result[f"{name}_{level}"] = table.index.get_level_values(level).to_numpy(dtype=np.int16)
+            for value, stat in table.columns:
+                dtype = np.uint32 if stat == 'count' else np.float64 if stat == 'sum' else np.float32
+                result[f"{name}_{self.values[value]}_{stat}"] = table[(value, stat)].to_numpy(dtype=dtype)
+        return result
+
+
+def stream_wind(path: str = "website/data/environment/air-temperature-wind/raw_wind.csv",
+                chunk_rows: int = CHUNK_ROWS) -> Rollup:
+    """
+    Rolls up wind speed per day and bins all wind samples by month, speed and direction.
+    ---
+    Args:
+        path (str): raw FMI wind observations
+        chunk_rows (int): rows per chunk
+
+    Returns:
+        (Rollup): rollup of 'Wind speed (m/s)' with a (speed bin, direction) histogram
+    """
+    rollup = Rollup(
+        values={'Wind speed (m/s)': 'speed'},
+        edges={'speed_bin': SPEED_EDGES, 'direction': np.arange(17) - 0.5},
+    )
+    for chunk in read_chunks(path, ['Wind direction (deg)', 'Wind speed (m/s)'], chunk_rows):
+        chunk['speed_bin'] = np.ceil(chunk['Wind speed (m/s)'].to_numpy(dtype=float))
+        chunk['direction'] = directions_to_index(chunk['Wind direction (deg)'].to_numpy(dtype=float))
+        rollup.update(chunk)
+    return rollup
+
+
+def stream_air_temperature(path: str = "website/data/environment/air-temperature-wind/raw_air_temp.csv",
+                           chunk_rows: int = CHUNK_ROWS) -> Rollup:
+    """
+    Rolls up air temperature per day and bins all samples by month and 1 degC bin.
+    ---
+    Args:
+        path (str): raw FMI air temperature observations
+        chunk_rows (int): rows per chunk
+
+    Returns:
+        (Rollup): rollup of 'Air temperature (degC)'
+    """
+    rollup = Rollup(
+        values={TEMPERATURE: 'temperature'},
+        edges={TEMPERATURE: TEMPERATURE_EDGES},
+    )
+    for chunk in read_chunks(path, [TEMPERATURE], chunk_rows):
+        rollup.update(chunk)
+    return rollup
+
+
+def directions_to_index(degrees: np.ndarray) -> np.ndarray:
+    """
+    Index of the 16-point compass direction (N, NNE, NE ... NNW) of wind directions in degrees.
+    """
+    return np.floor((np.asarray(degrees) + 11.25) / 22.5).astype(int) % 16
+
+
+def export_cube(counts: np.ndarray, years: np.ndarray, rollups: dict = None) -> None:
+    """
+    Export the wind cube, and optionally the daily and monthly wind rollups, to a compressed numpy archive.
+    """
+    np.savez_compressed(
+        'website/data/environment/air-temperature-wind/wind_cube.npz',
+        counts=counts,
+        years=years,
+        speed_edges=np.array(SPEED_EDGES),
+        **(rollups or {}),
+    )
 
 
-def sorting(result: dict) -> list:
+def rose_percentages(counts: np.ndarray) -> list:
     """
-    This function returns a list of the percentage values in the order defined in "dirs" list.
+    Share of each direction within each speed bin, in percent.
+    For example 20% of all 8-10 m/s wind records was from North.
+    ---
+    Args:
+        counts (np.ndarray): counts of shape (speed bins, 16)
+
+    Returns:
+        (list): one list of 16 percentages per speed bin
     """
-    dirs = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    lst = []      
-    for direction in dirs:
-        try:
-            value = result[direction]
-        except:
-            value = 0
-        lst.append(value)
-    return lst
+    totals = counts.sum(axis=1, keepdims=True)
+    percentages = np.divide(100 * counts, totals, out=np.zeros(counts.shape), where=totals > 0)
+    return percentages.tolist()
 
 
 def export_csv(r_1: list, r_2: list, r_3: list, r_4: list) -> None:
@@ -106,18 +256,95 @@ def create_windrose_graph(r_1: list, r_2: list, r_3: list, r_4: list) -> None:
     fig.show()
 
 
-def extract_weather_data() -> object:
+def build_climatology(years: np.ndarray, months: np.ndarray, days: np.ndarray, means: np.ndarray,
+                      window: int = CLIMATOLOGY_WINDOW) -> dict:
     """
+    Climatology of daily mean temperatures over all years, and the anomaly of the latest year.
+    Daily means are laid out on a years x 366 day-of-year grid (NaN where missing) and all
+    statistics are reductions over that grid. Each day of year pools the days within `window`
+    of it, so that a few years of data still give stable percentiles.
+    ---
+    Args:
+        years, months, days (np.ndarray): date of each daily mean
+        means (np.ndarray): daily mean temperatures
+        window (int): days on each side pooled into a day of year
+
+    Returns:
+        (dict): float32 arrays per day of year (366) and month (12), see the keys
     """
-    df = pd.read_csv("website/data/environment/air-temperature-wind/raw_air_temp.csv")
-    df.dropna(inplace=True)
-    df = df[df['Year'] == 2020]
-    df['air_temp'] = df['Air temperature (degC)'].astype(int)
-    df = df.groupby(['m']).mean()
-    df['month'] = df.index
-    df.reset_index(inplace=True)
+    all_years = np.unique(years)
+    rows = np.searchsorted(all_years, years)
+
+    grid = np.full((len(all_years), 366), np.nan)
+    grid[rows, MONTH_OFFSETS[months - 1] + days - 1] = means
+
+    by_month = np.full((len(all_years), 12, 31), np.nan)
+    by_month[rows, months - 1, days - 1] = means
 
-    df.drop(['d', 'Air temperature (degC)', 'm'], axis=1, inplace=True)
+    pooled = np.concatenate([np.roll(grid, shift, axis=1) for shift in range(-window, window + 1)])
+    monthly = by_month.transpose(1, 0, 2).reshape(12, -1)
+
+    with warnings.catch_warnings():
+        # Days and months without any data are NaN
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        result = {
+            'doy_mean': np.nanmean(pooled, axis=0),
+            'month_mean': np.nanmean(monthly, axis=1),
+            'current_doy': grid[-1],
+            'current_month': np.nanmean(by_month[-1], axis=1),
+        }
+        for q, doy, month in zip(
+            CLIMATOLOGY_PERCENTILES,
+            np.nanpercentile(pooled, CLIMATOLOGY_PERCENTILES, axis=0),
+            np.nanpercentile(monthly, CLIMATOLOGY_PERCENTILES, axis=1),
+        ):
+            result[f'doy_p{q}'] = doy
+            result[f'month_p{q}'] = month
+
+    result['doy_anomaly'] = result['current_doy'] - result['doy_mean']
+    result['month_anomaly'] = result['current_month'] - result['month_mean']
+
+    result = {key: value.astype(np.float32) for key, value in result.items()}
+    result.update(years=all_years, current_year=all_years[-1])
+    return result
+
+
+def extract_weather_data(year: int = 2020) -> object:
+    """
+    Streams the raw air temperature file into its rollups and climatology,
+    and the monthly averages of one year.
+    ---
+    Args:
+        year (int): year of the monthly averages shown in the app
+
+    Returns:
+        df (pd.DataFrame): Year, air_temp and month of every month of the year
+    """
+    rollup = stream_air_temperature()
+    counts, years = rollup.cube()
+    np.savez_compressed(
+        'website/data/environment/air-temperature-wind/air_temp_rollups.npz',
+        counts=counts,
+        years=years,
+        temperature_edges=TEMPERATURE_EDGES,
+        **rollup.arrays(),
+    )
+
+    daily = rollup.daily
+    climatology = build_climatology(
+        daily.index.get_level_values('Year').to_numpy(),
+        daily.index.get_level_values('m').to_numpy(),
+        daily.index.get_level_values('d').to_numpy(),
+        (daily[(TEMPERATURE, 'sum')] / daily[(TEMPERATURE, 'count')]).to_numpy(),
+    )
+    np.savez_compressed('website/data/environment/air-temperature-wind/air_temp_climatology.npz', **climatology)
+
+    monthly = rollup.monthly().loc[year]
+    df = pd.DataFrame({
+        'Year': float(year),
+        'air_temp': monthly[(TEMPERATURE, 'sum')] / monthly[(TEMPERATURE, 'count')],
+        'month': monthly.index,
+    })
     df.to_csv('website/data/environment/air-temperature-wind/air_temp_data.csv', index=False)
     return df
 
@@ -157,37 +384,24 @@ def create_temp_graph(df):
     fig.show()
 
 
-def main():
+def build_wind_data() -> tuple:
     """
+    Builds the wind cube and rollups and the wind rose of all records.
     """
-    df = pd.read_csv("website/data/environment/air-temperature-wind/raw_wind.csv")
-    df.dropna(inplace=True)
-
-    df['direction'] = df['Wind direction (deg)'].apply(lambda row: degrees_to_cardinal(row))
-    df['strength'] = df['Wind speed (m/s)'].astype(float)
-    df['strength'] = df['strength'].apply(np.ceil)
-    df['frequency'] = df['direction'].map(df['direction'].value_counts())
-
-    bins = [-1, 5, 8, 10, 11]
-    labels = ["< 5", "5-8", "8-10", "> 11"]
-    df['binned_strength'] = pd.cut(df['strength'],  bins=bins, labels=labels)
+    rollup = stream_wind()
+    counts, years = rollup.cube()
+    export_cube(counts, years, rollup.arrays())
 
-    df_1 = df[df['binned_strength'] == "< 5"]
-    df_2 = df[df['binned_strength'] == "5-8"]
-    df_3 = df[df['binned_strength'] == "8-10"]
-    df_4 = df[df['binned_strength'] == "> 11"]
+    r_1, r_2, r_3, r_4 = rose_percentages(counts.sum(axis=(0, 1)))
+    export_csv(r_1, r_2, r_3, r_4)
+    return r_1, r_2, r_3, r_4
 
-    group_1 = get_values(df_1)
-    group_2 = get_values(df_2)
-    group_3 = get_values(df_3)
-    group_4 = get_values(df_4)
 
-    #r_1 = sorting(group_1)
-    #r_2 = sorting(group_2)
-    #r_3 = sorting(group_3)
-    #r_4 = sorting(group_4)
-    #export_csv(r_1, r_2, r_3, r_4)
-    #create_windrose_graph(r_1, r_2, r_3, r_4)
+def main():
+    """
+    """
+    r_1, r_2, r_3, r_4 = build_wind_data()
+    create_windrose_graph(r_1, r_2, r_3, r_4)
     df = extract_weather_data()
     create_temp_graph(df)
 
@@ -0,0 +1,24 @@
+"""
+Builds the hourly environment store joining wind, air temperature and air quality.
+
+Usage (from the project root):
+    python website/data/environment/environment_store.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.datasets.environment import build_environment
+
+
+def main() -> None:
+    """
+    Aligns the raw observations and writes environment_store.npz.
+    """
+    aligned = build_environment()
+    print(aligned.describe())
+
+
+if __name__ == '__main__':
+    main()
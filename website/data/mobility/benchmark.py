@@ -0,0 +1,95 @@
+"""
+Benchmarks the mobility index build on synthetic nationwide data.
+
+Usage (from the project root):
+    python website/data/mobility/benchmark.py
+"""
+import time
+import runpy
+
+import numpy as np
+import shapely
+import geopandas as gpd
+
+mobility_index = runpy.run_path('website/data/mobility/mobility_index.py', run_name='benchmark')
+
+# Approximate extent of Finland in ETRS-TM35FIN
+FINLAND_BOUNDS = (80_000, 6_630_000, 740_000, 7_770_000)
+
+
+def synthetic_regions(n_regions: int, seed: int = 0) -> gpd.GeoDataFrame:
+    """
+    Voronoi tessellation of the national extent into postal area like polygons.
+    Seeds are clustered so that areas are small in towns and large in the countryside.
+    """
+    rng = np.random.default_rng(seed)
+    minx, miny, maxx, maxy = FINLAND_BOUNDS
+
+    towns = rng.uniform((minx, miny), (maxx, maxy), size=(n_regions // 20 + 1, 2))
+    clustered = towns[rng.integers(len(towns), size=n_regions // 2)] + rng.normal(0, 8_000, (n_regions // 2, 2))
+    uniform = rng.uniform((minx, miny), (maxx, maxy), size=(n_regions - n_regions // 2, 2))
+    seeds = np.clip(np.vstack([clustered, uniform]), (minx, miny), (maxx, maxy))
+
+    extent = shapely.box(*FINLAND_BOUNDS)
+    cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(seeds), extend_to=extent))
+    cells = shapely.intersection(cells, extent)
+
+    regions = gpd.GeoDataFrame(geometry=cells, crs=mobility_index['METRIC_CRS'])
+    regions['index'] = [f"{i:05d}" for i in range(len(regions))]
+    regions['Inhabitants, total, 2020 (HE)'] = rng.integers(0, 20_000, len(regions))
+    return regions, towns
+
+
+def synthetic_stops(n_stops: int, towns: np.ndarray, seed: int = 0) -> gpd.GeoDataFrame:
+    """
+    Stops scattered around the towns, with a random network type.
+    """
+    rng = np.random.default_rng(seed)
+    xy = towns[rng.integers(len(towns), size=n_stops)] + rng.normal(0, 5_000, (n_stops, 2))
+
+    stops = gpd.GeoDataFrame(geometry=gpd.points_from_xy(xy[:, 0], xy[:, 1]), crs=mobility_index['METRIC_CRS'])
+    stops['VERKKO'] = rng.choice([0, 1, 2, 3, 4, 7], size=n_stops, p=[0.1, 0.8, 0.02, 0.04, 0.03, 0.01])
+    return stops
+
+
+def count_points_loop(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame) -> list:
+    """
+    The former per polygon, per point implementation.
+    """
+    points = points['geometry'].to_list()
+    return [sum(region.contains(point) for point in points) for region in regions['geometry'].to_list()]
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Prints the build time of each mobility factor for growing inputs.
+    """
+    print(f"{'regions':>8} {'stops':>8} {'count':>8} {'diversity':>10} {'distance':>9} {'index':>8} {'loop*':>9}")
+
+    for n_regions, n_stops in [(172, 12_770), (1_000, 50_000), (3_000, 100_000)]:
+        regions, towns = synthetic_regions(n_regions)
+        stops = synthetic_stops(n_stops, towns)
+
+        count = timed(mobility_index['count_points'], regions, stops)
+        diversity = timed(mobility_index['network_diversity'], regions, stops)
+        distance = timed(mobility_index['nearest_stop_distances'], regions, stops)
+        index = timed(mobility_index['get_mobility_index'], regions, stops)
+
+        # The loop is extrapolated from a sample of the regions
+        sample = regions.iloc[:20]
+        loop = timed(count_points_loop, sample, stops) * len(regions) / len(sample)
+
+        print(f"{len(regions):>8} {n_stops:>8} {count:>7.3f}s {diversity:>9.3f}s "
+              f"{distance:>8.3f}s {index:>7.3f}s {loop:>8.1f}s")
+
+    print("* former loop implementation, extrapolated from 20 regions")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,33 @@
+import os
+import sys
+from typing import Optional
+
+import numpy as np
+import pandas as pd
 import geopandas as gpd
-from shapely.geometry import shape, Point
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.datasets.datum import load_area_geometries, load_attributes
+from dashmap.datasets.stops import load_stops
+from dashmap.datasets.geometry import AreaGeometry
+
+# Metric CRS used for distances and sampling (ETRS-TM35FIN)
+METRIC_CRS = "EPSG:3067"
+
+# Spacing of the sample points used for distance to nearest stop statistics
+SAMPLE_SPACING = 250  # meters
+
+# Upper bound of the sample grid size, the spacing grows for large extents
+MAX_SAMPLES = 250_000
+
+# Weights of the normalized factors in the composite index
+INDEX_WEIGHTS = {
+    'node_density': 0.4,
+    'network_diversity': 0.2,
+    'nodes_per_inhabitant': 0.2,
+    'proximity': 0.2,
+}
 
 
 def load_data():
@@ -7,63 +35,202 @@ def load_data():
     This function loads the necessary data.
     Args: None
 
-    Returns: 
+    Returns:
         regions, stations (object: gpd.GeoDataFrame): Geodataframe
+        geometry (AreaGeometry): precomputed area and population centre of the regions
     """
-    regions = gpd.read_file(open("website/data/datum/datum.geojson"), crs="WGS84")
-    stations = gpd.read_file(open("website/data/mobility/HSL_stations.geojson"), crs="WGS84")
-    return regions, stations
+    attributes = load_attributes()
+    regions = load_area_geometries().join(attributes[[attributes.columns[3]]])
+    regions = regions.rename_axis('index').reset_index()
+    stations = load_stops()
+    return regions, stations, AreaGeometry.load()
 
 
-def count_points(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame) -> list:
+def join_points(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame) -> tuple:
     """
-    Args: 
+    Bulk spatial join of points to the regions that contain them.
+    All pairs are found with one query against an STRtree of the points.
+    Args:
         regions (object: gpd.GeoDataFrame)
         points (object: gpd.GeoDataFrame)
 
-    Returns: 
-        num_of_stations (list): Number of points that are inside each region.
+    Returns:
+        region_idx, point_idx (np.ndarray): positional indexes of the matching pairs
+    """
+    region_idx, point_idx = points.sindex.query(regions.geometry, predicate='contains')
+    return region_idx, point_idx
+
+
+def count_points(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame) -> np.ndarray:
     """
-    num_of_stations = []
-    postal_regions = regions['geometry'].to_list()
+    Args:
+        regions (object: gpd.GeoDataFrame)
+        points (object: gpd.GeoDataFrame)
 
-    for region in postal_regions:
-        count = 0
-        polygon = shape(region)
-        for point in points['geometry'].to_list():
-            if polygon.contains(Point(point)):
-                count += 1
-        num_of_stations.append(count)
+    Returns:
+        num_of_stations (np.ndarray): Number of points that are inside each region.
+    """
+    region_idx, _ = join_points(regions, points)
+    return np.bincount(region_idx, minlength=len(regions))
 
-    print(len(num_of_stations), len(postal_regions))
-    return num_of_stations
 
+def network_diversity(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame, column: str = 'VERKKO') -> np.ndarray:
+    """
+    Normalized Shannon diversity of the network types (bus, tram, train, metro, ferry...)
+    of the stops inside each region. 0 if all stops belong to one network, 1 if all networks are equally present.
+    Args:
+        regions (object: gpd.GeoDataFrame)
+        points (object: gpd.GeoDataFrame)
+        column (str): column with the network type of a stop
 
-def get_mobility_index(num_of_stations: list, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    Returns:
+        (np.ndarray): diversity of each region
     """
-    Calculates the Mobility Index.
-    #TODO add more parameters to the index.
-    Args: 
-        num_of_stations (list)
-        gdf (object: gpd.GeoDataFrame)
+    region_idx, point_idx = join_points(regions, points)
+    codes, categories = pd.factorize(points[column].to_numpy()[point_idx])
+    n_categories = max(len(categories), 2)
+
+    counts = np.bincount(
+        region_idx * n_categories + codes,
+        minlength=len(regions) * n_categories
+    ).reshape(len(regions), n_categories)
+
+    totals = counts.sum(axis=1, keepdims=True)
+    shares = np.divide(counts, totals, out=np.zeros(counts.shape), where=totals > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropy = -np.where(shares > 0, shares * np.log(shares), 0.0).sum(axis=1)
+
+    return entropy / np.log(n_categories)
 
-    Returns: 
+
+def sample_points(regions: gpd.GeoDataFrame, spacing: float = SAMPLE_SPACING,
+                  centres: Optional[gpd.GeoSeries] = None) -> tuple:
+    """
+    Regular grid of sample points inside the regions.
+    Regions too small to contain a grid point are represented by their centre.
+    Args:
+        regions (object: gpd.GeoDataFrame): regions in a metric CRS
+        spacing (float): minimum distance between the grid points
+        centres (object: gpd.GeoSeries): centre of each region, a point on its surface if None
+
+    Returns:
+        samples (gpd.GeoSeries), region_idx (np.ndarray): sample points and the region of each point
+    """
+    minx, miny, maxx, maxy = regions.total_bounds
+    spacing = max(spacing, np.sqrt((maxx - minx) * (maxy - miny) / MAX_SAMPLES))
+    xs = np.arange(minx + spacing / 2, maxx, spacing)
+    ys = np.arange(miny + spacing / 2, maxy, spacing)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    grid = gpd.GeoSeries(gpd.points_from_xy(grid_x.ravel(), grid_y.ravel()), crs=regions.crs)
+
+    region_idx, grid_idx = grid.sindex.query(regions.geometry, predicate='contains')
+
+    uncovered = np.setdiff1d(np.arange(len(regions)), region_idx)
+    if centres is None:
+        centres = regions.geometry.representative_point()
+    representative = centres.iloc[uncovered]
+
+    samples = pd.concat([grid.iloc[grid_idx], representative], ignore_index=True)
+    return gpd.GeoSeries(samples, crs=regions.crs), np.concatenate([region_idx, uncovered])
+
+
+def nearest_stop_distances(regions: gpd.GeoDataFrame, points: gpd.GeoDataFrame,
+                           spacing: float = SAMPLE_SPACING, centres: Optional[gpd.GeoSeries] = None) -> pd.DataFrame:
+    """
+    Statistics of the distance from points inside each region to the nearest stop.
+    Args:
+        regions (object: gpd.GeoDataFrame): regions in a metric CRS
+        points (object: gpd.GeoDataFrame): stops in the same CRS
+        spacing (float): distance between the sample points
+        centres (object: gpd.GeoSeries): sample point of the regions too small for the grid
+
+    Returns:
+        (pd.DataFrame): mean, median and 90th percentile distance in meters for each region
+    """
+    samples, region_idx = sample_points(regions, spacing, centres)
+    _, distances = points.sindex.nearest(samples, return_all=False, return_distance=True)
+
+    stats = pd.DataFrame({'region': region_idx, 'distance': distances}).groupby('region')['distance']
+    result = pd.DataFrame({
+        'nearest_stop_mean': stats.mean(),
+        'nearest_stop_median': stats.median(),
+        'nearest_stop_p90': stats.quantile(0.9),
+    })
+    return result.reindex(np.arange(len(regions)))
+
+
+def robust_normalize(values: pd.Series) -> pd.Series:
+    """
+    Min-max normalization after clipping to the 5th and 95th percentiles,
+    so that a few extreme areas do not squash all the others to 0.
+    """
+    low, high = values.quantile(0.05), values.quantile(0.95)
+    if high == low:
+        return pd.Series(0.0, index=values.index)
+    return (values.clip(low, high) - low) / (high - low)
+
+
+def get_mobility_index(regions: gpd.GeoDataFrame, stations: gpd.GeoDataFrame,
+                       geometry: Optional[AreaGeometry] = None) -> pd.DataFrame:
+    """
+    Calculates the Mobility Index and its factors.
+    Node density is per square kilometre of true area, and regions too small for the sample grid
+    are sampled at their population centre.
+    Args:
         regions (object: gpd.GeoDataFrame)
+        stations (object: gpd.GeoDataFrame)
+        geometry (AreaGeometry): precomputed area and population centre of the regions by postal code,
+            derived from the polygons for regions it does not have
+
+    Returns:
+        regions (object: pd.DataFrame)
     """
-    gdf['mobility_nodes'] = num_of_stations
-    regions = gdf[['index', 'mobility_nodes', 'Surface area']]
-    regions['mobility_index'] = regions['mobility_nodes']/regions['Surface area']
-    return regions
+    regions = regions.to_crs(METRIC_CRS).reset_index(drop=True)
+    stations = stations.to_crs(METRIC_CRS).reset_index(drop=True)
+
+    population_column = [column for column in regions.columns if column.startswith('Inhabitants, total')][0]
+    population = regions[population_column].astype(float)
+
+    columns = ['area', 'population_centroid_x', 'population_centroid_y']
+    table = geometry.table[columns] if geometry is not None else pd.DataFrame(columns=columns, dtype=float)
+    table = table.reindex(regions['index']).reset_index(drop=True)
+    representative = regions.geometry.representative_point()
+    surface_km2 = table['area'].fillna(regions.area) / 1e6
+    centres = gpd.GeoSeries(gpd.points_from_xy(
+        table['population_centroid_x'].fillna(representative.x),
+        table['population_centroid_y'].fillna(representative.y),
+    ), crs=regions.crs)
+
+    result = pd.DataFrame({'index': regions['index']})
+    result['mobility_nodes'] = count_points(regions, stations)
+    result['node_density'] = result['mobility_nodes'] / surface_km2
+    result['nodes_per_inhabitant'] = (result['mobility_nodes'] / population.where(population > 0)).fillna(0.0)
+    result['network_diversity'] = network_diversity(regions, stations)
+    result = result.join(nearest_stop_distances(regions, stations, centres=centres))
+
+    factors = pd.DataFrame({
+        'node_density': robust_normalize(result['node_density']),
+        'network_diversity': result['network_diversity'],
+        'nodes_per_inhabitant': robust_normalize(result['nodes_per_inhabitant']),
+        'proximity': 1 - robust_normalize(result['nearest_stop_mean']),
+    })
+    result['mobility_index'] = sum(factors[name] * weight for name, weight in INDEX_WEIGHTS.items())
+
+    return result[[
+        'index', 'mobility_nodes', 'mobility_index',
+        'node_density', 'nodes_per_inhabitant', 'network_diversity',
+        'nearest_stop_mean', 'nearest_stop_median', 'nearest_stop_p90',
+    ]]
 
 
 def min_max_normalize(gdf: gpd.GeoDataFrame, column: str = 'mobility_index') -> gpd.GeoDataFrame:
     """
     This function normalizes the values in a given column
-    Args: 
+    Args:
         gdf (object: gpd.GeoDataFrame)
         column (str): Name of the column to normalize
 
-    Returns: 
+    Returns:
         gdf (object: gpd.GeoDataFrame)
     """
     diff = gdf[column].max() - gdf[column].min()
@@ -73,10 +240,10 @@ def min_max_normalize(gdf: gpd.GeoDataFrame, column: str = 'mobility_index') ->
 
 def main():
     """
+    Builds mobility.csv with the mobility index of every postal area.
     """
-    regions, stations = load_data()
-    num_of_stations = count_points(regions, stations)
-    regions = get_mobility_index(num_of_stations, regions)
+    regions, stations, geometry = load_data()
+    regions = get_mobility_index(regions, stations, geometry)
     regions = min_max_normalize(regions)
     print(regions.head(), regions.describe())
     regions.to_csv('website/data/mobility/mobility.csv', index=False)
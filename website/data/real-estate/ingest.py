@@ -0,0 +1,38 @@
+"""
+Appends new listing batches to real-estate.csv and updates the aggregates.
+
+Usage (from the project root):
+    python website/data/real-estate/ingest.py new_listings.csv [more.jsonl ...]
+    python website/data/real-estate/ingest.py --rebuild
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.datasets import real_estate
+
+
+def main(paths: list) -> None:
+    """
+    Ingests every batch in order and reports the resulting snapshot.
+    ---
+    Args:
+        paths (list): batch files, or ['--rebuild'] to rebuild from the full listings file
+
+    Returns: None
+    """
+    if paths == ['--rebuild']:
+        snapshot = real_estate.rebuild()
+        print(f"Rebuilt snapshot {snapshot.version} with {snapshot.rows} listings")
+        return
+
+    for path in paths:
+        before = real_estate.read_snapshot_file()
+        snapshot = real_estate.ingest(path)
+        added = snapshot.rows - (before['rows'] if before else snapshot.rows)
+        print(f"{path}: {added} new listings, snapshot {snapshot.version} has {snapshot.rows} listings")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,484 @@
+"""
+Builds all derived datasets under website/data.
+
+The data scripts are modelled as a DAG of stages with declared inputs and outputs.
+A stage is skipped when the hashes of its script, the project modules the script
+imports and its inputs match the last build,
+independent stages run in parallel in a process pool and every run writes a manifest
+with per stage hashes and timings.
+
+Usage (from the project root):
+    python website/data/tools/build.py [stage ...] [--force] [--jobs N] [--list]
+"""
+import io
+import os
+import ast
+import sys
+import glob
+import json
+import time
+import runpy
+import hashlib
+import argparse
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_PATH = 'website/data/build-manifest.json'
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def project_files(pattern: str) -> Tuple[str, ...]:
+    """
+    Files matching a recursive glob below the project root, as sorted paths relative to it.
+    """
+    paths = glob.glob(os.path.join(PROJECT_ROOT, pattern), recursive=True)
+    return tuple(sorted(os.path.relpath(path, PROJECT_ROOT) for path in paths))
+
+
+def module_files(name: str, roots: Iterable[str]) -> List[str]:
+    """
+    Source files of a dotted module and of its parent packages, from the first root that has the module.
+    """
+    parts = name.split('.')
+    for root in roots:
+        base = os.path.join(root, *parts)
+        if not os.path.isfile(f"{base}.py") and not os.path.isfile(os.path.join(base, '__init__.py')):
+            continue
+
+        files = []
+        for end in range(1, len(parts) + 1):
+            package = os.path.join(root, *parts[:end])
+            files += [path for path in (f"{package}.py", os.path.join(package, '__init__.py')) if os.path.isfile(path)]
+        return files
+    return []
+
+
+def imported_modules(script: str) -> Tuple[str, ...]:
+    """
+    Source files of the project modules a script imports, directly or through other project modules.
+    Imports inside functions count too. Modules outside the project, e.g. installed packages, are left out.
+    ---
+    Args:
+        script (str): path of the script
+
+    Returns:
+        (tuple): sorted absolute paths, without the script itself
+    """
+    script = os.path.abspath(script)
+    # The data scripts import the app as dashmap.* with website/ on the path, the tests as website.dashmap.*
+    roots = (os.path.dirname(script), os.path.join(PROJECT_ROOT, 'website'), PROJECT_ROOT)
+
+    found, queue = set(), [script]
+    while queue:
+        path = queue.pop()
+        with open(path) as file:
+            tree = ast.parse(file.read(), path)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                files = [file for alias in node.names for file in module_files(alias.name, roots)]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    # Relative imports resolve against the package of the importing module only
+                    search = (os.path.normpath(os.path.join(os.path.dirname(path), *['..'] * (node.level - 1))),)
+                else:
+                    search = roots
+                names = [node.module] if node.module else []
+                names += [f"{node.module}.{alias.name}" if node.module else alias.name for alias in node.names]
+                files = [file for name in names for file in module_files(name, search)]
+            else:
+                continue
+
+            for file in map(os.path.abspath, files):
+                if file not in found and file != script:
+                    found.add(file)
+                    queue.append(file)
+
+    return tuple(sorted(found))
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    A build step: calls `function` of `script` to turn `inputs` into `outputs`.
+    """
+    name: str
+    script: str
+    function: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+
+
+STAGES = [
+    Stage(
+        name='datum',
+        script='website/data/tools/data_cleaner.py',
+        function='main',
+        inputs=(
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shp',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shx',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.dbf',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.prj',
+            'website/data/census-csv/census_2020.csv',
+        ),
+        outputs=(
+            'website/data/datum/areas.geojson',
+            'website/data/datum/attributes.npz',
+        ),
+    ),
+    Stage(
+        name='geometry',
+        script='website/dashmap/datasets/geometry.py',
+        function='build_geometry',
+        inputs=(
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shp',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shx',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.dbf',
+            'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.prj',
+            'website/data/census-csv/census_2020.csv',
+        ),
+        outputs=('website/data/datum/geometry.npz',),
+    ),
+    Stage(
+        name='stops',
+        script='website/dashmap/datasets/stops.py',
+        function='build_stops',
+        inputs=('website/data/mobility/hsl_public_transport.csv',),
+        outputs=('website/data/mobility/stops.npz',),
+    ),
+    Stage(
+        name='mobility-index',
+        script='website/data/mobility/mobility_index.py',
+        function='main',
+        inputs=(
+            'website/data/datum/areas.geojson',
+            'website/data/datum/attributes.npz',
+            'website/data/datum/geometry.npz',
+            'website/data/mobility/stops.npz',
+        ),
+        outputs=('website/data/mobility/mobility.csv',),
+    ),
+    Stage(
+        name='air-quality',
+        script='website/data/environment/air-quality/data_cleaner.py',
+        function='cleaner',
+        inputs=('website/data/environment/air-quality/air_quality_2020.csv',),
+        outputs=('website/data/environment/air-quality/air_quality_2020_clean.csv',),
+    ),
+    Stage(
+        name='air-quality-series',
+        script='website/data/environment/air-quality/data_cleaner.py',
+        function='build_series',
+        inputs=('website/data/environment/air-quality/air_quality_2020.csv',),
+        outputs=('website/data/environment/air-quality/air_quality_series.npz',),
+    ),
+    Stage(
+        name='wind',
+        script='website/data/environment/air-temperature-wind/data_cleaner.py',
+        function='build_wind_data',
+        inputs=('website/data/environment/air-temperature-wind/raw_wind.csv',),
+        outputs=(
+            'website/data/environment/air-temperature-wind/wind_data.csv',
+            'website/data/environment/air-temperature-wind/wind_cube.npz',
+        ),
+    ),
+    Stage(
+        name='air-temperature',
+        script='website/data/environment/air-temperature-wind/data_cleaner.py',
+        function='extract_weather_data',
+        inputs=('website/data/environment/air-temperature-wind/raw_air_temp.csv',),
+        outputs=(
+            'website/data/environment/air-temperature-wind/air_temp_data.csv',
+            'website/data/environment/air-temperature-wind/air_temp_rollups.npz',
+            'website/data/environment/air-temperature-wind/air_temp_climatology.npz',
+        ),
+    ),
+    Stage(
+        name='environment-store',
+        script='website/data/environment/environment_store.py',
+        function='main',
+        inputs=(
+            'website/data/environment/air-temperature-wind/raw_wind.csv',
+            'website/data/environment/air-temperature-wind/raw_air_temp.csv',
+            'website/data/environment/air-quality/air_quality_2020.csv',
+        ),
+        outputs=('website/data/environment/environment_store.npz',),
+    ),
+    Stage(
+        name='panels',
+        script='website/data/tools/prerender.py',
+        function='main',
+        inputs=(
+            'website/data/datum/attributes.npz',
+            'website/data/datum/areas.geojson',
+            'website/data/datum/geometry.npz',
+            'website/data/real-estate/real-estate.csv',
+            'website/data/real-estate/aggregates.json',
+            'website/data/mobility/stops.npz',
+            'website/data/mobility/mobility.csv',
+            'website/data/environment/air-quality/air_quality_series.npz',
+            'website/data/environment/air-temperature-wind/wind_cube.npz',
+            'website/data/environment/air-temperature-wind/air_temp_climatology.npz',
+            'website/data/environment/environment_store.npz',
+            # The dashmap package the sections are rendered with, see code_version in bundle.py
+            *project_files('website/dashmap/**/*.py'),
+        ),
+        outputs=('website/data/panels/manifest.json',),
+    ),
+]
+
+
+def file_hash(path: str) -> str:
+    """
+    SHA-256 of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_fingerprint(stage: Stage, input_hashes: Dict[str, str]) -> str:
+    """
+    Key of a stage run: changes whenever its script, a project module the script imports,
+    its entry point or any input changes.
+    """
+    digest = hashlib.sha256()
+    digest.update(file_hash(stage.script).encode())
+    for path in imported_modules(stage.script):
+        digest.update(f"{os.path.relpath(path, PROJECT_ROOT)}:{file_hash(path)}".encode())
+    digest.update(stage.function.encode())
+    for path in sorted(input_hashes):
+        digest.update(f"{path}:{input_hashes[path]}".encode())
+    return digest.hexdigest()
+
+
+def check_acyclic(graph: Dict[str, set]) -> None:
+    """
+    Raises a ValueError naming the stages of a dependency cycle, which could never be scheduled.
+    """
+    remaining = {name: set(upstream) for name, upstream in graph.items()}
+    ready = [name for name, upstream in remaining.items() if not upstream]
+    while ready:
+        done = ready.pop()
+        del remaining[done]
+        for name, upstream in remaining.items():
+            if done in upstream:
+                upstream.discard(done)
+                if not upstream:
+                    ready.append(name)
+
+    if remaining:
+        raise ValueError(f"Stages depend on each other in a cycle: {sorted(remaining)}")
+
+
+def upstream_stages(stages: List[Stage]) -> Dict[str, set]:
+    """
+    Derives the DAG edges: a stage depends on every stage that produces one of its inputs.
+    ---
+    Args:
+        stages (list): build stages
+
+    Returns:
+        (dict): stage name -> names of the stages it depends on
+
+    Raises:
+        ValueError: if an output has two producers or the stages depend on each other in a cycle
+    """
+    producers = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(f"{output} is produced by both {producers[output]} and {stage.name}")
+            producers[output] = stage.name
+
+    graph = {
+        stage.name: {producers[path] for path in stage.inputs if path in producers} - {stage.name}
+        for stage in stages
+    }
+    check_acyclic(graph)
+    return graph
+
+
+def select_stages(stages: List[Stage], targets: Optional[Iterable[str]]) -> List[Stage]:
+    """
+    Returns the targets and everything upstream of them. All stages if no targets are given.
+    """
+    if not targets:
+        return list(stages)
+
+    by_name = {stage.name: stage for stage in stages}
+    unknown = set(targets) - set(by_name)
+    if unknown:
+        raise ValueError(f"Unknown stages: {sorted(unknown)}")
+
+    graph = upstream_stages(stages)
+    selected, queue = set(), list(targets)
+    while queue:
+        name = queue.pop()
+        if name not in selected:
+            selected.add(name)
+            queue.extend(graph[name])
+
+    return [stage for stage in stages if stage.name in selected]
+
+
+def run_stage(stage: Stage) -> Tuple[float, str]:
+    """
+    Runs one stage in a worker process.
+    ---
+    Args:
+        stage (Stage): the stage to run
+
+    Returns:
+        (tuple): wall time in seconds and the captured output of the script
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        namespace = runpy.run_path(stage.script, run_name=f"build:{stage.name}")
+        namespace[stage.function]()
+    return time.perf_counter() - start, log.getvalue()
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict:
+    if not os.path.exists(path):
+        return {'stages': {}}
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_manifest(manifest: dict, path: str = MANIFEST_PATH) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_fresh(stage: Stage, fingerprint: str, previous: Optional[dict]) -> bool:
+    """
+    A stage is fresh if it was built from the same inputs and its outputs are untouched since.
+    """
+    if not previous or previous.get('fingerprint') != fingerprint:
+        return False
+    for path in stage.outputs:
+        if not os.path.exists(path) or previous['outputs'].get(path) != file_hash(path):
+            return False
+    return True
+
+
+def build(stages: List[Stage] = STAGES, targets: Optional[Iterable[str]] = None, force: bool = False,
+          jobs: Optional[int] = None, manifest_path: str = MANIFEST_PATH) -> dict:
+    """
+    Builds the stale stages in dependency order.
+    ---
+    Args:
+        stages (list): all known build stages
+        targets (list): names of the stages to build, with their upstream stages. All if None.
+        force (bool): rebuild even if nothing changed
+        jobs (int): size of the process pool. Number of CPUs if None.
+        manifest_path (str): where the build manifest is kept
+
+    Returns:
+        manifest (dict): per stage status, hashes and timings
+    """
+    stages = select_stages(stages, targets)
+    graph = upstream_stages(stages)
+    by_name = {stage.name: stage for stage in stages}
+
+    previous = load_manifest(manifest_path)['stages']
+    manifest = {'started': datetime.now(timezone.utc).isoformat(), 'stages': dict(previous)}
+    start = time.perf_counter()
+
+    pending = [stage.name for stage in stages]
+    finished = {}
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in list(pending):
+                if any(dep in pending or dep in running.values() for dep in graph[name]):
+                    continue
+                pending.remove(name)
+                stage = by_name[name]
+
+                failed = [dep for dep in graph[name] if finished[dep] in ('failed', 'blocked')]
+                missing = [path for path in stage.inputs if not os.path.exists(path)]
+                if failed or missing:
+                    error = f"upstream failed: {failed}" if failed else f"missing inputs: {missing}"
+                    manifest['stages'][name] = {'status': 'blocked' if failed else 'failed', 'error': error}
+                    finished[name] = manifest['stages'][name]['status']
+                    continue
+
+                input_hashes = {path: file_hash(path) for path in stage.inputs}
+                fingerprint = stage_fingerprint(stage, input_hashes)
+                if not force and is_fresh(stage, fingerprint, previous.get(name)):
+                    manifest['stages'][name] = dict(previous[name], status='cached', seconds=0.0)
+                    finished[name] = 'cached'
+                    continue
+
+                manifest['stages'][name] = {'fingerprint': fingerprint, 'inputs': input_hashes}
+                running[pool.submit(run_stage, stage)] = name
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                record = manifest['stages'][name]
+                try:
+                    seconds, _ = future.result()
+                except Exception as error:
+                    record.update(status='failed', error=f"{type(error).__name__}: {error}")
+                    record.pop('fingerprint', None)
+                else:
+                    record.update(
+                        status='built',
+                        seconds=round(seconds, 3),
+                        build_seconds=round(seconds, 3),
+                        outputs={path: file_hash(path) for path in by_name[name].outputs if os.path.exists(path)},
+                        finished=datetime.now(timezone.utc).isoformat(),
+                    )
+                finished[name] = record['status']
+
+    manifest['seconds'] = round(time.perf_counter() - start, 3)
+    save_manifest(manifest, manifest_path)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Build the derived datasets of website/data.")
+    parser.add_argument('stages', nargs='*', help="stages to build, with their upstream stages")
+    parser.add_argument('--force', action='store_true', help="rebuild even if nothing changed")
+    parser.add_argument('--jobs', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--list', action='store_true', help="list the stages and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        graph = upstream_stages(STAGES)
+        for stage in STAGES:
+            print(f"{stage.name:<20} after: {', '.join(sorted(graph[stage.name])) or '-'}")
+        return 0
+
+    manifest = build(targets=args.stages, force=args.force, jobs=args.jobs)
+    selected = {stage.name for stage in select_stages(STAGES, args.stages)}
+    for name in sorted(selected):
+        record = manifest['stages'][name]
+        details = record.get('error') or f"{record.get('seconds', 0.0):.2f}s"
+        print(f"{name:<20} {record['status']:<8} {details}")
+    print(f"Total {manifest['seconds']:.2f}s")
+
+    return int(any(manifest['stages'][name]['status'] in ('failed', 'blocked') for name in selected))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
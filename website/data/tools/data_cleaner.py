@@ -1,6 +1,12 @@
+import os
+import sys
+
 import pandas as pd
 import geopandas as gpd
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.datasets.datum import save_areas, save_attributes, to_columns
 
 
 def load_shapefile(path: str) -> gpd.GeoDataFrame:
@@ -32,8 +38,8 @@ def load_paavo_dataset(path: str, encoding: str='ISO-8859-1',delimiter: str=',',
 
 def main():
     """
-    This function combines PAAVO dataset with 
-    postal areas shape file into a GeoDataFrame.
+    This function joins the PAAVO dataset to the postal areas shape file
+    and writes the geometries and the attributes as separate files.
     """
     shapefile_path = 'website/data/postal-areas-2021/PKS_postinumeroalueet_2021_shp.shx'
     geo_df = load_shapefile(shapefile_path)
@@ -41,13 +47,17 @@ def main():
     paavo_path = 'website/data/census-csv/census_2020.csv'
     census = load_paavo_dataset(paavo_path)
 
-    # Combined DataFrame
+    # Combined DataFrame, only areas with both a polygon and census data
     datum = pd.merge(geo_df, census, left_index=True, right_index=True)
-    datum.to_file("website/data/datum/datum.geojson", driver='GeoJSON')
+    datum.index.name = 'postal_code'
+
+    save_areas(datum.geometry, "website/data/datum/areas.geojson")
+    attributes = to_columns(pd.DataFrame(datum.drop(columns='geometry')))
+    save_attributes(attributes, "website/data/datum/attributes.npz")
 
-    print(datum.describe())
-    print(datum.sample(5))
+    print(attributes.describe())
+    print(attributes.sample(5))
 
 
 if __name__=='__main__':
-    main(delimiter=',')
+    main()
@@ -0,0 +1,252 @@
+"""
+Downloads the PAAVO open data by postal code area from the Statistics Finland PXWeb API.
+
+Releases and their tables are discovered from the API and fetched concurrently over a
+bounded connection pool. Responses are kept in an on-disk cache and revalidated with
+conditional requests, failed requests are retried with exponential backoff.
+
+Usage (from the project root):
+    python website/data/tools/paavo.py [release ...] [--connections N] [--output DIR]
+"""
+import os
+import sys
+import json
+import asyncio
+import hashlib
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+API_URL = 'https://pxdata.stat.fi/PXWeb/api/v1/en/Postinumeroalueittainen_avoin_tieto'
+CACHE_DIR = 'website/data/.cache/paavo'
+OUTPUT_DIR = 'website/data/census-csv/paavo'
+
+# Statuses worth retrying, everything else is final
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """
+    Raised when a request still fails after all retries.
+    """
+
+
+class ResponseCache:
+    """
+    Response bodies on disk with the validators (ETag, Last-Modified) they were served with.
+    """
+    def __init__(self, directory: str = CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(method: str, url: str, body: Optional[bytes] = None) -> str:
+        digest = hashlib.sha256(f"{method} {url}\n".encode())
+        digest.update(body or b'')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        meta_path = os.path.join(self.directory, f"{key}.json")
+        body_path = os.path.join(self.directory, f"{key}.body")
+        if not os.path.exists(meta_path) or not os.path.exists(body_path):
+            return None
+        with open(meta_path) as file:
+            meta = json.load(file)
+        with open(body_path, 'rb') as file:
+            return meta, file.read()
+
+    def put(self, key: str, meta: dict, body: bytes) -> None:
+        # The body is written first, the metadata file marks the entry as complete
+        for suffix, content in [('body', body), ('json', json.dumps(meta).encode())]:
+            path = os.path.join(self.directory, f"{key}.{suffix}")
+            with open(f"{path}.tmp", 'wb') as file:
+                file.write(content)
+            os.replace(f"{path}.tmp", path)
+
+
+class PaavoFetcher:
+    """
+    Asynchronous PXWeb client, used as an async context manager.
+    """
+    def __init__(self, api_url: str = API_URL, cache_dir: str = CACHE_DIR, connections: int = 4,
+                 retries: int = 5, backoff: float = 1.0, timeout: float = 60.0):
+        """
+        Args:
+            api_url (str): PXWeb database of the PAAVO releases
+            cache_dir (str): directory of the response cache
+            connections (int): maximum number of simultaneous connections
+            retries (int): attempts after the first failed one
+            backoff (float): delay before the first retry in seconds, doubled on every retry
+            timeout (float): total timeout of one attempt in seconds
+        """
+        self.api_url = api_url.rstrip('/')
+        self.cache = ResponseCache(cache_dir)
+        self.connections = connections
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session = None
+        self.stats = {'requests': 0, 'not_modified': 0, 'retries': 0}
+
+    async def __aenter__(self) -> 'PaavoFetcher':
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.connections),
+            timeout=self.timeout,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+
+    async def request(self, method: str, url: str, payload: Optional[dict] = None) -> bytes:
+        """
+        Sends a request through the cache. A cached response is revalidated with
+        If-None-Match / If-Modified-Since and reused when the server answers 304.
+        ---
+        Args:
+            method (str): HTTP method
+            url (str): absolute URL
+            payload (dict): JSON body of the request
+
+        Returns:
+            (bytes): response body
+        """
+        body = json.dumps(payload, sort_keys=True).encode() if payload is not None else None
+        key = self.cache.key(method, url, body)
+        cached = self.cache.get(key)
+
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        if cached:
+            meta, _ = cached
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        for attempt in range(self.retries + 1):
+            delay = self.backoff * 2 ** attempt
+            try:
+                self.stats['requests'] += 1
+                async with self.session.request(method, url, data=body, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        self.stats['not_modified'] += 1
+                        return cached[1]
+
+                    if response.status not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        content = await response.read()
+                        self.cache.put(key, {
+                            'url': url,
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified'),
+                        }, content)
+                        return content
+
+                    error = f"HTTP {response.status}"
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = max(delay, float(retry_after))
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+                error = f"{type(exception).__name__}: {exception}"
+
+            if attempt < self.retries:
+                self.stats['retries'] += 1
+                await asyncio.sleep(delay)
+
+        raise FetchError(f"{method} {url} failed after {self.retries + 1} attempts ({error})")
+
+    async def get_json(self, path: str = '') -> object:
+        return json.loads(await self.request('GET', f"{self.api_url}/{path}".rstrip('/')))
+
+    async def releases(self) -> List[str]:
+        """
+        Ids of the yearly PAAVO releases.
+        """
+        return [level['id'] for level in await self.get_json() if level['type'] == 'l']
+
+    async def tables(self, release: str) -> List[str]:
+        """
+        Ids of the tables (.px files) of a release.
+        """
+        return [table['id'] for table in await self.get_json(release) if table['type'] == 't']
+
+    async def table_csv(self, release: str, table: str) -> bytes:
+        """
+        Every value of every variable of a table, as CSV.
+        ---
+        Args:
+            release (str): release id, e.g. '2022'
+            table (str): table id, e.g. 'paavo_pxt_12f7.px'
+
+        Returns:
+            (bytes): CSV response of the PXWeb query
+        """
+        metadata = await self.get_json(f"{release}/{table}")
+        query = {
+            'query': [
+                {'code': variable['code'], 'selection': {'filter': 'all', 'values': ['*']}}
+                for variable in metadata['variables']
+            ],
+            'response': {'format': 'csv'},
+        }
+        return await self.request('POST', f"{self.api_url}/{release}/{table}", query)
+
+    async def fetch_all(self, releases: Optional[List[str]] = None,
+                        output_dir: str = OUTPUT_DIR) -> Dict[Tuple[str, str], str]:
+        """
+        Downloads all tables of the given releases concurrently.
+        ---
+        Args:
+            releases (list): release ids. All releases if None.
+            output_dir (str): tables are written to <output_dir>/<release>/<table>.csv
+
+        Returns:
+            (dict): (release, table) -> path of the written CSV
+        """
+        releases = releases or await self.releases()
+        tables = await asyncio.gather(*(self.tables(release) for release in releases))
+        jobs = [(release, table) for release, ids in zip(releases, tables) for table in ids]
+
+        async def fetch(release: str, table: str) -> str:
+            content = await self.table_csv(release, table)
+            path = os.path.join(output_dir, release, f"{os.path.splitext(table)[0]}.csv")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.tmp", 'wb') as file:
+                file.write(content)
+            os.replace(f"{path}.tmp", path)
+            return path
+
+        paths = await asyncio.gather(*(fetch(release, table) for release, table in jobs))
+        return dict(zip(jobs, paths))
+
+
+async def fetch_paavo(releases: Optional[List[str]] = None, output_dir: str = OUTPUT_DIR, **options) -> dict:
+    """
+    Downloads the PAAVO tables. Keyword options are passed to PaavoFetcher.
+    """
+    async with PaavoFetcher(**options) as fetcher:
+        paths = await fetcher.fetch_all(releases, output_dir)
+    print(f"{len(paths)} tables, {fetcher.stats['requests']} requests, "
+          f"{fetcher.stats['not_modified']} not modified, {fetcher.stats['retries']} retries")
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Download the PAAVO tables of Statistics Finland.")
+    parser.add_argument('releases', nargs='*', help="release years to download, all if omitted")
+    parser.add_argument('--connections', type=int, default=4, help="maximum simultaneous connections")
+    parser.add_argument('--output', default=OUTPUT_DIR, help="output directory")
+    args = parser.parse_args(argv)
+
+    asyncio.run(fetch_paavo(args.releases, args.output, connections=args.connections))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
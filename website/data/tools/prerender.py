@@ -0,0 +1,33 @@
+"""
+Prerenders the sections of every postal area into the panel bundle served by the app.
+
+Usage (from the project root):
+    python website/data/tools/prerender.py [--jobs N]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.callbacks.util.bundle import BUNDLE_DIR, build_bundle
+
+
+def main(jobs: int = None, directory: str = BUNDLE_DIR) -> None:
+    """
+    Renders all areas in a process pool and replaces the bundle.
+    """
+    start = time.perf_counter()
+    manifest = build_bundle(directory, jobs=jobs)
+    sizes = manifest['areas'].values()
+    print(f"Prerendered {len(manifest['sections'])} sections of {len(sizes)} areas "
+          f"({sum(sizes) / 1e6:.1f} MB) as version {manifest['version']} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes, the number of CPUs by default")
+    parser.add_argument('--out', default=BUNDLE_DIR, help="bundle directory")
+    args = parser.parse_args()
+    main(args.jobs, args.out)
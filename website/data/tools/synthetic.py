@@ -0,0 +1,427 @@
+"""
+Generates synthetic datasets at a multiple of the size of the real ones, for load and scaling tests.
+
+The postal areas are a Voronoi tessellation of the real region, with seeds placed where people
+live, and every synthetic area takes its attributes from the real area its seed falls in.
+Listings, stops and the environment series are resampled from the real data with jitter.
+Everything is written with the writers of the app, in the layout of website/data under a root
+directory, so loaders, callbacks and map builders run unchanged with that directory as working
+directory and the project on the python path:
+
+    cd /tmp/dashmap-synthetic/x100 && PYTHONPATH=/path/to/dashmap.io python -c \
+        "from website.dashmap.snapshot import load_snapshot; print(load_snapshot().versions)"
+
+Usage (from the project root):
+    python website/data/tools/synthetic.py 10 100 1000 [--out DIR] [--seed N]
+"""
+import os
+import sys
+import time
+import runpy
+import argparse
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import shapely
+import geopandas as gpd
+from pyproj import Transformer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from dashmap.datasets import real_estate
+from dashmap.datasets.datum import (
+    AREAS_PATH, ATTRIBUTES_PATH, load_area_geometries, load_attributes, save_areas, save_attributes
+)
+from dashmap.datasets.geometry import GEOMETRY_PATH, METRIC_CRS, SNAP_DISTANCE, AreaGeometry, geometry_arrays
+from dashmap.datasets.stops import STOPS_PATH, load_stops, save_stops, to_wgs84
+from dashmap.datasets.wind import CUBE_PATH, WindCube
+from dashmap.datasets.air_quality import SERIES_PATH, AirQualitySeries
+from dashmap.datasets.air_temperature import CLIMATOLOGY_PATH, Climatology
+from dashmap.datasets.environment import STORE_PATH, EnvironmentStore, store_arrays
+
+MOBILITY_SCRIPT = 'website/data/mobility/mobility_index.py'
+WEATHER_SCRIPT = 'website/data/environment/air-temperature-wind/data_cleaner.py'
+MOBILITY_PATH = 'website/data/mobility/mobility.csv'
+
+DEFAULT_OUT = os.path.join(tempfile.gettempdir(), 'dashmap-synthetic')
+
+# Share of the area seeds placed by population, the rest by surface area
+POPULATION_SHARE = 0.5
+
+# Standard deviation of the offset of a synthetic stop from the real stop it copies
+STOP_JITTER = 150  # meters
+
+# Relative noise of the listing prices and the air quality measurements
+PRICE_NOISE = 0.05
+SERIES_NOISE = 0.1
+
+# Day to day correlation of the daily mean temperature anomalies
+ANOMALY_CORRELATION = 0.8
+
+# Days of each month in a leap year, the day of year axis of the climatology
+MONTH_DAYS = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+def scaled(count: int, scale: float) -> int:
+    """
+    Size of a synthetic dataset, at least one.
+    """
+    return max(1, int(round(count * scale)))
+
+
+def sample_within(geometries: np.ndarray, rng: np.random.Generator) -> tuple:
+    """
+    Uniform random point inside each polygon, by rejection from its bounding box.
+    ---
+    Args:
+        geometries (np.ndarray): polygons, repeated for several points in the same polygon
+        rng (np.random.Generator): random numbers
+
+    Returns:
+        x, y (np.ndarray): one point per polygon
+    """
+    bounds = shapely.bounds(geometries)
+    x, y = np.empty(len(geometries)), np.empty(len(geometries))
+    pending = np.arange(len(geometries))
+    while len(pending):
+        min_x, min_y, max_x, max_y = bounds[pending].T
+        x[pending] = rng.uniform(min_x, max_x)
+        y[pending] = rng.uniform(min_y, max_y)
+        pending = pending[~shapely.contains_xy(geometries[pending], x[pending], y[pending])]
+    return x, y
+
+
+def tessellate(region, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Voronoi cells of the seeds clipped to the region, so that the cells cover it without overlaps.
+    ---
+    Args:
+        region (shapely.Geometry): polygon to cover
+        x, y (np.ndarray): seeds inside the region
+
+    Returns:
+        (np.ndarray): cell of each seed, in the order of the seeds
+    """
+    seeds = shapely.points(x, y)
+    cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(seeds), extend_to=region))
+
+    # GEOS does not keep the order of the seeds, match every seed to the cell it lies in
+    seed_idx, cell_idx = shapely.STRtree(cells).query(seeds, predicate='within')
+    if len(np.unique(seed_idx)) != len(seeds):
+        raise ValueError("Every seed must lie inside exactly one Voronoi cell")
+    order = np.empty(len(seeds), dtype=np.int64)
+    order[seed_idx] = cell_idx
+    cells = cells[order]
+
+    shapely.prepare(region)
+    outside = ~shapely.contains(region, cells)
+    cells[outside] = shapely.intersection(cells[outside], region)
+    return cells
+
+
+def generate_areas(scale: float, rng: np.random.Generator) -> tuple:
+    """
+    Synthetic postal areas tessellating the region of the real ones.
+    Seeds are spread by the population and surface area of the real areas, so that areas are small
+    where people live, and each synthetic area copies the attributes of the real area of its seed.
+    ---
+    Args:
+        scale (float): number of areas relative to the real data
+        rng (np.random.Generator): random numbers
+
+    Returns:
+        geometries (gpd.GeoSeries): polygons in EPSG:3067 indexed by postal code
+        attributes (pd.DataFrame): attributes in the schema of the real table
+        donor_codes (np.ndarray): real postal code each area was copied from
+        population_x, population_y (np.ndarray): seed of each area
+    """
+    template = load_attributes()
+    real = load_area_geometries().to_crs(METRIC_CRS).reindex(template.index)
+    real_geometries = real.geometry.to_numpy()
+
+    # The real polygons leave small gaps between each other, close them before the union
+    region = shapely.buffer(shapely.union_all(shapely.buffer(real_geometries, SNAP_DISTANCE)), -SNAP_DISTANCE)
+
+    population_column = [column for column in template.columns if column.startswith('Inhabitants, total')][0]
+    population = pd.to_numeric(template[population_column], errors='coerce').fillna(0).to_numpy()
+    surface = shapely.area(real_geometries)
+    weights = POPULATION_SHARE * population / population.sum() + (1 - POPULATION_SHARE) * surface / surface.sum()
+
+    n_areas = scaled(len(template), scale)
+    donors = rng.choice(len(template), size=n_areas, p=weights / weights.sum())
+    x, y = sample_within(real_geometries[donors], rng)
+
+    # Postal codes follow the real code of the donor, so that codes of nearby areas are close
+    order = np.lexsort((x, donors))
+    donors, x, y = donors[order], x[order], y[order]
+    width = max(5, len(str(n_areas - 1)))
+    postal_codes = pd.Index([str(i).zfill(width) for i in range(n_areas)], name='postal_code')
+
+    cells = tessellate(region, x, y)
+
+    # Densify the straight Voronoi edges to the vertex count of the real polygons
+    real_vertices = shapely.get_num_coordinates(real_geometries).mean()
+    segment = np.median(shapely.length(cells)) / real_vertices
+    cells = shapely.segmentize(cells, segment)
+
+    attributes = template.iloc[donors].copy()
+    attributes.index = postal_codes
+    if 'Surface area' in attributes.columns:
+        attributes['Surface area'] = np.round(shapely.area(cells)).astype(attributes['Surface area'].dtype)
+    if 'neighborhood' in attributes.columns:
+        number = attributes.groupby(donors).cumcount().to_numpy() + 1
+        attributes['neighborhood'] = attributes['neighborhood'].astype(str) + ' ' + number.astype(str)
+
+    geometries = gpd.GeoSeries(cells, index=postal_codes, crs=METRIC_CRS)
+    return geometries, attributes, template.index.to_numpy(dtype=str)[donors], x, y
+
+
+def generate_listings(postal_codes: pd.Index, donor_codes: np.ndarray, scale: float,
+                      rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Listings resampled from real-estate.csv and moved to the synthetic areas.
+    A listing goes to a random synthetic area of its real postcode, or to any area if its
+    postcode has none, and its price gets a small relative noise.
+    ---
+    Args:
+        postal_codes (pd.Index): synthetic postal codes
+        donor_codes (np.ndarray): real postal code each synthetic area was copied from, contiguous per code
+        scale (float): number of listings relative to the real data
+        rng (np.random.Generator): random numbers
+
+    Returns:
+        (pd.DataFrame): listings with the columns of real-estate.csv
+    """
+    template = pd.read_csv(os.path.join(real_estate.DATA_DIR, real_estate.LISTINGS_FILE), dtype={'postcode': str})
+    listings = template.iloc[rng.integers(len(template), size=scaled(len(template), scale))].reset_index(drop=True)
+
+    groups = pd.Series(np.arange(len(postal_codes))).groupby(donor_codes)
+    starts, counts = groups.min(), groups.size()
+    donor = starts.index.get_indexer(listings['postcode'])
+    starts, counts = starts.to_numpy(), counts.to_numpy()
+
+    known = donor >= 0
+    position = rng.integers(len(postal_codes), size=len(listings))
+    position[known] = starts[donor[known]] + (rng.random(known.sum()) * counts[donor[known]]).astype(np.int64)
+
+    listings['postcode'] = postal_codes[position]
+    listings['price'] = np.round(listings['price'] * rng.lognormal(0, PRICE_NOISE, len(listings)))
+    return listings[real_estate.LISTING_COLUMNS]
+
+
+def generate_stops(scale: float, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Stops resampled from the real stop table, each moved by a random offset.
+    ---
+    Args:
+        scale (float): number of stops relative to the real data
+        rng (np.random.Generator): random numbers
+
+    Returns:
+        (pd.DataFrame): stop table in the schema written by build_stops
+    """
+    template = pd.DataFrame(load_stops().drop(columns='geometry'))
+    stops = template.iloc[rng.integers(len(template), size=scaled(len(template), scale))].reset_index(drop=True)
+
+    transformer = Transformer.from_crs('EPSG:4326', METRIC_CRS, always_xy=True)
+    x, y = transformer.transform(stops['lon'].to_numpy(dtype=float), stops['lat'].to_numpy(dtype=float))
+    stops['lon'], stops['lat'] = to_wgs84(
+        x + rng.normal(0, STOP_JITTER, len(stops)),
+        y + rng.normal(0, STOP_JITTER, len(stops)),
+        crs=METRIC_CRS,
+    )
+
+    stops['SOLMUTUNNU'] = 1_000_000 + np.arange(len(stops))
+    return stops.astype({column: template[column].dtype for column in template.columns})
+
+
+def generate_mobility(geometries: gpd.GeoSeries, attributes: pd.DataFrame, stops: pd.DataFrame,
+                      geometry: AreaGeometry) -> pd.DataFrame:
+    """
+    Mobility index of the synthetic areas, computed with the build script of mobility.csv.
+    """
+    mobility_index = runpy.run_path(MOBILITY_SCRIPT, run_name='synthetic')
+
+    population_column = [column for column in attributes.columns if column.startswith('Inhabitants, total')][0]
+    regions = gpd.GeoDataFrame(
+        attributes[[population_column]],
+        geometry=geometries.to_crs('EPSG:4326'),
+    ).rename_axis('index').reset_index()
+    stations = gpd.GeoDataFrame(stops, geometry=gpd.points_from_xy(stops['lon'], stops['lat']), crs='EPSG:4326')
+
+    return mobility_index['min_max_normalize'](mobility_index['get_mobility_index'](regions, stations, geometry))
+
+
+def generate_wind(scale: float, rng: np.random.Generator) -> dict:
+    """
+    Wind cube over more years, each year drawn from the mean counts of the real years.
+    """
+    cube = WindCube.load()
+    n_years = scaled(len(cube.years), scale)
+    mean = cube.counts.mean(axis=0)
+
+    with np.load(CUBE_PATH) as archive:
+        speed_edges = archive['speed_edges']
+    return {
+        'counts': rng.poisson(mean, size=(n_years,) + mean.shape).astype(np.uint32),
+        'years': np.arange(cube.years[-1] - n_years + 1, cube.years[-1] + 1),
+        'speed_edges': speed_edges,
+    }
+
+
+def generate_climatology(scale: float, rng: np.random.Generator) -> dict:
+    """
+    Climatology of daily mean temperatures over more years. Each day is the real mean of its
+    day of year plus an autocorrelated anomaly with the spread of the real percentile band.
+    """
+    climatology = Climatology.load()
+    n_years = scaled(len(climatology.years), scale)
+    years = np.arange(climatology.current_year - n_years + 1, climatology.current_year + 1)
+
+    months = np.repeat(np.arange(1, 13), MONTH_DAYS)
+    days = np.concatenate([np.arange(1, count + 1) for count in MONTH_DAYS])
+    mean = np.nan_to_num(climatology.doy['mean'].astype(float))
+    spread = np.nan_to_num((climatology.doy['p90'] - climatology.doy['p10']).astype(float)) / 2.563
+
+    innovations = rng.normal(size=(n_years, 366)) * np.sqrt(1 - ANOMALY_CORRELATION ** 2)
+    anomalies = np.empty_like(innovations)
+    anomalies[:, 0] = rng.normal(size=n_years)
+    for day in range(1, 366):
+        anomalies[:, day] = ANOMALY_CORRELATION * anomalies[:, day - 1] + innovations[:, day]
+
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    present = ~((months == 2) & (days == 29))[None, :] | leap[:, None]
+    rows, doy = np.nonzero(present)
+
+    build_climatology = runpy.run_path(WEATHER_SCRIPT, run_name='synthetic')['build_climatology']
+    return build_climatology(
+        years[rows], months[doy], days[doy], mean[doy] + spread[doy] * anomalies[rows, doy]
+    )
+
+
+def extend_series(time: np.ndarray, values: np.ndarray, n_points: int, noisy: np.ndarray,
+                  rng: np.random.Generator) -> tuple:
+    """
+    Repeats a series back in time at its median time step, so that it has n_points and ends where it ends.
+    ---
+    Args:
+        time (np.ndarray): epoch seconds
+        values (np.ndarray): float32 values of shape (series, len(time)) with NaN gaps
+        n_points (int): length of the result
+        noisy (np.ndarray): boolean mask of the series that get a weekly multiplicative noise
+        rng (np.random.Generator): random numbers
+
+    Returns:
+        time, values (np.ndarray): extended series
+    """
+    step = int(np.median(np.diff(time))) if len(time) > 1 else 3600
+    timestamps = time[-1] - step * np.arange(n_points - 1, -1, -1, dtype=np.int64)
+
+    source = (np.arange(n_points) - n_points) % len(time)
+    weeks = (timestamps - timestamps[0]) // (7 * 24 * 3600)
+    noise = rng.lognormal(0, SERIES_NOISE, size=(len(values), weeks[-1] + 1)).astype(np.float32)
+    noise[~noisy] = 1
+    return timestamps, values[:, source] * noise[:, weeks]
+
+
+def generate_air_quality(scale: float, rng: np.random.Generator) -> dict:
+    """
+    Hourly air quality series over a longer history, ending where the real one ends.
+    The real series is repeated back in time with a weekly multiplicative noise and keeps its gaps.
+    """
+    series = AirQualitySeries.load()
+    time, values = extend_series(
+        series.time, series.values, scaled(len(series.time), scale), np.ones(len(series.names), dtype=bool), rng
+    )
+    return {'time': time, 'names': np.array(series.names), 'values': values}
+
+
+def generate_environment_store(scale: float, rng: np.random.Generator) -> dict:
+    """
+    Environment store over a longer history, with the real hours repeated back in time.
+    The pollutants get the noise of the air quality series, the weather columns are copied.
+    """
+    store = EnvironmentStore.load()
+    noisy = np.isin(store.names, store.pollutants)
+    time, values = extend_series(store.time, store.values, scaled(len(store.time), scale), noisy, rng)
+
+    aligned = pd.DataFrame(
+        values.T,
+        index=pd.DatetimeIndex(time.astype('datetime64[s]'), name='time'),
+        columns=store.names,
+    )
+    return store_arrays(aligned, store.pollutants)
+
+
+def generate(scale: float, root: str, seed: int = 0) -> dict:
+    """
+    Writes a complete synthetic data tree.
+    ---
+    Args:
+        scale (float): size relative to the real data, e.g. 10 for ten times as many areas,
+            listings, stops and years of environment data
+        root (str): directory that gets the website/data layout of the real data
+        seed (int): seed of the random numbers
+
+    Returns:
+        (dict): number of rows of each dataset
+    """
+    rng = np.random.default_rng(seed)
+
+    def target(path: str) -> str:
+        path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    geometries, attributes, donor_codes, population_x, population_y = generate_areas(scale, rng)
+    save_areas(geometries.to_crs('EPSG:4326'), target(AREAS_PATH))
+    save_attributes(attributes, target(ATTRIBUTES_PATH))
+    geometry = geometry_arrays(attributes.index.to_numpy(), geometries.to_numpy(), population_x, population_y)
+    np.savez_compressed(target(GEOMETRY_PATH), **geometry)
+
+    listings = generate_listings(attributes.index, donor_codes, scale, rng)
+    listings_path = target(os.path.join(real_estate.DATA_DIR, real_estate.LISTINGS_FILE))
+    listings.to_csv(listings_path, index=False)
+    real_estate.rebuild(os.path.dirname(listings_path))
+
+    stops = generate_stops(scale, rng)
+    save_stops(stops, target(STOPS_PATH))
+    generate_mobility(geometries, attributes, stops, AreaGeometry(geometry)).to_csv(target(MOBILITY_PATH), index=False)
+
+    np.savez_compressed(target(CUBE_PATH), **generate_wind(scale, rng))
+    np.savez_compressed(target(CLIMATOLOGY_PATH), **generate_climatology(scale, rng))
+    air_quality = generate_air_quality(scale, rng)
+    np.savez_compressed(target(SERIES_PATH), **air_quality)
+    np.savez_compressed(target(STORE_PATH), **generate_environment_store(scale, rng))
+
+    return {
+        'areas': len(attributes),
+        'listings': len(listings),
+        'stops': len(stops),
+        'air_quality_points': len(air_quality['time']),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic datasets for load and scaling tests.")
+    parser.add_argument('scales', nargs='+', type=float, help="sizes relative to the real data, e.g. 10 100 1000")
+    parser.add_argument('--out', default=DEFAULT_OUT, help="directory of the data trees, one x<scale> directory per scale")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the random numbers")
+    args = parser.parse_args(argv)
+
+    for scale in args.scales:
+        root = os.path.join(args.out, f"x{scale:g}")
+        start = time.perf_counter()
+        counts = generate(scale, root, args.seed)
+        summary = ', '.join(f"{count} {name}" for name, count in counts.items())
+        print(f"{root}: {summary} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmarks of the area sections on the current datasets. They time the app but are not part of it,
+the figures are the fixtures of test_figures.py.
+
+Usage (from the project root):
+    python -m website.tests.benchmark [click] [figures]
+"""
+import sys
+import json
+import time
+
+from plotly.utils import PlotlyJSONEncoder
+
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.cache import to_plain
+from website.dashmap.snapshot import load_snapshot
+from website.tests.test_figures import FIGURES
+
+
+def timed(function, repeat: int = 1) -> float:
+    """
+    Mean wall time of a call in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def benchmark_click(postal_code: str = '00100', repeat: int = 5) -> None:
+    """
+    Compares rendering every section of a click from one area and in one response against one request
+    per section, each resolving the area again and serializing its own response, as the map did before
+    the sections shared the area.
+    """
+    snapshot = load_snapshot()
+
+    def separate():
+        for render in AREA_SECTIONS.values():
+            json.dumps(render(build_area(snapshot, postal_code)), cls=PlotlyJSONEncoder)
+
+    def batched():
+        area = build_area(snapshot, postal_code)
+        json.dumps([render(area) for render in AREA_SECTIONS.values()], cls=PlotlyJSONEncoder)
+
+    print(f"per click: {len(AREA_SECTIONS)} requests {timed(separate, repeat):.3f}s, "
+          f"1 request {timed(batched, repeat):.3f}s")
+
+
+def benchmark_figures(repeat: int = 50) -> None:
+    """
+    Compares the build time of every figure template with the go.Figure it replaces, alone and with
+    the JSON encoding of the response. The figures are those of test_figures.py.
+    """
+    def encoded(build):
+        return lambda: to_plain(build())
+
+    for name, (build_go, build_dict) in FIGURES.items():
+        validated, fast = timed(build_go, repeat) * 1000, timed(build_dict, repeat) * 1000
+        validated_json, fast_json = timed(encoded(build_go), repeat) * 1000, timed(encoded(build_dict), repeat) * 1000
+        print(f"{name}: go.Figure {validated:.2f} ms ({validated_json:.2f} ms with JSON), "
+              f"dict {fast:.3f} ms ({fast_json:.2f} ms with JSON)")
+
+
+BENCHMARKS = {
+    'click': benchmark_click,
+    'figures': benchmark_figures,
+}
+
+
+def main(argv: list = None) -> None:
+    """
+    Runs the named benchmarks, all of them if none are named.
+    """
+    for name in (argv or list(BENCHMARKS)):
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
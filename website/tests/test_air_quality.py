@@ -0,0 +1,66 @@
+"""
+Air quality series tests.
+"""
+import unittest
+
+import numpy as np
+
+from website.dashmap.datasets.air_quality import DEFAULT_POINTS, MAX_POINTS, MIN_POINTS, AirQualitySeries, chart_points, lttb
+
+
+class AirQualitySeriesTests(unittest.TestCase):
+    """
+    Downsampled air quality series test case class.
+    """
+    def setUp(self):
+        self.series = AirQualitySeries.load()
+
+    def test_lttb_keeps_ends_and_peaks(self):
+        """
+        Check that downsampling keeps the end points and a single spike.
+        """
+        x = np.arange(10_000)
+        y = np.zeros(10_000)
+        y[4321] = 100.0
+
+        kept = lttb(x, y, 100)
+
+        self.assertEqual(len(kept), 100)
+        self.assertEqual(kept[0], 0)
+        self.assertEqual(kept[-1], 9_999)
+        self.assertIn(4321, kept)
+        self.assertTrue(np.all(np.diff(kept) > 0))
+
+    def test_query_is_bounded_by_points(self):
+        """
+        Check that the full history is reduced to the chart width and zooming returns finer data.
+        """
+        full = self.series.query(points=300)
+        start = np.datetime64('2021-03-01T00:00:00')
+        end = np.datetime64('2021-03-03T00:00:00')
+        zoomed = self.series.query(start, end, points=300)
+
+        for name, (time, values) in full.items():
+            self.assertLessEqual(len(time), 300)
+            self.assertFalse(np.isnan(values).any())
+
+        time, _ = zoomed['Nitrogen dioxide (ug/m3)']
+        self.assertLessEqual(time[1], start)
+        self.assertGreaterEqual(time[-2], end - np.timedelta64(1, 'h'))
+        self.assertEqual(np.diff(time[1:-1]).max(), np.timedelta64(1, 'h'))
+
+    def test_points_follow_chart_width(self):
+        """
+        Check that a query keeps one point per plotted pixel, within bounds, and a default before the chart is drawn.
+        """
+        self.assertEqual(chart_points(None), DEFAULT_POINTS)
+        self.assertEqual(chart_points(845.5), 845)
+        self.assertEqual(chart_points(20), MIN_POINTS)
+        self.assertEqual(chart_points(10_000), MAX_POINTS)
+
+        for name, (time, _) in self.series.query(points=chart_points(845)).items():
+            self.assertLessEqual(len(time), 845)
+
+
+if __name__ == "__main__":
+    unittest.main()
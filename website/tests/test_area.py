@@ -0,0 +1,172 @@
+"""
+Map click handler tests.
+"""
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from website import create_app
+from website.dashmap.callbacks import area_callbacks
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS, SECTION_CACHE, SECTION_COLLAPSES, SECTION_TABS
+from website.dashmap.callbacks.tab_census.census_callbacks import CENSUS_SECTIONS
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.bundle import PanelBundle
+from website.dashmap.layouts.templates.templates import area_section_id, collapse_id
+from website.dashmap.map_layout import TAB_CONTENTS
+from website.dashmap.snapshot import current_snapshot
+
+
+def click(location: str) -> dict:
+    return {'points': [{'location': location}]}
+
+
+class AreaCallbackTests(unittest.TestCase):
+    """
+    Map click test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        dependencies = self.client.get('/helsinki/_dash-dependencies').get_json()
+        self.click_callbacks = [
+            dependency for dependency in dependencies
+            if {'id': 'choropleth-map', 'property': 'clickData'} in dependency['inputs']
+        ]
+        SECTION_CACHE.clear()
+
+        # Without prerendered sections
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        bundle = mock.patch.object(area_callbacks, 'PANEL_BUNDLE', PanelBundle(directory.name))
+        bundle.start()
+        self.addCleanup(bundle.stop)
+
+    def post_click(self, location: str, tab: str = 'census', opened: tuple = (), rendered: dict = None,
+                   changed: str = 'choropleth-map.clickData', loaded: tuple = tuple(TAB_CONTENTS)) -> dict:
+        """
+        Sends the request of a map click, as the browser does, and returns the response by output id.
+        Sections are matched with ALL, the request holds the sections and collapses of the loaded tabs.
+        ---
+        Args:
+            location (str): clicked postal code
+            tab (str): active tab
+            opened (tuple): ids of the open accordion collapses
+            rendered (dict): state of the area-sections store
+            changed (str): property that triggered the request
+            loaded (tuple): tabs whose content is in the page
+        """
+        sections = [section_id for section_id in AREA_SECTIONS if SECTION_TABS[section_id] in loaded]
+        responses = {}
+        for dependency in self.click_callbacks:
+            response = self.client.post('/helsinki/_dash-update-component', json={
+                'output': dependency['output'],
+                'outputs': [
+                    {'id': 'area-snapshot', 'property': 'data'},
+                    {'id': 'area-sections', 'property': 'data'},
+                    [{'id': area_section_id(section_id), 'property': 'children'} for section_id in sections],
+                ],
+                'inputs': [
+                    {'id': 'choropleth-map', 'property': 'clickData', 'value': click(location)},
+                    {'id': 'tabs', 'property': 'active_tab', 'value': tab},
+                    [
+                        {
+                            'id': collapse_id(SECTION_COLLAPSES[section_id]), 'property': 'is_open',
+                            'value': SECTION_COLLAPSES[section_id] in opened,
+                        }
+                        for section_id in sections
+                    ],
+                ],
+                'changedPropIds': [changed],
+                'state': [{'id': 'area-sections', 'property': 'data', 'value': rendered or {}}],
+            })
+            self.assertEqual(response.status_code, 200)
+            for output, value in response.get_json()['response'].items():
+                responses[json.loads(output)['index'] if output.startswith('{') else output] = value
+        return responses
+
+    def test_one_request_per_click(self):
+        """
+        Check that a click is a single request which resolves the area once and returns the open sections.
+        """
+        self.assertEqual(len(self.click_callbacks), 1)
+
+        census = [SECTION_COLLAPSES[section_id] for section_id in CENSUS_SECTIONS]
+        with mock.patch.object(area_callbacks, 'build_area', wraps=build_area) as build:
+            responses = self.post_click('00530', opened=census)
+
+        build.assert_called_once()
+        self.assertEqual(set(responses), {'area-snapshot', 'area-sections', *CENSUS_SECTIONS})
+        self.assertEqual(responses['area-snapshot']['data']['postal_code'], '00530')
+        self.assertEqual(responses['area-snapshot']['data']['neighborhood'], 'Kallio')
+        self.assertTrue(responses['area-snapshot']['data']['version'].startswith(current_snapshot().versions.combined))
+
+    def test_private_area(self):
+        """
+        Check that the sections of a private postal area only show the privacy notice.
+        """
+        responses = self.post_click('00230', opened=['tab-1-collapse-1'])
+
+        self.assertTrue(responses['area-snapshot']['data']['private'])
+        notice = responses['id_age_dist_hist']['children'][1]['props']['children']
+        self.assertIn('private', notice)
+
+    def test_hidden_sections_are_rendered_when_opened(self):
+        """
+        Check that closed sections and sections of other tabs are only rendered once they are shown,
+        and that a section already showing the area is not rendered again.
+        """
+        responses = self.post_click('00100', opened=['tab-2-collapse-1'])
+        self.assertEqual(set(responses), {'area-snapshot', 'area-sections'})
+        rendered = responses['area-sections']['data']
+
+        responses = self.post_click(
+            '00100', opened=['tab-2-collapse-1', 'tab-1-collapse-4'], rendered=rendered, changed='tab-1-collapse-4.is_open',
+        )
+        self.assertEqual(set(responses) - {'area-snapshot', 'area-sections'}, {'id_income_pie_chart'})
+        rendered = responses['area-sections']['data']
+
+        responses = self.post_click(
+            '00100', tab='real-estate', opened=['tab-2-collapse-1', 'tab-1-collapse-4'], rendered=rendered,
+            changed='tabs.active_tab',
+        )
+        self.assertEqual(set(responses) - {'area-snapshot', 'area-sections'}, {'id_re_owning'})
+        rendered = responses['area-sections']['data']
+
+        responses = self.post_click(
+            '00100', tab='real-estate', opened=['tab-2-collapse-1'], rendered=rendered, changed='tabs.active_tab',
+        )
+        self.assertEqual(set(responses), {'area-snapshot', 'area-sections'})
+
+        responses = self.post_click('00180', tab='real-estate', opened=['tab-2-collapse-1'], rendered=rendered)
+        self.assertEqual(set(responses) - {'area-snapshot', 'area-sections'}, {'id_re_owning'})
+
+    def test_area_change_sends_patches(self):
+        """
+        Check that sections showing another area get patches of the differences, and compare the response size.
+        """
+        census = [SECTION_COLLAPSES[section_id] for section_id in CENSUS_SECTIONS]
+        first = self.post_click('00100', opened=census)
+        responses = self.post_click('00530', opened=census, rendered=first['area-sections']['data'])
+        full = self.post_click('00530', opened=census)
+
+        for section_id in CENSUS_SECTIONS:
+            self.assertEqual(responses[section_id]['children']['__dash_patch_update'], '__dash_patch_update')
+            self.assertNotIn('__dash_patch_update', full[section_id]['children'])
+
+        patched, rendered = len(json.dumps(responses)), len(json.dumps(full))
+        self.assertLess(patched * 10, rendered)
+
+    def test_unloaded_tabs(self):
+        """
+        Check that a click before the other tabs were loaded only returns sections of the loaded tabs.
+        """
+        census = [SECTION_COLLAPSES[section_id] for section_id in CENSUS_SECTIONS]
+        responses = self.post_click('00530', opened=census, loaded=('census',))
+
+        self.assertEqual(set(responses), {'area-snapshot', 'area-sections', *CENSUS_SECTIONS})
+        self.assertEqual(set(responses['area-sections']['data']), set(CENSUS_SECTIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
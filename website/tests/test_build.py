@@ -0,0 +1,151 @@
+"""
+Data build pipeline tests.
+"""
+import os
+import importlib
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from website.data.tools import build
+
+
+class BuildPipelineTests(unittest.TestCase):
+    """
+    Build DAG test case class.
+    """
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.chdir(self.workdir)
+
+        with open('source.txt', 'w') as file:
+            file.write('1')
+
+        with open('stages.py', 'w') as file:
+            file.write(textwrap.dedent("""
+                def double():
+                    with open('source.txt') as src, open('double.txt', 'w') as dst:
+                        dst.write(str(2 * int(src.read())))
+
+                def square():
+                    with open('source.txt') as src, open('square.txt', 'w') as dst:
+                        dst.write(str(int(src.read()) ** 2))
+
+                def total():
+                    with open('double.txt') as a, open('square.txt') as b, open('total.txt', 'w') as dst:
+                        dst.write(str(int(a.read()) + int(b.read())))
+                """))
+
+        self.stages = [
+            build.Stage('total', 'stages.py', 'total', ('double.txt', 'square.txt'), ('total.txt',)),
+            build.Stage('double', 'stages.py', 'double', ('source.txt',), ('double.txt',)),
+            build.Stage('square', 'stages.py', 'square', ('source.txt',), ('square.txt',)),
+        ]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.workdir)
+
+    def run_build(self, **kwargs) -> dict:
+        manifest = build.build(self.stages, jobs=2, manifest_path='manifest.json', **kwargs)
+        return {name: record['status'] for name, record in manifest['stages'].items()}
+
+    def test_stages_run_in_dependency_order(self):
+        """
+        Check that a stage runs after the stages producing its inputs.
+        """
+        self.assertEqual(self.run_build(), {'double': 'built', 'square': 'built', 'total': 'built'})
+        with open('total.txt') as file:
+            self.assertEqual(file.read(), '3')
+
+    def test_unchanged_inputs_are_skipped(self):
+        """
+        Check that only stages downstream of a changed input are rebuilt.
+        """
+        self.run_build()
+        self.assertEqual(set(self.run_build().values()), {'cached'})
+
+        with open('total.txt', 'w') as file:
+            file.write('tampered')
+        self.assertEqual(self.run_build(), {'double': 'cached', 'square': 'cached', 'total': 'built'})
+
+        with open('source.txt', 'w') as file:
+            file.write('3')
+        self.assertEqual(self.run_build(), {'double': 'built', 'square': 'built', 'total': 'built'})
+        with open('total.txt') as file:
+            self.assertEqual(file.read(), '15')
+
+    def test_cycle_is_rejected(self):
+        """
+        Check that stages depending on each other in a cycle raise instead of never being scheduled.
+        """
+        self.stages[1] = build.Stage('double', 'stages.py', 'double', ('total.txt',), ('double.txt',))
+        with self.assertRaisesRegex(ValueError, r"cycle: \['double', 'total'\]"):
+            self.run_build()
+
+    def test_imported_module_change_rebuilds(self):
+        """
+        Check that editing a module imported by a stage script, directly or through a package, rebuilds the stage.
+        """
+        os.makedirs('package')
+        with open(os.path.join('package', '__init__.py'), 'w') as file:
+            file.write('')
+        with open(os.path.join('package', 'factor.py'), 'w') as file:
+            file.write('from .base import BASE\nFACTOR = BASE * 5\n')
+        with open(os.path.join('package', 'base.py'), 'w') as file:
+            file.write('BASE = 1\n')
+        with open('scaled.py', 'w') as file:
+            file.write(textwrap.dedent("""
+                import os
+                import sys
+
+                sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+                def scaled():
+                    from package import factor
+                    with open('source.txt') as src, open('scaled.txt', 'w') as dst:
+                        dst.write(str(factor.FACTOR * int(src.read())))
+                """))
+        self.stages.append(build.Stage('scaled', 'scaled.py', 'scaled', ('source.txt',), ('scaled.txt',)))
+
+        self.run_build()
+        self.assertEqual(set(self.run_build().values()), {'cached'})
+
+        with open(os.path.join('package', 'base.py'), 'w') as file:
+            file.write('BASE = 2\n')
+        statuses = self.run_build()
+        self.assertEqual(statuses['scaled'], 'built')
+        self.assertEqual({statuses[name] for name in ('double', 'square', 'total')}, {'cached'})
+        with open('scaled.txt') as file:
+            self.assertEqual(file.read(), '10')
+
+    def test_stage_modules(self):
+        """
+        Check that the thin wrapper scripts are keyed on the app modules that hold their build logic.
+        """
+        stages = {stage.name: stage for stage in build.STAGES}
+        modules = {
+            name: {
+                os.path.relpath(path, build.PROJECT_ROOT)
+                for path in build.imported_modules(os.path.join(build.PROJECT_ROOT, stages[name].script))
+            }
+            for name in ('datum', 'mobility-index', 'environment-store')
+        }
+        self.assertIn('website/dashmap/datasets/datum.py', modules['datum'])
+        self.assertLessEqual({'website/dashmap/datasets/datum.py', 'website/dashmap/datasets/stops.py'},
+                             modules['mobility-index'])
+        self.assertIn('website/dashmap/datasets/environment.py', modules['environment-store'])
+
+    def test_panel_inputs_are_project_files(self):
+        """
+        Check that the renderer inputs of the panels stage are found from any working directory.
+        """
+        stages = importlib.reload(build).STAGES
+        panels = next(stage for stage in stages if stage.name == 'panels')
+        self.assertIn('website/dashmap/callbacks/area_callbacks.py', panels.inputs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Prerendered panel bundle tests.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from website import create_app
+from website.dashmap.callbacks import area_callbacks
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS, render_area
+from website.dashmap.callbacks.util import bundle
+from website.dashmap.callbacks.util.bundle import MANIFEST_FILE, PanelBundle, build_bundle
+
+
+class PanelBundleTests(unittest.TestCase):
+    """
+    Panel bundle test case class.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.manifest = build_bundle(cls.directory.name, postal_codes=['00100', '00230'], jobs=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.client = self.app.test_client()
+        patch = mock.patch.object(bundle.PANEL_BUNDLE, 'directory', self.directory.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+        area_callbacks.SECTION_CACHE.clear()
+
+    def test_manifest(self):
+        """
+        Check that the bundle of a build replaces the older ones and lists every area and section.
+        """
+        self.assertEqual(self.manifest['sections'], list(AREA_SECTIONS))
+        self.assertEqual(set(self.manifest['areas']), {'00100', '00230'})
+        self.assertEqual(set(os.listdir(self.directory.name)), {self.manifest['version'], MANIFEST_FILE})
+
+    def test_click_is_served_from_bundle(self):
+        """
+        Check that a click on a prerendered area renders nothing and matches live rendering.
+        """
+        click = {'points': [{'location': '00100'}]}
+        renderers = {section_id: mock.Mock(side_effect=render) for section_id, render in AREA_SECTIONS.items()}
+        with mock.patch.dict(area_callbacks.AREA_SECTIONS, renderers):
+            summary, _, prerendered = render_area(click)
+            render_area({'points': [{'location': '00180'}]})
+
+        self.assertEqual(summary['version'], self.manifest['version'])
+        for section_id, render in renderers.items():
+            self.assertEqual(render.call_count, 1, section_id)
+
+        with tempfile.TemporaryDirectory() as empty, \
+                mock.patch.object(area_callbacks, 'PANEL_BUNDLE', PanelBundle(empty)):
+            _, _, live = render_area(click)
+        self.assertEqual(prerendered, live)
+
+    def test_other_versions_are_not_used(self):
+        """
+        Check that a bundle of other data or renderer code is ignored.
+        """
+        self.assertIsNone(bundle.PANEL_BUNDLE.read('00100', 'other'))
+        self.assertIsNotNone(bundle.PANEL_BUNDLE.read('00100', self.manifest['version']))
+
+        reader = PanelBundle(self.directory.name)
+        reader.code = 'other'
+        self.assertIsNone(reader.read('00100', self.manifest['version']))
+
+    def test_code_version_covers_sources(self):
+        """
+        Check that the bundle is tied to the dataset loaders and templates the sections use, not only to the renderers.
+        """
+        files = {os.path.relpath(path, bundle.SOURCE_DIR) for path in bundle.source_files()}
+        for path in ('callbacks/area_callbacks.py', 'callbacks/util/figures.py', 'datasets/reference.py',
+                     'datasets/real_estate.py', 'layouts/templates/templates.py', 'map_graphs.py'):
+            self.assertIn(path, files)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Clientside callback tests.
+"""
+import os
+import json
+import shutil
+import unittest
+import subprocess
+
+from website import create_app
+
+SCRIPT = 'website/dashmap/assets/clientside.js'
+
+# Stands in for dash_clientside.no_update of the renderer
+NO_UPDATE = {'no_update': True}
+
+
+def run_clientside(namespace: str, function: str, args: list, triggered: list = (), inputs_list: list = ()) -> object:
+    """
+    Calls a function of assets/clientside.js in node, with the given callback context.
+    """
+    context = {'triggered': list(triggered), 'inputs_list': list(inputs_list)}
+    program = f"""
+    global.window = {{dash_clientside: {{
+        no_update: {json.dumps(NO_UPDATE)}, callback_context: {json.dumps(context)}
+    }}}};
+    require('{os.path.abspath(SCRIPT)}');
+    const result = window.dash_clientside.{namespace}.{function}(...{json.dumps(args)});
+    console.log(JSON.stringify(result));
+    """
+    output = subprocess.run(['node', '-e', program], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+class ClientsideCallbackTests(unittest.TestCase):
+    """
+    Clientside callback test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def test_toggles_are_clientside(self):
+        """
+        Check that the accordions and the help modal are toggled without server callbacks.
+        """
+        dependencies = self.client.get('/helsinki/_dash-dependencies').get_json()
+        toggles = [
+            dependency for dependency in dependencies
+            if '-collapse-' in dependency['output'] or 'help-modal-centered' in dependency['output']
+        ]
+
+        self.assertEqual(len(toggles), 7)
+        for dependency in toggles:
+            self.assertIn(dependency['clientside_function']['namespace'], ('accordions', 'modal'))
+
+        with self.client.get('/helsinki/assets/clientside.js') as response:
+            self.assertEqual(response.status_code, 200)
+
+    @unittest.skipUnless(shutil.which('node'), "node is not installed")
+    def test_accordion_toggle(self):
+        """
+        Check that a click toggles its group and closes the others.
+        """
+        triggered = [{'prop_id': 'tab-1-2-group-2-toggle.n_clicks', 'value': 1}]
+        self.assertEqual(
+            run_clientside('accordions', 'toggle', [0, 1, 0, 0, True, False, False, False], triggered),
+            [False, True, False, False],
+        )
+
+        triggered = [{'prop_id': 'tab-4-group-2-toggle.n_clicks', 'value': 2}]
+        self.assertEqual(run_clientside('accordions', 'toggle', [1, 2, False, True], triggered), [False, False])
+
+        self.assertEqual(run_clientside('accordions', 'toggle', [None, None, False, False]), [False, False])
+
+    @unittest.skipUnless(shutil.which('node'), "node is not installed")
+    def test_tab_request(self):
+        """
+        Check that only a tab which is not loaded yet is requested.
+        """
+        self.assertEqual(run_clientside('tabs', 'request', ['services', ['census']]), 'services')
+        self.assertEqual(run_clientside('tabs', 'request', ['census', ['census']]), NO_UPDATE)
+
+    @unittest.skipUnless(shutil.which('node'), "node is not installed")
+    def test_panel_request(self):
+        """
+        Check that a panel is requested for a new area only while its accordion group is open.
+        """
+        collapses = [
+            {'id': {'type': 'accordion-collapse', 'index': f"tab-2-collapse-{i}"}, 'property': 'is_open'}
+            for i in (1, 2)
+        ]
+        inputs_list = [{'id': 'area-snapshot', 'property': 'data'}, collapses]
+        requests = [
+            {'collapse': 'tab-2-collapse-1', 'postal_code': None},
+            {'collapse': 'tab-2-collapse-2', 'postal_code': '00100'},
+        ]
+
+        self.assertEqual(
+            run_clientside('panels', 'request', [{'postal_code': '00100'}, [True, True], requests], inputs_list=inputs_list),
+            [{'collapse': 'tab-2-collapse-1', 'postal_code': '00100'}, NO_UPDATE],
+        )
+        self.assertEqual(
+            run_clientside('panels', 'request', [{'postal_code': '00530'}, [False, True], requests], inputs_list=inputs_list),
+            [NO_UPDATE, {'collapse': 'tab-2-collapse-2', 'postal_code': '00530'}],
+        )
+
+    @unittest.skipUnless(shutil.which('node'), "node is not installed")
+    def test_graph_view(self):
+        """
+        Check that the view of a graph holds its x axis relayoutData, and no width before the graph is drawn.
+        A y only zoom keeps the x window of the previous view.
+        """
+        relayout = {'xaxis.range[0]': '2021-03-01', 'xaxis.range[1]': '2021-03-03'}
+        view = run_clientside('graphs', 'view', [relayout, 'air-pollution-graph', None])
+        self.assertEqual(view, {'relayout': relayout, 'width': None})
+
+        y_zoom = {'yaxis.range[0]': 0, 'yaxis.range[1]': 40}
+        self.assertEqual(run_clientside('graphs', 'view', [y_zoom, 'air-pollution-graph', view]), NO_UPDATE)
+        self.assertEqual(
+            run_clientside('graphs', 'view', [{'dragmode': 'pan'}, 'air-pollution-graph', {'relayout': relayout, 'width': 600}]),
+            {'relayout': relayout, 'width': None},
+        )
+        self.assertEqual(
+            run_clientside('graphs', 'view', [y_zoom, 'air-pollution-graph', None]), {'relayout': None, 'width': None},
+        )
+
+        autorange = {'xaxis.autorange': True}
+        self.assertEqual(
+            run_clientside('graphs', 'view', [autorange, 'air-pollution-graph', view]), {'relayout': autorange, 'width': None},
+        )
+
+    @unittest.skipUnless(shutil.which('node'), "node is not installed")
+    def test_modal_toggle(self):
+        """
+        Check that the modal flips only after a click.
+        """
+        self.assertTrue(run_clientside('modal', 'toggle', [1, None, False]))
+        self.assertFalse(run_clientside('modal', 'toggle', [None, None, False]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Split datum build output tests.
+"""
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import geopandas as gpd
+import shapely
+
+from website.dashmap.datasets import datum
+
+
+class DatumSplitTests(unittest.TestCase):
+    """
+    Geometry and attribute round trip test case class.
+    """
+    def test_areas_round_trip_without_properties(self):
+        """
+        Check that the geometry file has the postal code as feature id and no attributes.
+        """
+        areas = gpd.GeoSeries(
+            [shapely.box(24.9, 60.1, 25.0, 60.2), shapely.box(25.0, 60.1, 25.1, 60.2)],
+            index=pd.Index(['00100', '00120'], name='postal_code'),
+            crs='EPSG:4326',
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'areas.geojson')
+            datum.save_areas(areas, path)
+            geojson = datum.load_areas(path)
+            geometries = datum.load_area_geometries(path)
+
+        self.assertEqual([feature['id'] for feature in geojson['features']], ['00100', '00120'])
+        self.assertTrue(all(not feature['properties'] for feature in geojson['features']))
+        self.assertEqual(list(geometries.index), ['00100', '00120'])
+        self.assertTrue(geometries.geometry.equals(areas))
+
+    def test_attributes_round_trip(self):
+        """
+        Check that numeric columns become numbers, columns with '..' markers keep their text and the column order is kept.
+        """
+        raw = pd.DataFrame(
+            {'Inhabitants': ['120', '80'], 'Income': ['..', '21000'], 'neighborhood': ['Keskusta', 'Punavuori']},
+            index=pd.Index(['00100', '00120'], name='postal_code'),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'attributes.npz')
+            datum.save_attributes(datum.to_columns(raw), path)
+            attributes = datum.load_attributes(path)
+
+        self.assertEqual(list(attributes.columns), ['Inhabitants', 'Income', 'neighborhood'])
+        self.assertEqual(list(attributes.index), ['00100', '00120'])
+        self.assertEqual(attributes['Inhabitants'].dtype.kind, 'i')
+        self.assertEqual(list(attributes['Income']), ['..', '21000'])
+        self.assertEqual(attributes.loc['00120', 'neighborhood'], 'Punavuori')
@@ -0,0 +1,84 @@
+"""
+Time-aligned environment store tests.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from website.dashmap.datasets import environment
+
+
+def write_observations(path: str, times: list, values: dict) -> None:
+    """
+    Writes an FMI like observation file with the given timestamps and value columns.
+    """
+    times = pd.to_datetime(times)
+    pd.DataFrame({
+        'Year': times.year,
+        'm': times.month,
+        'd': times.day,
+        'Time': times.strftime('%H:%M'),
+        'Time zone': 'UTC',
+        **values,
+    }).to_csv(path, index=False)
+
+
+class EnvironmentStoreTests(unittest.TestCase):
+    """
+    Environment alignment test case class.
+    """
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_alignment_and_conditional_means(self):
+        """
+        Check that wind is averaged per hour as vectors, the temperature file is completed by the
+        wind file and pollutants are averaged by the weather of the same hour.
+        """
+        wind_path = os.path.join(self.data_dir, 'wind.csv')
+        write_observations(
+            wind_path,
+            [f'2020-01-01 10:{minute:02d}' for minute in range(0, 60, 10)] + ['2020-01-01 11:00'],
+            {
+                environment.TEMPERATURE: [6.0] * 6 + [7.0],
+                environment.WIND_DIRECTION: [350, 10] * 3 + [180],
+                environment.WIND_SPEED: [2.0] * 6 + [4.0],
+            },
+        )
+        temperature_path = os.path.join(self.data_dir, 'temperature.csv')
+        write_observations(temperature_path, ['2020-01-01 10:00'], {environment.TEMPERATURE: [5.0]})
+        air_quality_path = os.path.join(self.data_dir, 'air_quality.csv')
+        write_observations(
+            air_quality_path,
+            ['2020-01-01 10:05', '2020-01-01 11:00', '2020-01-01 12:00'],
+            {'Nitrogen dioxide (ug/m3)': [20.0, 40.0, 60.0], 'Ozone (ug/m3)': [np.nan] * 3},
+        )
+        path = os.path.join(self.data_dir, 'store.npz')
+
+        aligned = environment.build_environment(wind_path, temperature_path, air_quality_path, path)
+        store = environment.EnvironmentStore.load(path)
+
+        self.assertEqual(len(aligned), 3)
+        self.assertNotIn('Ozone (ug/m3)', store.names)
+        first = aligned.iloc[0]
+        self.assertAlmostEqual(np.cos(np.deg2rad(first[environment.WIND_DIRECTION])), 1.0, places=5)
+        self.assertAlmostEqual(first[environment.WIND_SPEED], 2.0)
+        self.assertEqual(list(aligned[environment.TEMPERATURE].iloc[:2]), [5.0, 7.0])
+        self.assertTrue(np.isnan(aligned[environment.WIND_SPEED].iloc[2]))
+
+        by_direction = store.by_direction('Nitrogen dioxide (ug/m3)')
+        self.assertEqual(by_direction.loc['N', 'mean'], 20.0)
+        self.assertEqual(by_direction.loc['S', 'mean'], 40.0)
+        self.assertEqual(by_direction['count'].sum(), 2)
+
+        by_temperature = store.by_temperature('Nitrogen dioxide (ug/m3)')
+        self.assertEqual(by_temperature.loc[5.0, 'mean'], 20.0)
+        self.assertEqual(by_temperature.loc[7.0, 'mean'], 40.0)
+        self.assertEqual(by_temperature['count'].sum(), 2)
@@ -0,0 +1,211 @@
+"""
+Plain dict figure builder tests.
+"""
+import json
+import unittest
+from unittest import mock
+
+import plotly.graph_objects as go
+
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS
+from website.dashmap.callbacks.util import figures
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.cache import to_plain
+from website.dashmap.callbacks.util.figures import (
+    BACKGROUND, BOTTOM_LEGEND, COLORS, chart, indicator, indicator_grid, listing_scatter, pie,
+)
+from website.dashmap.snapshot import load_snapshot
+
+LEGEND = {'orientation': 'h', 'yanchor': 'bottom', 'y': -.15, 'xanchor': 'center', 'x': .5}
+
+
+def go_pie() -> go.Figure:
+    fig = go.Figure(data=[go.Pie(labels=["Lower Class", "Middle Class", "Upper Class"], values=[10, 20, 5], hole=.7)])
+    fig.update_layout(
+        showlegend=True,
+        legend=LEGEND,
+        font=dict(size=14, color="#fff"),
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+        margin={"r": 30, "t": 30, "l": 30, "b": 30},
+        autosize=True
+    )
+    fig.update_traces(hoverinfo='label+percent+value', marker=dict(colors=COLORS, line=dict(color='#1E1E1E', width=2)))
+    return fig
+
+
+def dict_pie() -> dict:
+    return pie(["Lower Class", "Middle Class", "Upper Class"], [10, 20, 5], hole=.7, legend=LEGEND)
+
+
+def go_indicators() -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Indicator(
+        mode="number",
+        value=2345,
+        number={'prefix': "€", "font": {"size": 40}},
+        title={"text": "Average Income<br><span style='font-size:0.8em;color:gray'>" +
+                       "Avg. individual income in postal area</span><br>"},
+        domain={'x': [0, 0.5], 'y': [.5, 1]},
+    ))
+    fig.add_trace(go.Indicator(
+        mode="number",
+        value=1.5,
+        number={"font": {"size": 40}},
+        title={"text": "Average Household Size<br><span style='font-size:0.8em;color:gray'>" +
+                       "Avg. number of people in a household</span><br>"},
+        domain={'x': [0.5, 1], 'y': [.5, 1]},
+        delta={'reference': 2.0, 'relative': True, 'position': "top"},
+    ))
+    fig.update_layout(
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+        margin={"r": 0, "t": 0, "l": 0, "b": 0},
+        autosize=True,
+        font=dict(color="white")
+    )
+    return fig
+
+
+def dict_indicators() -> dict:
+    return indicator_grid([
+        indicator(
+            2345, "Average Income", "Avg. individual income in postal area",
+            domain={'x': [0, 0.5], 'y': [.5, 1]}, number={'prefix': "€", "font": {"size": 40}},
+        ),
+        indicator(
+            1.5, "Average Household Size", "Avg. number of people in a household",
+            domain={'x': [0.5, 1], 'y': [.5, 1]}, number={"font": {"size": 40}},
+            delta={'reference': 2.0, 'relative': True, 'position': "top"},
+        ),
+    ])
+
+
+def go_bar() -> go.Figure:
+    fig = go.Figure(data=[go.Bar(name='Kallio', x=['0-2', '3-6'], y=[120, 80], marker=dict(color='#4182C8'))])
+    fig.add_trace(go.Bar(name='Helsinki Average', x=['0-2', '3-6'], y=[90.5, 70.1], marker=dict(color='#F3903F'),
+                         visible='legendonly'))
+    fig.update_layout(
+        font=dict(size=14, color="#fff"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5),
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+        margin={"r": 30, "t": 30, "l": 30, "b": 30},
+        autosize=True
+    )
+    fig.update_traces(hoverinfo='text')
+    return fig
+
+
+def dict_bar() -> dict:
+    return chart(
+        [
+            {'type': 'bar', 'name': 'Kallio', 'x': ['0-2', '3-6'], 'y': [120, 80],
+             'marker': {'color': '#4182C8'}, 'hoverinfo': 'text'},
+            {'type': 'bar', 'name': 'Helsinki Average', 'x': ['0-2', '3-6'], 'y': [90.5, 70.1],
+             'marker': {'color': '#F3903F'}, 'visible': 'legendonly', 'hoverinfo': 'text'},
+        ],
+        legend=BOTTOM_LEGEND,
+    )
+
+
+def go_polar() -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Barpolar(r=[1, 2, 3], name='< 5 m/s', marker_color=COLORS[3]))
+    fig.update_layout(
+        font=dict(size=14, color="#fff"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5),
+        legend_font_size=12,
+        polar_radialaxis_ticksuffix='%',
+        polar_angularaxis_rotation=0,
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+        margin={"r": 30, "t": 30, "l": 30, "b": 30},
+        autosize=True
+    )
+    fig.update_polars(bgcolor='#1E1E1E')
+    return fig
+
+
+def dict_polar() -> dict:
+    return chart(
+        [{'type': 'barpolar', 'r': [1, 2, 3], 'name': '< 5 m/s', 'marker': {'color': COLORS[3]}}],
+        legend={**BOTTOM_LEGEND, 'font': {'size': 12}},
+        polar={'radialaxis': {'ticksuffix': '%'}, 'angularaxis': {'rotation': 0}, 'bgcolor': BACKGROUND},
+    )
+
+
+def go_scatter() -> go.Figure:
+    fig = go.Figure(data=go.Scattergl(
+        x=[30, 45, 60],
+        y=[700, 900, 1200],
+        mode='markers',
+        hovertemplate='<b>Price</b>: €%{y:.2f}' + '<br><b>Area</b>: %{x}m²<br>',
+        marker=dict(size=8, color=[1, 2, 3], colorscale='OrYel', showscale=True),
+    ))
+    fig.update_layout(
+        showlegend=False,
+        paper_bgcolor='#1E1E1E',
+        plot_bgcolor='#1E1E1E',
+        margin={"r": 50, "t": 50, "l": 50, "b": 50},
+        autosize=True,
+    )
+    fig.update_traces(marker=dict(line=dict(color='#1E1E1E', width=3)))
+    fig.update_xaxes(color='#fff', gridcolor='#D3D3D3')
+    fig.update_yaxes(color='#fff', gridcolor='#D3D3D3')
+    return fig
+
+
+def dict_scatter() -> dict:
+    return listing_scatter([30, 45, 60], [700, 900, 1200], [1, 2, 3], 'OrYel')
+
+
+# Figures built with go.Figure as the sections did, and with the builder, also timed by benchmark.py
+FIGURES = {
+    'pie': (go_pie, dict_pie),
+    'indicator grid': (go_indicators, dict_indicators),
+    'bar': (go_bar, dict_bar),
+    'polar': (go_polar, dict_polar),
+    'scatter': (go_scatter, dict_scatter),
+}
+
+
+class FigureBuilderTests(unittest.TestCase):
+    """
+    Figure builder test case class.
+    """
+    def test_equivalent_to_go_figure(self):
+        """
+        Check that the JSON of every template is the one of the go.Figure it replaces.
+        """
+        for name, (build_go, build_dict) in FIGURES.items():
+            with self.subTest(name):
+                self.assertEqual(to_plain(build_dict()), to_plain(build_go()))
+
+    def test_templates_are_not_modified(self):
+        """
+        Check that building a figure leaves the shared templates as they are.
+        """
+        layout = json.dumps(figures.CHART_LAYOUT)
+        fig = chart([], legend=BOTTOM_LEGEND, margin={'t': 50})
+
+        self.assertEqual(fig['layout']['margin'], {'r': 30, 't': 50, 'l': 30, 'b': 30})
+        self.assertEqual(json.dumps(figures.CHART_LAYOUT), layout)
+
+    def test_sections_validate(self):
+        """
+        Check that the figures of every section pass the validation of go.Figure unchanged.
+        """
+        snapshot = load_snapshot()
+        for postal_code in ('00100', '00530', '00230'):
+            area = build_area(snapshot, postal_code)
+            for section_id, render in AREA_SECTIONS.items():
+                with self.subTest(postal_code=postal_code, section=section_id):
+                    fast = json.dumps(to_plain(render(area)), sort_keys=True)
+                    with mock.patch.object(figures, 'VALIDATE_FIGURES', True):
+                        validated = json.dumps(to_plain(render(area)), sort_keys=True)
+                    self.assertEqual(fast, validated)
+
+
+if __name__ == "__main__":
+    unittest.main()
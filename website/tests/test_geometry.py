@@ -0,0 +1,71 @@
+"""
+Projected geometry attribute tests.
+"""
+import runpy
+import unittest
+
+import numpy as np
+import shapely
+
+from website.dashmap.datasets import geometry
+from website.dashmap.callbacks.tab_mobility.mobility_callbacks import render_mobility_index
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.cache import to_plain
+from website.dashmap.snapshot import load_snapshot
+
+
+class AreaGeometryTests(unittest.TestCase):
+    """
+    Geometry attribute build test case class.
+    """
+    def test_adjacency_skips_corners(self):
+        """
+        Check that squares sharing an edge are neighbours both ways and squares touching at a corner are not.
+        """
+        squares = np.array([
+            shapely.box(0, 0, 100, 100),
+            shapely.box(100, 0, 200, 100),
+            shapely.box(200, 100, 300, 200),
+        ])
+
+        indptr, indices, shared = geometry.adjacency(squares)
+
+        np.testing.assert_array_equal(indptr, [0, 1, 2, 2])
+        np.testing.assert_array_equal(indices, [1, 0])
+        np.testing.assert_allclose(shared, [100, 100], rtol=0.05)
+
+    def test_build_matches_metric_geometry(self):
+        """
+        Check that the stored attributes match the polygons in EPSG:3067 and the lookups use them.
+        """
+        areas = geometry.AreaGeometry(geometry.build_geometry(path=None))
+
+        self.assertEqual(len(areas.table), 172)
+        self.assertTrue(areas.table.index.is_monotonic_increasing)
+        self.assertAlmostEqual(areas.table['area'].sum() / 1e6, 1300, delta=400)
+
+        neighbours = areas.neighbours('00100')
+        self.assertIn('00120', neighbours.index)
+        self.assertIn('00100', areas.neighbours('00120').index)
+        self.assertTrue((neighbours >= geometry.MIN_SHARED_BOUNDARY).all())
+
+        box = areas.table.loc['00100', ['min_x', 'min_y', 'max_x', 'max_y']]
+        self.assertIn('00100', areas.within(*box))
+
+    def test_consumers_read_stored_geometry(self):
+        """
+        Check that the mobility index is computed on the stored areas, and that the mobility section
+        compares an area with its neighbours.
+        """
+        mobility_index = runpy.run_path('website/data/mobility/mobility_index.py', run_name='test')
+        regions, stations, areas = mobility_index['load_data']()
+        result = mobility_index['get_mobility_index'](regions, stations, areas).set_index('index')
+
+        area_km2 = areas.table['area'].reindex(result.index) / 1e6
+        np.testing.assert_allclose(result['node_density'], result['mobility_nodes'] / area_km2, rtol=1e-5)
+
+        snapshot = load_snapshot()
+        neighbours = snapshot.geometry.neighbours('00100')
+        expected = np.average(snapshot.mobility['mobility_index'].astype(float)[neighbours.index], weights=neighbours)
+        figure = to_plain(render_mobility_index(build_area(snapshot, '00100')))[3]['props']['figure']
+        self.assertAlmostEqual(figure['data'][0]['delta']['reference'], expected)
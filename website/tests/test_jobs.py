@@ -0,0 +1,151 @@
+"""
+Background panel tests.
+"""
+import json
+import time
+import unittest
+import dataclasses
+from unittest import mock
+
+from website import create_app
+from website.dashmap.callbacks.tab_real_estate import real_estate_callbacks
+from website.dashmap.callbacks.tab_real_estate.real_estate_callbacks import LISTING_STEPS, render_listings
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.cache import to_plain
+from website.dashmap.callbacks.util.jobs import data_version, init_job_manager
+from website.dashmap.layouts.templates.templates import panel_request_id
+from website.dashmap.datasets.versions import DataVersions
+from website.dashmap.snapshot import current_snapshot, load_snapshot, swap_snapshot
+
+PANEL = 'id_re_renting_listings'
+
+
+def request_body(postal_code: str) -> dict:
+    """
+    Callback request of the rentals panel for an area.
+    """
+    request_id = panel_request_id(PANEL)
+    return {
+        'output': f"{PANEL}.children",
+        'outputs': {'id': PANEL, 'property': 'children'},
+        'inputs': [{
+            'id': request_id, 'property': 'data',
+            'value': {'collapse': 'tab-2-collapse-2', 'postal_code': postal_code},
+        }],
+        'changedPropIds': [json.dumps(request_id, separators=(',', ':'), sort_keys=True) + '.data'],
+        'state': [],
+    }
+
+
+def slow_listings(area, deal_type, set_progress=None) -> list:
+    time.sleep(30)
+    return []
+
+
+class BackgroundPanelTests(unittest.TestCase):
+    """
+    Background panel test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def post(self, postal_code: str, handles: dict = None):
+        return self.client.post(
+            '/helsinki/_dash-update-component', json=request_body(postal_code), query_string=handles or {}
+        ).get_json()
+
+    def poll(self, postal_code: str, job: dict, timeout: float = 30) -> dict:
+        """
+        Polls a job as the browser does until it returns the panel.
+        """
+        start = time.perf_counter()
+        while time.perf_counter() - start < timeout:
+            response = self.post(postal_code, {'cacheKey': job['cacheKey'], 'job': job['job']})
+            if 'response' in response:
+                return response
+            time.sleep(.05)
+        self.fail("the job did not finish")
+
+    def test_render_listings(self):
+        """
+        Check that the listings of a public area are highlighted, and that the steps are reported.
+        """
+        snapshot = load_snapshot()
+        steps = []
+        children = render_listings(build_area(snapshot, '00100'), 'rent', steps.append)
+        figure = children[0]['props']['figure']
+
+        self.assertEqual(steps, list(range(1, LISTING_STEPS + 1)))
+        self.assertEqual(len(figure['data']), 2)
+        self.assertTrue(len(figure['data'][1]['x']))
+        self.assertLess(len(figure['data'][1]['x']), len(figure['data'][0]['x']))
+
+        private = render_listings(build_area(snapshot, '00230'), 'sell')
+        self.assertEqual(len(private[0]['props']['figure']['data']), 1)
+
+    def test_panels_are_background(self):
+        """
+        Check that the listing panels are background callbacks and left out of the sections.
+        """
+        dependencies = self.client.get('/helsinki/_dash-dependencies').get_json()
+        for panel in real_estate_callbacks.REAL_ESTATE_PANELS:
+            dependency = next(dependency for dependency in dependencies if dependency['output'] == f"{panel}.children")
+            self.assertIn('background', dependency)
+            self.assertEqual(dependency['running']['running'], {f"{panel}-placeholder.style": {'display': 'block'}})
+
+        area = build_area(load_snapshot(), '00100')
+        for render in real_estate_callbacks.REAL_ESTATE_SECTIONS.values():
+            traces = [
+                trace['type'] for child in to_plain(render(area)) if child['type'] == 'Graph'
+                for trace in child['props']['figure']['data']
+            ]
+            self.assertNotIn('scattergl', traces)
+
+    def test_data_version(self):
+        """
+        Check that the results of the panels are kept when only datasets they do not read change.
+        """
+        snapshot = current_snapshot()
+        self.addCleanup(swap_snapshot, snapshot)
+        version = data_version()
+
+        for name, changed in (('environment', False), ('real_estate', True)):
+            datasets = dict(snapshot.versions.datasets, **{name: 'changed'})
+            swap_snapshot(dataclasses.replace(snapshot, versions=DataVersions(datasets)))
+            self.assertEqual(data_version() != version, changed, name)
+
+    def test_job(self):
+        """
+        Check that a request returns a job at once, and that the job reports its progress and the panel.
+        A finished panel is answered on the first poll.
+        """
+        job = self.post('00530')
+        self.assertEqual(set(job), {'cacheKey', 'job', 'progressDefault'})
+
+        response = self.poll('00530', job)
+        panel = response['response'][PANEL]['children']
+        self.assertEqual(panel[0]['props']['id'], 'listings-rent')
+
+        cached = self.post('00530', self.post('00530'))
+        self.assertEqual(cached['response'][PANEL]['children'], panel)
+
+    def test_superseded_job_is_cancelled(self):
+        """
+        Check that requesting another area terminates the job of the previous one.
+        """
+        manager = init_job_manager()
+        with mock.patch.object(real_estate_callbacks, 'render_listings', slow_listings):
+            first = self.post('00180')
+        pid = first['job'].split('~')[0]
+        self.assertTrue(manager.job_running(pid))
+
+        second = self.post('00100', {'oldJob': first['job']})
+        self.assertFalse(manager.job_running(pid))
+
+        response = self.poll('00100', second)
+        self.assertEqual(response['response'][PANEL]['children'][0]['props']['id'], 'listings-rent')
+
+
+if __name__ == "__main__":
+    unittest.main()
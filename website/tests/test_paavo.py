@@ -0,0 +1,135 @@
+"""
+PAAVO fetcher tests, run against a local server that replays recorded PXWeb responses.
+"""
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from website.data.tools.paavo import PaavoFetcher, FetchError
+
+FIXTURES = 'website/tests/fixtures/paavo_responses.json'
+API_PATH = '/PXWeb/api/v1/en/Postinumeroalueittainen_avoin_tieto'
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Serves the recorded responses, honours If-None-Match and fails on demand.
+    """
+    def do_GET(self):
+        self.replay()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.queries.append(body)
+        self.replay()
+
+    def replay(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            failures = server.failures.get(self.path, 0)
+            server.failures[self.path] = max(failures - 1, 0)
+        try:
+            time.sleep(0.02)
+            response = server.responses.get((self.command, self.path))
+            if failures:
+                self.send_response(503)
+                self.end_headers()
+            elif response is None:
+                self.send_response(404)
+                self.end_headers()
+            elif self.headers.get('If-None-Match') == response['etag']:
+                self.send_response(304)
+                self.end_headers()
+            else:
+                body = response['body']
+                content = (body if isinstance(body, str) else json.dumps(body)).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', response['content_type'])
+                self.send_header('Content-Length', str(len(content)))
+                self.send_header('ETag', response['etag'])
+                self.end_headers()
+                self.wfile.write(content)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class PaavoFetcherTests(unittest.TestCase):
+    """
+    Concurrent cached fetcher test case class.
+    """
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ReplayHandler)
+        with open(FIXTURES, encoding='utf-8') as file:
+            self.server.responses = {(r['method'], r['path']): r for r in json.load(file)}
+        self.server.lock = threading.Lock()
+        self.server.requests, self.server.queries, self.server.failures = [], [], {}
+        self.server.active = self.server.max_active = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.cache_dir, self.output_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.api_url = f"http://127.0.0.1:{self.server.server_address[1]}{API_PATH}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.cache_dir)
+        shutil.rmtree(self.output_dir)
+
+    def fetch(self, **options):
+        async def run():
+            async with PaavoFetcher(self.api_url, self.cache_dir, **options) as fetcher:
+                return await fetcher.fetch_all(output_dir=self.output_dir), fetcher.stats
+        return asyncio.run(run())
+
+    def test_fetches_all_releases_and_tables(self):
+        """
+        Check that every table of every release is written, over a bounded number of connections.
+        """
+        paths, stats = self.fetch(connections=2)
+
+        self.assertEqual(len(paths), 3)
+        self.assertLessEqual(self.server.max_active, 2)
+        self.assertEqual(stats['requests'], 9)
+        with open(paths[('2022', 'paavo_pxt_12f7.px')], encoding='utf-8') as file:
+            self.assertIn('Punavuori', file.read())
+        for query in self.server.queries:
+            self.assertEqual([q['selection'] for q in query['query']], [{'filter': 'all', 'values': ['*']}] * 2)
+
+    def test_second_run_is_revalidated_from_cache(self):
+        """
+        Check that a second run sends conditional requests and reuses the cached bodies.
+        """
+        first, _ = self.fetch()
+        second, stats = self.fetch()
+
+        self.assertEqual(first, second)
+        self.assertEqual(stats['not_modified'], stats['requests'])
+
+    def test_retries_with_backoff(self):
+        """
+        Check that transient server errors are retried and persistent ones raise.
+        """
+        self.server.failures = {f"{API_PATH}/2022": 2}
+        paths, stats = self.fetch(backoff=0.01)
+        self.assertEqual(len(paths), 3)
+        self.assertEqual(stats['retries'], 2)
+
+        self.server.failures = {API_PATH: 10}
+        with self.assertRaises(FetchError):
+            self.fetch(backoff=0.01, retries=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
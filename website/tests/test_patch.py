@@ -0,0 +1,102 @@
+"""
+Partial section update tests.
+"""
+import copy
+import json
+import unittest
+
+from dash import Patch
+from plotly.utils import PlotlyJSONEncoder
+
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS
+from website.dashmap.callbacks.util.area import build_area
+from website.dashmap.callbacks.util.cache import to_plain
+from website.dashmap.callbacks.util.patch import patch_children
+from website.dashmap.snapshot import load_snapshot
+
+
+def apply_patch(value: object, update: object) -> object:
+    """
+    Applies an update to a value as the browser does, for the operations used by patch_children.
+    """
+    if not isinstance(update, Patch):
+        return update
+
+    value = copy.deepcopy(value)
+    for operation in update.to_plotly_json()['operations']:
+        *path, key = operation['location']
+        target = value
+        for item in path:
+            target = target[item]
+        if operation['operation'] == 'Assign':
+            target[key] = operation['params']['value']
+        elif operation['operation'] == 'Delete':
+            del target[key]
+        else:
+            raise ValueError(operation['operation'])
+    return value
+
+
+def size(value: object) -> int:
+    return len(json.dumps(value, cls=PlotlyJSONEncoder))
+
+
+class PatchChildrenTests(unittest.TestCase):
+    """
+    Section patch test case class.
+    """
+    def test_changed_values(self):
+        """
+        Check that only changed values are sent, data arrays as a whole.
+        """
+        old = [
+            {'type': 'H5', 'props': {'children': 'Title'}},
+            {'type': 'Graph', 'props': {'figure': {'data': [{'values': [1, 2, 3], 'name': 'a'}], 'layout': {}}}},
+            {'type': 'P', 'props': {'children': 'Kallio', 'id': 'text'}},
+        ]
+        new = copy.deepcopy(old)
+        new[1]['props']['figure']['data'][0]['values'] = [1, 2, 4]
+        new[2]['props']['children'] = 'Kamppi'
+        del new[2]['props']['id']
+
+        update = patch_children(old, new)
+        operations = update.to_plotly_json()['operations']
+
+        self.assertEqual(apply_patch(old, update), new)
+        self.assertEqual(
+            sorted(operation['location'] for operation in operations),
+            [[1, 'props', 'figure', 'data', 0, 'values'], [2, 'props', 'children'], [2, 'props', 'id']],
+        )
+        self.assertEqual(patch_children(old, copy.deepcopy(old)).to_plotly_json()['operations'], [])
+
+    def test_replaced_children(self):
+        """
+        Check that children of another structure are sent as a whole.
+        """
+        old = [{'type': 'H5', 'props': {'children': 'Title'}}]
+        new = [{'type': 'H5', 'props': {'children': 'Title'}}, {'type': 'P', 'props': {'children': 'private'}}]
+        self.assertIs(patch_children(old, new), new)
+
+    def test_sections(self):
+        """
+        Check that the patches of every section turn one area into the other, and compare their size.
+        """
+        snapshot = load_snapshot()
+        full_bytes = patch_bytes = 0
+        for old_code, new_code in (('00100', '00530'), ('00530', '00180'), ('00180', '00230'), ('00230', '00100')):
+            old_area, new_area = build_area(snapshot, old_code), build_area(snapshot, new_code)
+            for section_id, render in AREA_SECTIONS.items():
+                with self.subTest(old=old_code, new=new_code, section=section_id):
+                    old, new = to_plain(render(old_area)), to_plain(render(new_area))
+                    update = patch_children(old, new)
+
+                    self.assertEqual(apply_patch(old, update), new)
+                    if '00230' not in (old_code, new_code):
+                        full_bytes += size(new)
+                        patch_bytes += size(update)
+
+        self.assertLess(patch_bytes * 10, full_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
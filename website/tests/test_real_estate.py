@@ -0,0 +1,102 @@
+"""
+Real estate ingestion tests.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from website.dashmap.datasets import real_estate
+
+
+class RealEstateIngestionTests(unittest.TestCase):
+    """
+    Incremental ingestion test case class.
+    """
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        listings = pd.read_csv('website/data/real-estate/real-estate.csv', dtype={'postcode': str})
+        listings.head(500).to_csv(os.path.join(self.data_dir, real_estate.LISTINGS_FILE), index=False)
+        self.batch = listings.iloc[400:700]
+        real_estate.rebuild(self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_ingest_skips_known_listings(self):
+        """
+        Check that listings already in the store are not ingested twice.
+        """
+        path = os.path.join(self.data_dir, 'batch.csv')
+        self.batch.to_csv(path, index=False)
+
+        first = real_estate.ingest(path, self.data_dir)
+        second = real_estate.ingest(path, self.data_dir)
+
+        self.assertGreater(first.rows, 500)
+        self.assertEqual(first.rows, second.rows)
+        self.assertEqual(first.version, second.version)
+
+    def test_incremental_aggregates_match_rebuild(self):
+        """
+        Check that aggregates updated from a JSON lines batch equal a full rebuild.
+        """
+        path = os.path.join(self.data_dir, 'batch.jsonl')
+        self.batch.to_json(path, orient='records', lines=True)
+
+        incremental = real_estate.ingest(path, self.data_dir)
+        rebuilt = real_estate.rebuild(self.data_dir)
+
+        for deal_type, postcodes in rebuilt.aggregates.items():
+            for postcode, aggregate in postcodes.items():
+                other = incremental.get(postcode, deal_type)
+                self.assertEqual(aggregate.count, other.count)
+                self.assertEqual(aggregate.saunas, other.saunas)
+                self.assertEqual(aggregate.sketch.bins, other.sketch.bins)
+                self.assertAlmostEqual(aggregate.mean('price_per_square'), other.mean('price_per_square'))
+
+    def test_missing_postcodes_are_dropped(self):
+        """
+        Check that listings without a postcode are not aggregated under a made up one.
+        """
+        batch = self.batch.head(4).astype({'postcode': object})
+        batch.loc[batch.index[:3], 'postcode'] = [np.nan, None, ' ']
+        listings = real_estate.normalize_listings(batch)
+
+        self.assertEqual(len(listings), 1)
+        self.assertEqual(listings['postcode'].tolist(), [batch['postcode'].iloc[3].zfill(5)])
+
+        path = os.path.join(self.data_dir, 'batch.jsonl')
+        batch.to_json(path, orient='records', lines=True)
+        snapshot = real_estate.ingest(path, self.data_dir)
+        postcodes = {postcode for postcodes in snapshot.aggregates.values() for postcode in postcodes}
+        self.assertFalse({'00nan', '0None', '00000'} & postcodes)
+
+    def test_concurrent_ingests_are_serialized(self):
+        """
+        Check that batches ingested at the same time all reach the listings file and the aggregates.
+        """
+        listings = pd.read_csv('website/data/real-estate/real-estate.csv', dtype={'postcode': str})
+        paths = []
+        for index, start in enumerate(range(500, 900, 100)):
+            path = os.path.join(self.data_dir, f"batch-{index}.csv")
+            listings.iloc[start:start + 100].to_csv(path, index=False)
+            paths.append(path)
+
+        with ThreadPoolExecutor(len(paths)) as executor:
+            list(executor.map(lambda path: real_estate.ingest(path, self.data_dir), paths))
+
+        snapshot = real_estate.load_snapshot(self.data_dir)
+        rebuilt = real_estate.rebuild(self.data_dir)
+        self.assertEqual(snapshot.rows, rebuilt.rows)
+        self.assertEqual(snapshot.csv_bytes, os.path.getsize(os.path.join(self.data_dir, real_estate.LISTINGS_FILE)))
+        for deal_type, region in rebuilt.region.items():
+            self.assertEqual(snapshot.region[deal_type].count, region.count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Region-wide reference statistics tests.
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from website.dashmap.datasets.datum import load_attributes
+from website.dashmap.datasets.reference import reference_statistics
+
+
+class ReferenceStatisticsTests(unittest.TestCase):
+    """
+    Reference statistics test case class.
+    """
+    def test_statistics(self):
+        """
+        Check the statistics of a small table, including a missing value and a text column.
+        """
+        datum = pd.DataFrame({
+            'neighborhood': ['a', 'b', 'c'],
+            'Inhabitants, total, 2020 (HE)': [100, 300, 0],
+            'Average age of inhabitants, 2020 (HE)': [30.0, 50.0, np.nan],
+        }, index=['00100', '00200', '00300'])
+
+        statistics = reference_statistics(datum)
+
+        self.assertEqual(list(statistics.index), list(datum.columns))
+        self.assertTrue(statistics.loc['neighborhood'].isna().all())
+
+        age = statistics.loc['Average age of inhabitants, 2020 (HE)']
+        self.assertAlmostEqual(age['mean'], 40.0)
+        self.assertAlmostEqual(age['weighted_mean'], 45.0)
+        self.assertAlmostEqual(age['median'], 40.0)
+        self.assertAlmostEqual(age['p25'], 35.0)
+
+        inhabitants = statistics.loc['Inhabitants, total, 2020 (HE)']
+        self.assertAlmostEqual(inhabitants['weighted_mean'], (100 * 100 + 300 * 300) / 400)
+
+    def test_matches_census_means(self):
+        """
+        Check that the reference means are the region means the sections showed before.
+        """
+        datum = load_attributes()
+        statistics = reference_statistics(datum)
+
+        for i in [6, 35, 36, 42, 43, 45, 46, 47, 59, 60]:
+            self.assertAlmostEqual(statistics['mean'].iloc[i], datum.iloc[:, i].astype(float).mean())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Rendered section cache tests.
+"""
+import tempfile
+import unittest
+import dataclasses
+from unittest import mock
+
+from dash import html
+
+from website import create_app
+from website.dashmap.callbacks import area_callbacks
+from website.dashmap.callbacks.area_callbacks import AREA_SECTIONS, SECTION_CACHE, SECTION_DATASETS, render_area
+from website.dashmap.callbacks.tab_real_estate.real_estate_callbacks import REAL_ESTATE_SECTIONS
+from website.dashmap.callbacks.util.bundle import PanelBundle
+from website.dashmap.callbacks.util.cache import LRUCache
+from website.dashmap.datasets.versions import DataVersions
+from website.dashmap.snapshot import current_snapshot, swap_snapshot
+
+
+class LRUCacheTests(unittest.TestCase):
+    """
+    LRU cache test case class.
+    """
+    def test_eviction_order_and_counters(self):
+        """
+        Check that the least recently used entry is evicted and hits and misses are counted.
+        """
+        cache = LRUCache(max_entries=2)
+        cache.get_or_render('a', lambda: [html.P('a')])
+        cache.get_or_render('b', lambda: [html.P('b')])
+        self.assertEqual(cache.get_or_render('a', lambda: None)[0]['props'], {'children': 'a'})
+
+        cache.get_or_render('c', lambda: [])
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats(), {'entries': 2, 'max_entries': 2, 'hits': 1, 'misses': 3, 'evictions': 1})
+
+    def test_disabled(self):
+        """
+        Check that a cache without entries renders every time.
+        """
+        cache = LRUCache(max_entries=0)
+        render = mock.Mock(return_value=[1])
+
+        self.assertEqual(cache.get_or_render('a', render), [1])
+        self.assertEqual(cache.get_or_render('a', render), [1])
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+class SectionCacheTests(unittest.TestCase):
+    """
+    Section cache test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        SECTION_CACHE.clear()
+
+        # Without prerendered sections
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        bundle = mock.patch.object(area_callbacks, 'PANEL_BUNDLE', PanelBundle(directory.name))
+        bundle.start()
+        self.addCleanup(bundle.stop)
+
+    def test_repeat_click_skips_rendering(self):
+        """
+        Check that a repeat click on an area returns the same sections without rendering them.
+        """
+        click = {'points': [{'location': '00180'}]}
+        first_summary, _, first = render_area(click)
+
+        renderers = {section_id: mock.Mock(side_effect=render) for section_id, render in AREA_SECTIONS.items()}
+        with mock.patch.dict(area_callbacks.AREA_SECTIONS, renderers):
+            summary, _, sections = render_area(click)
+            render_area({'points': [{'location': '00100'}]})
+
+        self.assertEqual(summary, first_summary)
+        self.assertEqual(sections, first)
+        for section_id, render in renderers.items():
+            self.assertEqual(render.call_count, 1, section_id)
+
+        versions = current_snapshot().versions
+        for section_id in AREA_SECTIONS:
+            self.assertIn(('00180', section_id, versions.key(*SECTION_DATASETS[section_id])), SECTION_CACHE)
+
+    def test_swap_renders_sections_of_changed_datasets(self):
+        """
+        Check that after a data swap only the sections reading a changed dataset are rendered again,
+        from the cache and in the browser.
+        """
+        click = {'points': [{'location': '00180'}]}
+        _, rendered, _ = render_area(click)
+
+        snapshot = current_snapshot()
+        self.addCleanup(swap_snapshot, snapshot)
+        datasets = dict(snapshot.versions.datasets, real_estate='changed', environment='changed')
+        swap_snapshot(dataclasses.replace(snapshot, versions=DataVersions(datasets)))
+
+        renderers = {section_id: mock.Mock(side_effect=render) for section_id, render in AREA_SECTIONS.items()}
+        with mock.patch.dict(area_callbacks.AREA_SECTIONS, renderers):
+            _, updated, _ = render_area(click, rendered=rendered)
+            render_area(click)
+
+        for section_id, render in renderers.items():
+            changed = section_id in REAL_ESTATE_SECTIONS
+            self.assertEqual(render.call_count, int(changed), section_id)
+            self.assertEqual(updated[section_id] != rendered[section_id], changed, section_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Data snapshot hot reload tests.
+"""
+import gc
+import weakref
+import unittest
+from unittest import mock
+
+from website import create_app
+from website.dashmap import map as dashmap
+from website.dashmap.snapshot import current_snapshot
+
+
+class SnapshotReloadTests(unittest.TestCase):
+    """
+    Hot reload test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def test_reload_swaps_and_releases_old_snapshot(self):
+        """
+        Check that a reload swaps in a warmed snapshot, a request holding the old one
+        still reads it, and the old one is freed once released.
+        """
+        in_flight = current_snapshot()
+        self.assertFalse(dashmap.reloader.reload())
+
+        self.assertTrue(dashmap.reloader.reload(force=True))
+        new = current_snapshot()
+
+        self.assertIsNot(in_flight, new)
+        self.assertIsNotNone(new.layout)
+        self.assertEqual(in_flight.datum.loc['00100', 'neighborhood'], new.datum.loc['00100', 'neighborhood'])
+
+        released = weakref.ref(in_flight)
+        del in_flight
+        gc.collect()
+        self.assertIsNone(released())
+
+        self.assertEqual(self.client.get('/helsinki/_dash-layout').status_code, 200)
+
+    def test_admin_reload_needs_token(self):
+        """
+        Check that the admin endpoint is hidden without the token and starts a reload with it.
+        """
+        self.assertEqual(self.client.post('/helsinki/_admin/reload').status_code, 404)
+
+        with mock.patch.object(dashmap, 'ADMIN_TOKEN', 'secret'), \
+                mock.patch.object(dashmap.reloader, 'trigger') as trigger:
+            self.assertEqual(self.client.post('/helsinki/_admin/reload').status_code, 404)
+            response = self.client.post('/helsinki/_admin/reload?force=1', headers={'X-Admin-Token': 'secret'})
+
+        self.assertEqual(response.status_code, 202)
+        trigger.assert_called_once_with(force=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+HSL stop layer tests.
+"""
+import unittest
+
+import numpy as np
+
+from website.dashmap.datasets import stops
+
+
+class StopLayerTests(unittest.TestCase):
+    """
+    Stop table build test case class.
+    """
+    def test_station_labels_chain_platforms(self):
+        """
+        Check that platforms are linked transitively, but only within the same key.
+        """
+        x = np.array([0.0, 100.0, 200.0, 1000.0, 50.0])
+        y = np.zeros(5)
+        keys = np.array([0, 0, 0, 0, 1])
+
+        labels = stops.station_labels(x, y, keys, radius=150)
+
+        np.testing.assert_array_equal(labels, [0, 0, 0, 3, 4])
+
+    def test_build_merges_platforms(self):
+        """
+        Check that the stop table has fewer rows than platforms, WGS84 coordinates and typed columns.
+        """
+        platforms = stops.read_source()
+        table = stops.build_stops(path=None)
+
+        self.assertLess(len(table), len(platforms))
+        self.assertEqual(table['platforms'].sum(), len(platforms))
+        self.assertTrue(table['lon'].between(23.5, 27).all())
+        self.assertTrue(table['lat'].between(59.9, 61).all())
+        self.assertEqual(str(table['VERKKO'].dtype), 'category')
+        self.assertEqual(str(table['PYSAKKITYY'].dtype), 'category')
+
+        loaded = stops.load_stops()
+        self.assertEqual(len(loaded), len(table))
+        self.assertEqual(list(loaded['VERKKO'].cat.categories), list(table['VERKKO'].cat.categories))
+
+
+if __name__ == "__main__":
+    unittest.main()
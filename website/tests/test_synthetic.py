@@ -0,0 +1,62 @@
+"""
+Synthetic scale data tests.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import shapely
+
+from website.data.tools import synthetic
+from website.dashmap.datasets.versions import DATASET_FILES
+from website.dashmap.datasets.datum import load_attributes
+
+
+class SyntheticDataTests(unittest.TestCase):
+    """
+    Synthetic data generator test case class.
+    """
+    def test_tessellation_covers_region(self):
+        """
+        Check that the cells are in the order of the seeds and cover the region without overlaps.
+        """
+        region = shapely.box(0, 0, 100, 100)
+        x = np.array([10.0, 90.0, 50.0, 20.0])
+        y = np.array([10.0, 20.0, 60.0, 90.0])
+
+        cells = synthetic.tessellate(region, x, y)
+
+        self.assertTrue(shapely.contains_xy(cells, x, y).all())
+        self.assertAlmostEqual(shapely.area(cells).sum(), 10_000, places=6)
+        self.assertAlmostEqual(shapely.area(shapely.union_all(cells)), 10_000, places=6)
+
+    def test_generated_tree_loads(self):
+        """
+        Check that a generated tree has every served file, the real schemas and loads as a snapshot.
+        """
+        root = tempfile.mkdtemp()
+        cwd = os.getcwd()
+        try:
+            counts = synthetic.generate(0.5, root, seed=1)
+            real = load_attributes()
+
+            os.chdir(root)
+            for paths in DATASET_FILES.values():
+                for path in paths:
+                    self.assertTrue(os.path.exists(path), path)
+
+            from website.dashmap.snapshot import load_snapshot
+            snapshot = load_snapshot()
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(root)
+
+        self.assertEqual(counts['areas'], round(len(real) * 0.5))
+        self.assertEqual(list(snapshot.datum.columns), list(real.columns))
+        self.assertEqual(len(snapshot.areas['features']), counts['areas'])
+        self.assertTrue(snapshot.datum.index.is_unique)
+        self.assertTrue(snapshot.real_estate.index.astype(str).str.zfill(5).isin(snapshot.datum.index).all())
+        self.assertEqual(len(snapshot.bus_stops), counts['stops'])
+        self.assertEqual(len(snapshot.air_quality.time), counts['air_quality_points'])
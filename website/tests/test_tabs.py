@@ -0,0 +1,122 @@
+"""
+Lazy tab loading tests.
+"""
+import json
+import unittest
+import dataclasses
+
+import dash
+from plotly.utils import PlotlyJSONEncoder
+
+from website import create_app
+from website.dashmap.callbacks.tab_callbacks import TAB_CACHE, load_tab
+from website.dashmap.map_layout import DEFAULT_TAB, TAB_CONTENTS, init_layout
+from website.dashmap.datasets.versions import DataVersions
+from website.dashmap.snapshot import current_snapshot, swap_snapshot
+
+
+def component_ids(component) -> set:
+    """
+    ids of a JSON layout and all its descendants.
+    """
+    ids = set()
+    if isinstance(component, dict):
+        if isinstance(component.get('props'), dict) and 'id' in component['props']:
+            ids.add(json.dumps(component['props']['id'], sort_keys=True))
+        for value in component.values():
+            ids |= component_ids(value)
+    elif isinstance(component, list):
+        for value in component:
+            ids |= component_ids(value)
+    return ids
+
+
+class TabLoadingTests(unittest.TestCase):
+    """
+    Lazy tab test case class.
+    """
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        TAB_CACHE.clear()
+
+    def test_initial_layout(self):
+        """
+        Check that the initial layout only holds the content of the default tab.
+        """
+        layout = self.client.get('/helsinki/_dash-layout').get_json()
+        ids = component_ids(layout)
+
+        self.assertIn(json.dumps('tab-content-real-estate'), ids)
+        self.assertIn(json.dumps('tab-1-group-1-toggle'), ids)
+        for toggle in ('tab-2-group-1-toggle', 'tab-3-group-1-toggle', 'tab-4-group-1-toggle',
+                       'tab-5-group-1-toggle', 'wind-year-select'):
+            self.assertNotIn(json.dumps(toggle), ids)
+
+    def test_load_tab(self):
+        """
+        Check that activating a tab returns its content once, and nothing when it is loaded.
+        """
+        dependency = next(
+            dependency for dependency in self.client.get('/helsinki/_dash-dependencies').get_json()
+            if {'id': 'tab-request', 'property': 'data'} in dependency['inputs']
+        )
+
+        def request(tab_id, loaded):
+            return self.client.post('/helsinki/_dash-update-component', json={
+                'output': dependency['output'],
+                'outputs': [{'id': 'tabs-loaded', 'property': 'data'}]
+                + [{'id': f"tab-content-{other}", 'property': 'children'} for other in TAB_CONTENTS],
+                'inputs': [{'id': 'tab-request', 'property': 'data', 'value': tab_id}],
+                'changedPropIds': ['tab-request.data'],
+                'state': [{'id': 'tabs-loaded', 'property': 'data', 'value': loaded}],
+            })
+
+        response = request('environment', [DEFAULT_TAB])
+        self.assertEqual(response.status_code, 200)
+        outputs = response.get_json()['response']
+
+        self.assertEqual(set(outputs), {'tabs-loaded', 'tab-content-environment'})
+        self.assertEqual(outputs['tabs-loaded']['data'], [DEFAULT_TAB, 'environment'])
+        self.assertIn(json.dumps('wind-year-select'), component_ids(outputs['tab-content-environment']['children']))
+
+        self.assertEqual(request('environment', [DEFAULT_TAB, 'environment']).status_code, 204)
+
+    def test_tab_cache(self):
+        """
+        Check that a tab is built once per version of the datasets it reads.
+        """
+        loaded, contents = load_tab('services', ['census'])
+        self.assertEqual(loaded, ['census', 'services'])
+        self.assertEqual(sum(content is not dash.no_update for content in contents), 1)
+
+        load_tab('services', ['census'])
+        self.assertEqual(TAB_CACHE.stats()['hits'], 1)
+
+        snapshot = current_snapshot()
+        self.addCleanup(swap_snapshot, snapshot)
+        load_tab('environment', ['census'])
+        datasets = dict(snapshot.versions.datasets, environment='changed')
+        swap_snapshot(dataclasses.replace(snapshot, versions=DataVersions(datasets)))
+
+        before = TAB_CACHE.stats()
+        load_tab('services', ['census'])
+        load_tab('environment', ['census'])
+        after = TAB_CACHE.stats()
+        self.assertEqual((after['hits'] - before['hits'], after['misses'] - before['misses']), (1, 1))
+
+    def test_initial_layout_size(self):
+        """
+        Compare the initial layout with every tab built against the one with only the default tab.
+        """
+        snapshot = current_snapshot()
+        sizes = {}
+        for lazy_tabs in (False, True):
+            layout = init_layout(snapshot, with_map=False, lazy_tabs=lazy_tabs)
+            sizes[lazy_tabs] = len(json.dumps(layout, cls=PlotlyJSONEncoder))
+
+        self.assertLess(sizes[True], sizes[False] / 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
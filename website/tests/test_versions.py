@@ -0,0 +1,70 @@
+"""
+Data version tests.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from website import create_app
+from website.dashmap.datasets.versions import load_versions
+
+
+class DataVersionTests(unittest.TestCase):
+    """
+    Data version stamp test case class.
+    """
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.files = {}
+        for name in ['a', 'b']:
+            self.files[name] = (os.path.join(self.data_dir, f"{name}.csv"),)
+            with open(self.files[name][0], 'w') as file:
+                file.write(f"{name}\n1\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_version_follows_content(self):
+        """
+        Check that only the version of the changed dataset and the combination change.
+        """
+        before = load_versions(self.files)
+        self.assertEqual(before, load_versions(self.files))
+
+        with open(self.files['b'][0], 'a') as file:
+            file.write("2\n")
+        after = load_versions(self.files)
+
+        self.assertEqual(before.key('a'), after.key('a'))
+        self.assertNotEqual(before.key('b'), after.key('b'))
+        self.assertNotEqual(before.combined, after.combined)
+
+    def test_http_validators(self):
+        """
+        Check that the dashboard layout carries an ETag with the data version and supports 304,
+        and that other responses only carry the data version.
+        """
+        app = create_app()
+        client = app.test_client()
+        version = app.config['DATA_VERSION']
+
+        response = client.get('/helsinki/_dash-layout')
+        self.assertEqual(response.headers['X-Data-Version'], version)
+        self.assertTrue(response.headers['ETag'].startswith(f'"{version}-'))
+
+        cached = client.get('/helsinki/_dash-layout', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.headers['ETag'], response.headers['ETag'])
+        self.assertEqual(cached.data, b'')
+
+        # Responses that do not come from the data alone are not tagged
+        dependencies = client.get('/helsinki/_dash-dependencies')
+        self.assertEqual(dependencies.headers['X-Data-Version'], version)
+        self.assertNotIn('ETag', dependencies.headers)
+
+        self.assertEqual(client.get('/helsinki/_data-version').get_json()['version'], version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Chunked weather ingestion tests.
+"""
+import os
+import runpy
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+import pandas as pd
+
+cleaner = runpy.run_path('website/data/environment/air-temperature-wind/data_cleaner.py', run_name='test')
+
+
+def write_raw_wind(path: str, n_rows: int, seed: int = 0) -> None:
+    """
+    Writes a raw FMI like wind file with samples spread over one year.
+    """
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp('2010-01-01') + pd.to_timedelta(rng.integers(0, 365 * 144, n_rows) * 10, unit='min')
+    pd.DataFrame({
+        'Year': days.year,
+        'm': days.month,
+        'd': days.day,
+        'Time': days.strftime('%H:%M'),
+        'Time zone': 'UTC',
+        'Air temperature (degC)': rng.normal(5, 10, n_rows).round(1),
+        'Wind direction (deg)': rng.integers(0, 360, n_rows),
+        'Wind speed (m/s)': rng.gamma(2, 2.5, n_rows).round(1),
+    }).to_csv(path, index=False)
+
+
+def peak_memory(function, *args) -> int:
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+class WeatherStreamTests(unittest.TestCase):
+    """
+    Streaming rollup test case class.
+    """
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_chunking_does_not_change_rollups(self):
+        """
+        Check that tiny chunks give the same rollups as a single chunk.
+        """
+        path = 'website/data/environment/air-temperature-wind/raw_wind.csv'
+        whole = cleaner['stream_wind'](path, 10 ** 6)
+        chunked = cleaner['stream_wind'](path, 997)
+
+        np.testing.assert_array_equal(whole.cube()[0], chunked.cube()[0])
+        for key, values in whole.arrays().items():
+            np.testing.assert_allclose(values, chunked.arrays()[key], err_msg=key)
+
+    def test_peak_memory_does_not_grow_with_input(self):
+        """
+        Check that a file ten times longer is streamed with about the same peak memory.
+        """
+        small, large = os.path.join(self.data_dir, 'small.csv'), os.path.join(self.data_dir, 'large.csv')
+        write_raw_wind(small, 40_000)
+        write_raw_wind(large, 400_000)
+
+        small_peak = peak_memory(cleaner['stream_wind'], small, 10_000)
+        large_peak = peak_memory(cleaner['stream_wind'], large, 10_000)
+
+        self.assertLess(large_peak, 1.5 * small_peak)
+        self.assertLess(large_peak, os.path.getsize(large) / 2)
+
+    def test_climatology_of_daily_means(self):
+        """
+        Check the climatology of three years that differ by a constant offset.
+        """
+        dates = pd.date_range('2019-01-01', '2021-12-31', freq='D')
+        offsets = dates.year.to_numpy() - 2020
+        means = dates.month.to_numpy() * 2.0 + offsets
+
+        climatology = cleaner['build_climatology'](
+            dates.year.to_numpy(), dates.month.to_numpy(), dates.day.to_numpy(), means, window=0
+        )
+
+        self.assertEqual(climatology['current_year'], 2021)
+        self.assertTrue(np.all(climatology['doy_p10'] <= climatology['doy_p50']))
+        self.assertTrue(np.all(climatology['doy_p50'] <= climatology['doy_p90']))
+        np.testing.assert_allclose(climatology['doy_anomaly'][:59], 1.0, atol=1e-5)
+        np.testing.assert_allclose(climatology['month_anomaly'], 1.0, atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()